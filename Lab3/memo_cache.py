@@ -0,0 +1,283 @@
+"""
+Универсальный декоратор мемоизации с вытеснением LRU, временем жизни
+записей (TTL) и статистикой попаданий
+
+Необязательный второй уровень - кэш на диске (SQLite): результаты
+переживают перезапуск и общие для параллельных процессов, а LRU в памяти
+процесса держит "горячие" записи перед диском.
+"""
+import functools
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+
+class CacheInfo(namedtuple('CacheInfo',
+                           'hits disk_hits misses evictions expirations maxsize currsize')):
+    """
+    Статистика кэша: попадания в памяти и на диске, промахи, вытеснения,
+    истёкшие записи, размер кэша в памяти
+    """
+
+    @property
+    def calls(self):
+        """Общее число вызовов функции"""
+        return self.hits + self.disk_hits + self.misses
+
+
+def _dumps(obj):
+    """Компактная двоичная сериализация ключей и значений (pickle)"""
+    return pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+class DiskCache:
+    """
+    Кэш мемоизации в файле SQLite.
+
+    Записи хранятся в таблице (namespace, key) -> value, ключи и значения
+    сериализуются pickle. Доступ из нескольких процессов согласуется
+    блокировками файла SQLite (журнал WAL: чтения не ждут записи), каждый
+    поток и процесс открывает собственное соединение.
+    """
+
+    def __init__(self, path, timeout=30.0):
+        """
+        Args:
+            path (str): Путь к файлу базы (создаётся при первом обращении)
+            timeout (float): Ожидание блокировки другим процессом, секунды
+        """
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self):
+        # Соединение SQLite нельзя использовать после fork - проверяем pid
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS memo ("
+                         "namespace TEXT NOT NULL, key BLOB NOT NULL, value BLOB NOT NULL, "
+                         "expires REAL, PRIMARY KEY (namespace, key)) WITHOUT ROWID")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def get(self, namespace, key):
+        """
+        Чтение значения; истёкшая запись удаляется из файла
+
+        Returns:
+            tuple: (найдено, значение, истекла ли запись)
+        """
+        conn = self._connection()
+        packed_key = _dumps(key)
+        row = conn.execute(
+            "SELECT value, expires FROM memo WHERE namespace = ? AND key = ?",
+            (namespace, packed_key)).fetchone()
+        if row is None:
+            return False, None, False
+        value, expires = row
+        if expires is not None and expires <= time.time():
+            conn.execute("DELETE FROM memo WHERE namespace = ? AND key = ? AND expires <= ?",
+                         (namespace, packed_key, time.time()))
+            return False, None, True
+        return True, pickle.loads(value), False
+
+    def set(self, namespace, key, value, ttl=None):
+        """Запись значения; ttl - время жизни в секундах (None - бессрочно)"""
+        expires = None if ttl is None else time.time() + ttl
+        self._connection().execute(
+            "INSERT OR REPLACE INTO memo (namespace, key, value, expires) VALUES (?, ?, ?, ?)",
+            (namespace, _dumps(key), _dumps(value), expires))
+
+    def count(self, namespace=None):
+        """Число записей (во всём файле или в пространстве имён)"""
+        if namespace is None:
+            return self._connection().execute("SELECT COUNT(*) FROM memo").fetchone()[0]
+        return self._connection().execute(
+            "SELECT COUNT(*) FROM memo WHERE namespace = ?", (namespace,)).fetchone()[0]
+
+    def purge_expired(self):
+        """Удаление всех истёкших записей; возвращает их число"""
+        return self._connection().execute(
+            "DELETE FROM memo WHERE expires IS NOT NULL AND expires <= ?",
+            (time.time(),)).rowcount
+
+    def clear(self, namespace=None):
+        """Удаление записей (всех или одного пространства имён)"""
+        if namespace is None:
+            self._connection().execute("DELETE FROM memo")
+        else:
+            self._connection().execute("DELETE FROM memo WHERE namespace = ?", (namespace,))
+
+    def close(self):
+        """Закрытие соединения текущего потока"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+def _make_key(args, kwargs, typed):
+    """Ключ кэша по аргументам; typed=True различает 1 и 1.0"""
+    key = args
+    if kwargs:
+        key += (object,) + tuple(sorted(kwargs.items()))
+    if typed:
+        key += tuple(type(arg) for arg in args)
+        if kwargs:
+            key += tuple(type(value) for _, value in sorted(kwargs.items()))
+    return key
+
+
+def _normalize_key(key):
+    """
+    Ключ для дискового кэша: равные числа 1, 1.0 и True дают один ключ
+    в памяти (равные хэши), но разный pickle - целые значения bool и float
+    приводятся к int (вложенные кортежи - рекурсивно)
+    """
+    if isinstance(key, tuple):
+        return tuple(_normalize_key(item) for item in key)
+    if isinstance(key, bool) or (isinstance(key, float) and key.is_integer()):
+        return int(key)
+    return key
+
+
+def memoize(maxsize=128, ttl=None, typed=False, key=None, disk=None, namespace=None,
+            bottom_up=False):
+    """
+    Декоратор мемоизации.
+
+    Args:
+        maxsize (int): Максимальное число записей; при переполнении вытесняется
+            давно не использованная (LRU). None - без ограничения,
+            0 - без кэширования (только подсчёт вызовов)
+        ttl (float): Время жизни записи в секундах (None - бессрочно)
+        typed (bool): Различать аргументы разных типов (1 и 1.0)
+        key (callable): Собственная функция ключа key(*args, **kwargs)
+        disk (str | DiskCache): Файл (или готовый DiskCache) второго уровня
+            кэша; ключи и значения должны сериализоваться pickle. Ключи
+            сравниваются по байтам pickle: при typed=False числа приводятся
+            к общему виду (1, 1.0 и True - одна запись), прочие равные, но
+            по-разному сериализуемые значения дают разные записи
+        namespace (str): Имя функции в дисковом кэше; по умолчанию
+            "модуль.имя", но модуль, запущенный как скрипт, называется
+            __main__ - для общего кэша скрипта и импорта задайте явно
+        bottom_up (bool): Для функции одного целого аргумента, рекурсия
+            которой обращается только к меньшим аргументам: при промахе
+            f(n) недостающие в кэше f(k), k < n, сначала вычисляются по
+            возрастанию, и рекурсивные вызовы попадают в кэш. Глубина
+            рекурсии не растёт с n, хотя обёртка - лишний кадр стека на
+            каждый уровень
+
+    Декорированная функция получает методы:
+        cache_info() - статистика CacheInfo (hits, disk_hits, misses,
+            evictions, expirations, maxsize, currsize, calls)
+        cache_clear() - очистка кэша в памяти и статистики
+            (записи на диске сохраняются: cache_disk.clear(cache_namespace))
+
+    Доступ к кэшу защищён блокировкой (RLock), сама функция вычисляется
+    вне блокировки: при одновременном промахе в двух потоках значение
+    может быть вычислено дважды, но рекурсивные функции не блокируются.
+    """
+    if maxsize is not None and maxsize < 0:
+        raise ValueError("maxsize должен быть неотрицательным или None")
+
+    disk_cache = DiskCache(disk) if isinstance(disk, str) else disk
+
+    def decorator(func):
+        cache = OrderedDict()  # ключ -> (значение, момент истечения или None)
+        lock = threading.RLock()
+        stats = {'hits': 0, 'disk_hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0}
+        disk_namespace = namespace if namespace is not None \
+            else f"{func.__module__}.{func.__qualname__}"
+
+        def make_key(*args, **kwargs):
+            return key(*args, **kwargs) if key is not None \
+                else _make_key(args, kwargs, typed)
+
+        def fill_below(n):
+            # Ближайшее вычисленное значение ниже n, от него - вверх до n - 1
+            k = n - 1
+            while k >= 0:
+                with lock:
+                    if make_key(k) in cache:
+                        break
+                k -= 1
+            for k in range(k + 1, n):
+                wrapper(k)
+
+        def remember(cache_key, value):
+            with lock:
+                expires_at = None if ttl is None else time.monotonic() + ttl
+                cache[cache_key] = (value, expires_at)
+                cache.move_to_end(cache_key)
+                if maxsize is not None:
+                    while len(cache) > maxsize:
+                        cache.popitem(last=False)
+                        stats['evictions'] += 1
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            cache_key = make_key(*args, **kwargs)
+
+            with lock:
+                entry = cache.get(cache_key)
+                if entry is not None:
+                    value, expires_at = entry
+                    if expires_at is None or time.monotonic() < expires_at:
+                        stats['hits'] += 1
+                        cache.move_to_end(cache_key)
+                        return value
+                    del cache[cache_key]
+                    stats['expirations'] += 1
+
+            if disk_cache is not None:
+                disk_key = cache_key if typed else _normalize_key(cache_key)
+                found, value, expired = disk_cache.get(disk_namespace, disk_key)
+                with lock:
+                    stats['expirations'] += expired
+                    if found:
+                        stats['disk_hits'] += 1
+                if found:
+                    if maxsize != 0:
+                        remember(cache_key, value)
+                    return value
+
+            if bottom_up and maxsize != 0 and not kwargs and len(args) == 1 \
+                    and type(args[0]) is int:
+                fill_below(args[0])
+
+            with lock:
+                stats['misses'] += 1
+
+            value = func(*args, **kwargs)
+            if maxsize != 0:
+                remember(cache_key, value)
+            if disk_cache is not None:
+                disk_cache.set(disk_namespace, disk_key, value, ttl)
+            return value
+
+        def cache_info():
+            with lock:
+                return CacheInfo(stats['hits'], stats['disk_hits'], stats['misses'],
+                                 stats['evictions'], stats['expirations'], maxsize, len(cache))
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+                for name in stats:
+                    stats[name] = 0
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        wrapper.cache_disk = disk_cache
+        wrapper.cache_namespace = disk_namespace
+        return wrapper
+
+    return decorator
\ No newline at end of file
@@ -1,63 +1,161 @@
 """
 Оптимизация рекурсивных алгоритмов с помощью мемоизации
 """
+import bisect
+import os
 import time
+import tracemalloc
 from recursion import fibonacci_naive
+from memo_cache import memoize
 
-# Глобальная переменная для подсчета вызовов
-call_count = {
-    'naive': 0,
-    'memo': 0
-}
+# Файл дискового кэша мемоизации: общий для всех запусков и процессов
+MEMO_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'memo_cache.sqlite')
 
-def fibonacci_memoized(n, memo=None):
+
+@memoize(maxsize=None, bottom_up=True)
+def fibonacci_memoized(n):
     """
     Вычисление n-го числа Фибоначчи с мемоизацией.
 
+    Кэш и счётчики вызовов ведёт декоратор memoize:
+    fibonacci_memoized.cache_info().calls - число вызовов,
+    fibonacci_memoized.cache_clear() - сброс кэша и статистики.
+
     Args:
         n (int): Порядковый номер числа Фибоначчи
-        memo (dict): Словарь для хранения вычисленных значений
 
     Returns:
         int: n-е число Фибоначчи
 
     Временная сложность: O(n)
-    Глубина рекурсии: O(n)
+    Глубина рекурсии: O(1) - при промахе декоратор (bottom_up=True) сначала
+    вычисляет недостающие F(k), k < n, по возрастанию, и оба рекурсивных
+    вызова попадают в кэш. Без этого обёртка memoize удваивала бы число
+    кадров на уровень, и предел n был бы около sys.getrecursionlimit() / 2.
+    Кэш хранит все F(k) - O(n^2) бит; для очень больших n -
+    fibonacci_iterative
     """
-    global call_count
-    call_count['memo'] += 1
-
-    # Инициализация словаря мемоизации при первом вызове
-    if memo is None:
-        memo = {}
-
     # Базовые случаи
     if n == 0:
         return 0
     if n == 1:
         return 1
 
-    # Проверяем, не вычисляли ли мы уже это значение
-    if n in memo:
-        return memo[n]
+    # Рекурсивный шаг, результаты сохраняет декоратор
+    return fibonacci_memoized(n - 1) + fibonacci_memoized(n - 2)
+
+
+def fibonacci_memoized_fresh(n):
+    """
+    F(n) с пустого кэша - для замеров полного вычисления с мемоизацией.
+    """
+    fibonacci_memoized.cache_clear()
+    return fibonacci_memoized(n)
+
+
+def fibonacci_iterative(n):
+    """
+    Вычисление n-го числа Фибоначчи снизу вверх с окном из двух значений.
+
+    Args:
+        n (int): Порядковый номер числа Фибоначчи
+
+    Returns:
+        int: n-е число Фибоначчи
 
-    # Рекурсивный шаг с сохранением результата
-    memo[n] = fibonacci_memoized(n - 1, memo) + fibonacci_memoized(n - 2, memo)
-    return memo[n]
+    Временная сложность: O(n) сложений
+    Память: O(1) чисел - хранятся только F(k) и F(k+1)
+    Глубина рекурсии: нет
+    """
+    if n < 0:
+        raise ValueError("n должно быть неотрицательным")
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+
+class FibonacciCheckpointCache:
+    """
+    Кэш чисел Фибоначчи с контрольными точками.
+
+    Хранит пары (F(k), F(k+1)) только для k, кратных step. Запрос F(n)
+    продолжает вычисление от ближайшей точки k <= n (не более step шагов
+    для уже пройденного диапазона) и добавляет новые точки по пути.
+
+    Память: O(n / step) пар вместо O(n) значений в словаре fibonacci_memoized
+    """
+
+    def __init__(self, step=1000):
+        if step < 1:
+            raise ValueError("step должен быть положительным")
+        self.step = step
+        self._indices = [0]          # отсортированные k контрольных точек
+        self._pairs = {0: (0, 1)}    # k -> (F(k), F(k+1))
+
+    def __len__(self):
+        return len(self._indices)
+
+    def get(self, n):
+        """
+        F(n) с продолжением от ближайшей контрольной точки.
+
+        Временная сложность: O(step) для n внутри пройденного диапазона,
+        O(n - max_k) при расширении
+        """
+        if n < 0:
+            raise ValueError("n должно быть неотрицательным")
+        k = self._indices[bisect.bisect_right(self._indices, n) - 1]
+        a, b = self._pairs[k]
+        while k < n:
+            a, b = b, a + b
+            k += 1
+            if k % self.step == 0 and k not in self._pairs:
+                self._pairs[k] = (a, b)
+                self._indices.append(k)  # k больше всех сохранённых точек
+        return a
+
+
+@memoize(maxsize=1024, disk=MEMO_DB_PATH, namespace='memoization.fibonacci_persistent')
+def fibonacci_persistent(n):
+    """
+    F(n) с мемоизацией в памяти (LRU на 1024 записи) и на диске (SQLite).
+
+    Вычисленные значения сохраняются в MEMO_DB_PATH и переживают
+    перезапуск: повторный запуск и параллельные процессы берут F(n) с
+    диска (fibonacci_persistent.cache_info().disk_hits) без рекурсии.
+
+    Args:
+        n (int): Порядковый номер числа Фибоначчи
+
+    Returns:
+        int: n-е число Фибоначчи
 
+    Временная сложность: O(n) при первом вычислении, O(1) обращений к диску после
+    Глубина рекурсии: O(n) при первом вычислении
+    """
+    if n == 0:
+        return 0
+    if n == 1:
+        return 1
+    return fibonacci_persistent(n - 1) + fibonacci_persistent(n - 2)
+
+
+@memoize(maxsize=0)
 def fibonacci_naive_counted(n):
     """
     Наивная версия Фибоначчи с подсчетом вызовов.
-    """
-    global call_count
-    call_count['naive'] += 1
 
+    maxsize=0: декоратор ничего не кэширует, только считает вызовы
+    (fibonacci_naive_counted.cache_info().calls).
+    """
     if n == 0:
         return 0
     if n == 1:
         return 1
     return fibonacci_naive_counted(n - 1) + fibonacci_naive_counted(n - 2)
 
+
 def measure_time(func, *args, repetitions=1):
     """
     Точное измерение времени выполнения функции.
@@ -85,6 +183,24 @@ def measure_time(func, *args, repetitions=1):
         end_time = time.perf_counter()
         return end_time - start_time, result
 
+
+def measure_peak_memory(func, *args):
+    """
+    Пиковый объем памяти, выделенной во время вызова функции (tracemalloc).
+
+    Returns:
+        tuple: (пик в байтах, результат функции)
+    """
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        result = func(*args)
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+    return peak, result
+
+
 def compare_fibonacci_performance(n=35):
     """
     Сравнение производительности наивной и мемоизированной версий.
@@ -92,25 +208,20 @@ def compare_fibonacci_performance(n=35):
     Args:
         n (int): Число для вычисления
     """
-    global call_count
-
     print(f"\nСравнение производительности для n={n}")
     print("=" * 60)
 
-    # Сбрасываем счетчики
-    call_count = {'naive': 0, 'memo': 0}
-
-    # Мемоизированная версия - однократное выполнение
-    time_memo, result_memo = measure_time(fibonacci_memoized, n)
-    memo_calls = call_count['memo']
+    # Мемоизированная версия - однократное выполнение с пустого кэша
+    time_memo, result_memo = measure_time(fibonacci_memoized_fresh, n)
+    memo_calls = fibonacci_memoized.cache_info().calls
 
     # Сбрасываем счетчик для наивной версии
-    call_count['naive'] = 0
+    fibonacci_naive_counted.cache_clear()
 
     # Для маленьких n измеряем напрямую, для больших - используем приближение
     if n <= 30:
         time_naive, result_naive = measure_time(fibonacci_naive_counted, n)
-        naive_calls = call_count['naive']
+        naive_calls = fibonacci_naive_counted.cache_info().calls
     else:
         # Для больших n используем экстраполяцию или ограничиваем измерения
         if n > 35:
@@ -121,7 +232,7 @@ def compare_fibonacci_performance(n=35):
             result_naive = result_memo  # Результаты должны совпадать
         else:
             time_naive, result_naive = measure_time(fibonacci_naive_counted, n)
-            naive_calls = call_count['naive']
+            naive_calls = fibonacci_naive_counted.cache_info().calls
 
     print(f"Результат: {result_memo}")
     print(f"Количество вызовов:")
@@ -142,18 +253,17 @@ def compare_fibonacci_performance(n=35):
     # Дополнительная проверка для маленьких n с многократными выполнениями
     if n <= 25:
         print(f"\nТочные измерения (усреднение по 100 выполнениям):")
-        time_memo_avg = measure_time(fibonacci_memoized, n, repetitions=100)
+        time_memo_avg = measure_time(fibonacci_memoized_fresh, n, repetitions=100)
         time_naive_avg = measure_time(fibonacci_naive_counted, n, repetitions=100)
         print(f"  - Наивная версия (100 повторов): {time_naive_avg:.6f} сек")
         print(f"  - Мемоизированная версия (100 повторов): {time_memo_avg:.6f} сек")
         print(f"  - Ускорение: {time_naive_avg/time_memo_avg:.2f}x")
 
+
 def analyze_memoization_benefits():
     """
     Анализ преимуществ мемоизации для разных размеров задач.
     """
-    global call_count
-
     print("\n" + "="*70)
     print("АНАЛИЗ ЭФФЕКТИВНОСТИ МЕМОИЗАЦИИ")
     print("="*70)
@@ -162,17 +272,15 @@ def analyze_memoization_benefits():
     test_values = [5, 10, 15, 20, 25, 30, 35]
 
     for n in test_values:
-        call_count = {'naive': 0, 'memo': 0}
-
         # Вычисляем с мемоизацией
-        result_memo = fibonacci_memoized(n)
-        memo_calls = call_count['memo']
+        result_memo = fibonacci_memoized_fresh(n)
+        memo_calls = fibonacci_memoized.cache_info().calls
 
         # Теоретическое количество вызовов для наивной версии
-        call_count['naive'] = 0
+        fibonacci_naive_counted.cache_clear()
         if n <= 25:
             fibonacci_naive_counted(n)
-            naive_calls = call_count['naive']
+            naive_calls = fibonacci_naive_counted.cache_info().calls
         else:
             # Аппроксимация для больших n
             naive_calls = int(2 ** (n / 2) * 1.5)  # Приблизительная оценка
@@ -180,27 +288,40 @@ def analyze_memoization_benefits():
         print(f"n={n:2d}: Вызовы {naive_calls:>8,} → {memo_calls:>4} "
               f"(сокращение в {naive_calls/memo_calls:6.1f} раз)")
 
+
 def demo_small_n_measurements():
     """
     Демонстрация для очень маленьких n с точным временем.
     """
-    global call_count
-
     print(f"\n{'='*50}")
     print("ТОЧНЫЕ ИЗМЕРЕНИЯ ДЛЯ МАЛЕНЬКИХ n")
     print(f"{'='*50}")
 
     for n in [5, 10, 15]:
-        call_count = {'naive': 0, 'memo': 0}
-
         # Измеряем с многократными выполнениями для точности
         time_naive = measure_time(fibonacci_naive_counted, n, repetitions=1000)
-        call_count['naive'] = 0  # Сбрасываем для мемоизации
-        time_memo = measure_time(fibonacci_memoized, n, repetitions=1000)
+        time_memo = measure_time(fibonacci_memoized_fresh, n, repetitions=1000)
 
         print(f"n={n}: Наивная {time_naive:.6f}с, Мемоизация {time_memo:.6f}с, "
               f"Ускорение {time_naive/time_memo:.1f}x")
 
+
+def demo_persistent_cache(n=300):
+    """
+    Дисковый кэш: вычисление F(n) и повторное обращение с пустой памятью
+    процесса (как при новом запуске скрипта).
+    """
+    print(f"\nДисковый кэш мемоизации ({MEMO_DB_PATH}):")
+    for attempt in ("первое обращение", "повтор с пустой памятью"):
+        fibonacci_persistent.cache_clear()
+        elapsed, result = measure_time(fibonacci_persistent, n)
+        info = fibonacci_persistent.cache_info()
+        print(f"  {attempt}: F({n}) за {elapsed:.6f}с, вычислений {info.misses}, "
+              f"с диска {info.disk_hits}, из памяти {info.hits}")
+    print(f"  записей на диске: "
+          f"{fibonacci_persistent.cache_disk.count(fibonacci_persistent.cache_namespace)}")
+
+
 if __name__ == "__main__":
     # Анализ эффективности
     analyze_memoization_benefits()
@@ -212,4 +333,7 @@ if __name__ == "__main__":
     compare_fibonacci_performance(35)
 
     # Демонстрация для очень маленьких n с точным временем
-    demo_small_n_measurements()
\ No newline at end of file
+    demo_small_n_measurements()
+
+    # Результаты, сохранённые предыдущими запусками
+    demo_persistent_cache()
\ No newline at end of file
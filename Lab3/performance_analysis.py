@@ -1,12 +1,27 @@
 """
 Экспериментальное исследование производительности рекурсивных алгоритмов
 """
+import math
+import random
 import time
 import matplotlib.pyplot as plt
 import sys
 import platform
 
-from memoization import fibonacci_memoized, fibonacci_naive_counted, measure_time, call_count
+from memoization import (fibonacci_memoized, fibonacci_memoized_fresh, fibonacci_naive_counted,
+                         fibonacci_iterative, FibonacciCheckpointCache, measure_time,
+                         measure_peak_memory)
+from recursion import (fibonacci_fast_doubling, fibonacci_matrix, factorial,
+                       factorial_product_tree, factorial_prime_swing, factorial_mod, factorials,
+                       power, linear_recurrence)
+from recursion_tasks import binary_search_recursive, hanoi_moves, hanoi_move_chunks
+from trampoline import (binary_search_trampolined, factorial_trampolined,
+                        fibonacci_trampolined, hanoi_trampolined)
+
+
+# Наибольшее n для запуска мемоизированного Фибоначчи в демонстрациях:
+# кэш хранит все F(k), при n = 10^5 это сотни МиБ
+MEMO_MAX_N = 10 ** 4
 
 
 def measure_fibonacci_performance():
@@ -23,7 +38,7 @@ def measure_fibonacci_performance():
 
     for n in n_values:
         # Мемоизированная версия - всегда измеряем
-        time_memo, result_memo = measure_time(fibonacci_memoized, n)
+        time_memo, result_memo = measure_time(fibonacci_memoized_fresh, n)
         memo_times.append(time_memo)
 
         # Наивная версия - только для небольших n
@@ -69,6 +84,274 @@ def measure_fibonacci_performance():
     return n_values, naive_times, memo_times
 
 
+def measure_fast_fibonacci_performance(max_n=10**7, mod=10**9 + 7):
+    """
+    Сравнение всех версий Фибоначчи для n = 10, 100, ..., max_n.
+
+    Наивная версия измеряется до n=25, мемоизированная - до n=500,
+    O(log n) версии - на всём диапазоне, в том числе по модулю mod.
+    """
+    print("\n" + "="*80)
+    print("ФИБОНАЧЧИ ЗА O(log n): БЫСТРОЕ УДВОЕНИЕ И МАТРИЧНАЯ СТЕПЕНЬ")
+    print("="*80)
+
+    n_values = [n for n in (10, 25, 100, 500, 10**3, 10**4, 10**5, 10**6, 10**7) if n <= max_n]
+    versions = [
+        ('Наивная', fibonacci_naive_counted, 25),
+        ('Мемоизация', fibonacci_memoized_fresh, 500),
+        ('Быстрое удвоение', fibonacci_fast_doubling, max_n),
+        ('Матрица', fibonacci_matrix, max_n),
+        (f'Удвоение mod {mod}', lambda n: fibonacci_fast_doubling(n, mod), max_n),
+        (f'Матрица mod {mod}', lambda n: fibonacci_matrix(n, mod), max_n),
+    ]
+    times = {name: [] for name, _, _ in versions}
+
+    print("n".ljust(10) + "".join(f"{name:>24}" for name, _, _ in versions))
+    print("-" * (10 + 24 * len(versions)))
+    for n in n_values:
+        print(f"{n:<10}", end="", flush=True)
+        for name, func, limit in versions:
+            if n > limit:
+                print(f"{'-':>24}", end="", flush=True)
+                continue
+            elapsed, _ = measure_time(func, n)
+            times[name].append((n, elapsed))
+            print(f"{elapsed:>24.6f}", end="", flush=True)
+        print()
+
+    plt.figure(figsize=(10, 6))
+    for name, points in times.items():
+        plt.loglog([n for n, _ in points], [max(t, 1e-9) for _, t in points],
+                   'o-', label=name, linewidth=2, markersize=5)
+    plt.xlabel('n (номер числа Фибоначчи)')
+    plt.ylabel('Время выполнения (секунды)')
+    plt.title('Время вычисления F(n) разными методами')
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+    plt.tight_layout()
+    plt.savefig('fibonacci_fast_methods.png', dpi=300, bbox_inches='tight')
+    plt.show()
+
+    return times
+
+
+def measure_factorial_performance(max_n=10**6, mod=10**9 + 7):
+    """
+    Сравнение версий факториала для n = 100, 1000, ..., max_n.
+
+    Рекурсивная версия измеряется до n=500 (ограничение глубины рекурсии),
+    цикл с накопителем - до n=10^5 (квадратичное время), дерево
+    произведений, prime swing и math.factorial - на всём диапазоне.
+    Пакет - factorials для десяти значений n/10, 2n/10, ..., n за один проход.
+    """
+    print("\n" + "="*80)
+    print("ФАКТОРИАЛ: ДВОИЧНОЕ РАЗБИЕНИЕ И PRIME SWING")
+    print("="*80)
+
+    def factorial_loop(n):
+        # Умножение растущего накопителя на малые числа
+        result = 1
+        for k in range(2, n + 1):
+            result *= k
+        return result
+
+    n_values = [n for n in (100, 500, 10**3, 10**4, 10**5, 10**6) if n <= max_n]
+    versions = [
+        ('Рекурсия', factorial, 500),
+        ('Цикл', factorial_loop, 10**5),
+        ('Дерево произведений', factorial_product_tree, max_n),
+        ('Prime swing', factorial_prime_swing, max_n),
+        ('math.factorial', math.factorial, max_n),
+        ('Пакет из 10', lambda n: factorials(range(n // 10, n + 1, max(1, n // 10))), max_n),
+        (f'mod {mod}', lambda n: factorial_mod(n, mod), max_n),
+    ]
+    times = {name: [] for name, _, _ in versions}
+
+    print("n".ljust(10) + "".join(f"{name:>22}" for name, _, _ in versions))
+    print("-" * (10 + 22 * len(versions)))
+    for n in n_values:
+        print(f"{n:<10}", end="", flush=True)
+        for name, func, limit in versions:
+            if n > limit:
+                print(f"{'-':>22}", end="", flush=True)
+                continue
+            elapsed, _ = measure_time(func, n)
+            times[name].append((n, elapsed))
+            print(f"{elapsed:>22.6f}", end="", flush=True)
+        print()
+
+    plt.figure(figsize=(10, 6))
+    for name, points in times.items():
+        plt.loglog([n for n, _ in points], [max(t, 1e-9) for _, t in points],
+                   'o-', label=name, linewidth=2, markersize=5)
+    plt.xlabel('n')
+    plt.ylabel('Время выполнения (секунды)')
+    plt.title('Время вычисления n! разными методами')
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+    plt.tight_layout()
+    plt.savefig('factorial_methods.png', dpi=300, bbox_inches='tight')
+    plt.show()
+
+    return times
+
+
+def measure_power_performance(batch=1000, seed=0):
+    """
+    Сравнение итеративного power со встроенной pow.
+
+    Модульное возведение: показатели 64...4096 бит по 2048-битному
+    модулю. Длинные степени: 3^n для n = 10^3...10^6. Пакет: n-е члены
+    batch рекуррентностей второго порядка по модулю - одно возведение
+    пакета матриц NumPy против batch отдельных вызовов.
+    """
+    print("\n" + "="*80)
+    print("ДВОИЧНОЕ ВОЗВЕДЕНИЕ В СТЕПЕНЬ: power ПРОТИВ ВСТРОЕННОЙ pow")
+    print("="*80)
+
+    rng = random.Random(seed)
+    modulus = rng.getrandbits(2048) | 1
+    base = rng.getrandbits(2048) % modulus
+
+    print(f"{'Бит в показателе':<20}{'power mod':>16}{'pow mod':>16}{'Отношение':>12}")
+    modular_times = []
+    for bits in (64, 256, 1024, 4096):
+        exponent = rng.getrandbits(bits) | (1 << (bits - 1))
+        time_power, result_power = measure_time(power, base, exponent, modulus)
+        time_pow, result_pow = measure_time(pow, base, exponent, modulus)
+        assert result_power == result_pow
+        modular_times.append((bits, time_power, time_pow))
+        print(f"{bits:<20}{time_power:>16.6f}{time_pow:>16.6f}{time_power / time_pow:>11.1f}x")
+
+    print(f"\n{'n в 3^n':<20}{'power':>16}{'pow':>16}{'Отношение':>12}")
+    bigint_times = []
+    for n in (10**3, 10**4, 10**5, 10**6):
+        time_power, result_power = measure_time(power, 3, n)
+        time_pow, result_pow = measure_time(pow, 3, n)
+        assert result_power == result_pow
+        bigint_times.append((n, time_power, time_pow))
+        print(f"{n:<20}{time_power:>16.6f}{time_pow:>16.6f}{time_power / time_pow:>11.1f}x")
+
+    mod = 10**9 + 7
+    n = 10**6
+    coeffs = [[rng.randrange(mod), rng.randrange(mod)] for _ in range(batch)]
+    initial = [[rng.randrange(mod), rng.randrange(mod)] for _ in range(batch)]
+
+    def one_by_one():
+        return [linear_recurrence(c, a, n, mod) for c, a in zip(coeffs, initial)]
+
+    time_batch, result_batch = measure_time(linear_recurrence, coeffs, initial, n, mod)
+    time_single, result_single = measure_time(one_by_one)
+    assert result_batch == result_single
+    print(f"\n{batch} рекуррентностей, член n={n} по модулю {mod}:")
+    print(f"  пакет матриц NumPy: {time_batch:.6f}с, по одной: {time_single:.6f}с, "
+          f"ускорение {time_single / time_batch:.1f}x")
+
+    return modular_times, bigint_times, (time_batch, time_single)
+
+
+def measure_hanoi_throughput(n_values=(10, 15, 20, 25), generator_limit=22):
+    """
+    Пропускная способность генераторов ходов Ханойских башен (ходов в секунду).
+
+    hanoi_moves (по одному кортежу) измеряется до n=generator_limit,
+    hanoi_move_chunks (блоки NumPy) - для всех n, включая n=25 (~33,5 млн ходов).
+    Вывод ходов на экран не измеряется.
+    """
+    print("\n" + "="*80)
+    print("ХАНОЙСКИЕ БАШНИ: ПРОПУСКНАЯ СПОСОБНОСТЬ ГЕНЕРАТОРОВ ХОДОВ")
+    print("="*80)
+
+    def consume_moves(n):
+        count = 0
+        for _ in hanoi_moves(n):
+            count += 1
+        return count
+
+    def consume_chunks(n):
+        return sum(len(chunk) for chunk in hanoi_move_chunks(n))
+
+    print(f"{'n':<6}{'Ходов':>12}{'hanoi_moves, ходов/с':>26}{'блоки NumPy, ходов/с':>26}")
+    throughput = {}
+    for n in n_values:
+        moves = (1 << n) - 1
+        row = {}
+        if n <= generator_limit:
+            elapsed, count = measure_time(consume_moves, n)
+            assert count == moves
+            row['moves'] = moves / elapsed
+        elapsed, count = measure_time(consume_chunks, n)
+        assert count == moves
+        row['chunks'] = moves / elapsed
+        throughput[n] = row
+        generator_rate = f"{row['moves']:,.0f}" if 'moves' in row else '-'
+        print(f"{n:<6}{moves:>12}{generator_rate:>26}{row['chunks']:>26,.0f}")
+
+    return throughput
+
+
+def measure_trampoline_overhead(searches=10**4, seed=0):
+    """
+    Накладные расходы трамплина (trampoline.py) против обычной рекурсии.
+
+    Сравнение на входах, допустимых для обычной рекурсии, затем
+    трамплинные версии на глубинах, где обычная рекурсия падает с
+    RecursionError.
+    """
+    print("\n" + "="*80)
+    print("ТРАМПЛИН ПРОТИВ ОБЫЧНОЙ РЕКУРСИИ")
+    print("="*80)
+
+    rng = random.Random(seed)
+    arr = sorted(rng.sample(range(10**6), 10**5))
+    targets = [rng.randrange(10**6) for _ in range(searches)]
+
+    def search_all(search):
+        return [search(arr, target) for target in targets]
+
+    def fibonacci_trampolined_fresh(n):
+        fibonacci_trampolined.cache_clear()
+        return fibonacci_trampolined(n)
+
+    def hanoi_recursive(n, source='A', target='C', auxiliary='B', moves=None):
+        # Классическая рекурсия, ходы - в список (как hanoi_trampolined)
+        if moves is None:
+            moves = []
+        if n > 0:
+            hanoi_recursive(n - 1, source, auxiliary, target, moves)
+            moves.append((n, source, target))
+            hanoi_recursive(n - 1, auxiliary, target, source, moves)
+        return moves
+
+    cases = [
+        (f'Бинарный поиск x{searches}', lambda: search_all(binary_search_recursive),
+         lambda: search_all(binary_search_trampolined)),
+        ('Факториал 500', lambda: factorial(500), lambda: factorial_trampolined(500)),
+        ('Фибоначчи (memo) 500', lambda: fibonacci_memoized_fresh(500),
+         lambda: fibonacci_trampolined_fresh(500)),
+        ('Ханой 15', lambda: hanoi_recursive(15), lambda: hanoi_trampolined(15)),
+    ]
+
+    print(f"{'Задача':<28}{'Рекурсия':>14}{'Трамплин':>14}{'Отношение':>12}")
+    overhead = {}
+    for name, native, trampolined in cases:
+        time_native, result_native = measure_time(native)
+        time_trampolined, result_trampolined = measure_time(trampolined)
+        assert result_native == result_trampolined
+        overhead[name] = time_trampolined / time_native
+        print(f"{name:<28}{time_native:>14.6f}{time_trampolined:>14.6f}"
+              f"{overhead[name]:>11.1f}x")
+
+    print("\nГлубины вне лимита рекурсии "
+          f"({sys.getrecursionlimit()}), только трамплин:")
+    for name, func, n in [('Факториал', factorial_trampolined, 5 * 10**4),
+                          ('Фибоначчи (memo)', fibonacci_trampolined_fresh, 2 * 10**4)]:
+        elapsed, _ = measure_time(func, n)
+        print(f"  {name} n={n}: {elapsed:.6f}с")
+
+    return overhead
+
+
 def analyze_recursion_depth():
     """
     Анализ глубины рекурсии и использования стека.
@@ -77,23 +360,69 @@ def analyze_recursion_depth():
     print("АНАЛИЗ ГЛУБИНЫ РЕКУРСИИ")
     print("="*50)
 
-    original_limit = sys.getrecursionlimit()
-    print(f"Текущий лимит глубины рекурсии: {original_limit}")
+    print(f"Текущий лимит глубины рекурсии: {sys.getrecursionlimit()}")
+    print("Мемоизация заполняет кэш снизу вверх (memoize(bottom_up=True)): "
+          "глубина рекурсии не зависит от n")
 
-    # Тестируем максимальную глубину для мемоизированной версии
-    test_values = [100, 500, 1000, 2000]
+    # Лимит рекурсии не меняется: его увеличение может обрушить интерпретатор
+    # переполнением стека C. Для больших n используются итеративная версия
+    # и трамплин (fibonacci_trampolined), стек которого хранится в куче.
+    test_values = [100, 500, 1000, 2000, 100000]
 
     for n in test_values:
-        try:
-            # Временно увеличиваем лимит рекурсии
-            sys.setrecursionlimit(n + 100)
-            result = fibonacci_memoized(n)
-            print(f"n={n:4d}: Успешно вычислено (результат: {result})")
-        except RecursionError:
-            print(f"n={n:4d}: Достигнут лимит рекурсии")
-        finally:
-            # Восстанавливаем оригинальный лимит
-            sys.setrecursionlimit(original_limit)
+        if n > MEMO_MAX_N:
+            memo_status = "не запускается (кэш всех F(k) - O(n^2) бит)"
+        else:
+            try:
+                fibonacci_memoized_fresh(n)
+                memo_status = "успешно"
+            except RecursionError:
+                memo_status = "достигнут лимит рекурсии"
+        result = fibonacci_iterative(n)
+        assert fibonacci_trampolined(n) == result
+        print(f"n={n:6d}: мемоизация - {memo_status}; "
+              f"итеративная версия и трамплин - {result.bit_length()} бит")
+
+
+def measure_fibonacci_memory(n_values=None, checkpoint_step=1000):
+    """
+    Пиковая память (tracemalloc) мемоизированной и итеративных версий.
+
+    Мемоизированная версия запускается до n = MEMO_MAX_N; для больших n
+    выводится нижняя оценка её пика - суммарный размер значений F(2..n),
+    которые одновременно хранит кэш.
+    """
+    if n_values is None:
+        n_values = [500, 900, 10**4, 10**5]
+
+    print("\n" + "="*80)
+    print("ПИКОВАЯ ПАМЯТЬ ВЫЧИСЛЕНИЯ F(n), КиБ")
+    print("="*80)
+    print(f"{'n':>8}{'Мемоизация':>20}{'Окно из 2':>14}{'Контр. точки':>16}{'Точек':>8}")
+    print("-" * 66)
+
+    results = []
+    for n in n_values:
+        if n <= MEMO_MAX_N:
+            memo_peak, _ = measure_peak_memory(fibonacci_memoized_fresh, n)
+            memo_text = f"{memo_peak / 1024:.1f}"
+        else:
+            a, b, memo_peak = 0, 1, 0
+            for k in range(n):
+                a, b = b, a + b
+                if k >= 1:
+                    memo_peak += sys.getsizeof(a)
+            memo_text = f">= {memo_peak / 1024:.1f}"
+
+        window_peak, _ = measure_peak_memory(fibonacci_iterative, n)
+        cache = FibonacciCheckpointCache(checkpoint_step)
+        cache_peak, _ = measure_peak_memory(cache.get, n)
+
+        print(f"{n:>8}{memo_text:>20}{window_peak / 1024:>14.1f}"
+              f"{cache_peak / 1024:>16.1f}{len(cache):>8}")
+        results.append((n, memo_peak, window_peak, cache_peak))
+
+    return results
 
 
 def demonstrate_memoization_workings():
@@ -104,24 +433,25 @@ def demonstrate_memoization_workings():
     print("ДЕМОНСТРАЦИЯ РАБОТЫ МЕМОИЗАЦИИ")
     print("="*60)
 
-    # Сбрасываем счетчик
-    global call_count
-    call_count['memo'] = 0
+    # Сбрасываем кэш и счетчики
+    fibonacci_memoized.cache_clear()
 
     print("Вычисление F(10) с мемоизацией:")
     result = fibonacci_memoized(10)
+    info = fibonacci_memoized.cache_info()
     print(f"Результат: {result}")
-    print(f"Количество рекурсивных вызовов: {call_count['memo']}")
+    print(f"Количество рекурсивных вызовов: {info.calls} "
+          f"(промахов: {info.misses}, попаданий в кэш: {info.hits})")
     print(f"Ожидаемое количество вызовов без мемоизации: ~{2**10}")
 
     # Показываем, что повторное вычисление происходит мгновенно
     print("\nПовторное вычисление F(10):")
-    call_count['memo'] = 0
+    calls_before = fibonacci_memoized.cache_info().calls
     start_time = time.perf_counter()
     result2 = fibonacci_memoized(10)
     end_time = time.perf_counter()
     print(f"Время: {(end_time - start_time):.8f} секунд")
-    print(f"Количество вызовов: {call_count['memo']}")
+    print(f"Количество вызовов: {fibonacci_memoized.cache_info().calls - calls_before}")
 
 
 def print_system_info():
@@ -156,6 +486,9 @@ def run_comprehensive_analysis():
     # Анализ глубины рекурсии
     analyze_recursion_depth()
 
+    # Пиковая память: словарь memo против окна и контрольных точек
+    measure_fibonacci_memory()
+
     # Основные замеры производительности
     print("\n" + "="*50)
     print("ИЗМЕРЕНИЕ ПРОИЗВОДИТЕЛЬНОСТИ ФИБОНАЧЧИ")
@@ -163,6 +496,21 @@ def run_comprehensive_analysis():
 
     n_values, naive_times, memo_times = measure_fibonacci_performance()
 
+    # O(log n) версии вплоть до n = 10^7
+    measure_fast_fibonacci_performance()
+
+    # Итеративное возведение в степень против встроенной pow
+    measure_power_performance()
+
+    # Ходы Ханойских башен без рекурсии и вывода
+    measure_hanoi_throughput()
+
+    # Цена трамплина против обычной рекурсии
+    measure_trampoline_overhead()
+
+    # Факториал без ограничения глубины рекурсии вплоть до n = 10^6
+    measure_factorial_performance()
+
     # Вывод итоговой таблицы
     print("\n" + "="*70)
     print("ИТОГОВАЯ ТАБЛИЦА ПРОИЗВОДИТЕЛЬНОСТИ")
@@ -178,4 +526,4 @@ def run_comprehensive_analysis():
 
 if __name__ == "__main__":
     measure_fibonacci_performance()
-    run_comprehensive_analysis()
+    run_comprehensive_analysis()
\ No newline at end of file
@@ -1,6 +1,11 @@
 """
 Базовые рекурсивные алгоритмы
 """
+import functools
+import operator
+
+import numpy as np
+
 
 def factorial(n):
     """
@@ -22,6 +27,196 @@ def factorial(n):
     return n * factorial(n - 1)
 
 
+def _product_tree(values):
+    """
+    Произведение чисел попарным деревом (итеративно).
+
+    Соседние множители перемножаются попарно, затем попарно перемножаются
+    результаты и т.д.: на каждом уровне сомножители примерно равны по
+    размеру, и длинная арифметика (Карацуба) работает эффективно, в
+    отличие от умножения огромного накопителя на малые числа.
+
+    Args:
+        values (iterable): Целые множители
+
+    Returns:
+        int: Произведение (1 для пустого набора)
+    """
+    values = list(values)
+    if not values:
+        return 1
+    while len(values) > 1:
+        paired = [values[i] * values[i + 1] for i in range(0, len(values) - 1, 2)]
+        if len(values) % 2:
+            paired.append(values[-1])
+        values = paired
+    return values[0]
+
+
+def factorial_product_tree(n):
+    """
+    Вычисление факториала двоичным разбиением (дерево произведений).
+
+    Args:
+        n (int): Неотрицательное целое число
+
+    Returns:
+        int: Факториал числа n
+
+    Временная сложность: O(M(n log n) log n), M - стоимость умножения
+    Глубина рекурсии: нет (итеративная версия)
+    """
+    if n < 0:
+        raise ValueError("n должно быть неотрицательным")
+    return _product_tree(range(2, n + 1))
+
+
+def _primes_up_to(n):
+    """Простые числа до n включительно (решето Эратосфена)"""
+    if n < 2:
+        return []
+    sieve = bytearray([1]) * (n + 1)
+    sieve[0] = sieve[1] = 0
+    for p in range(2, int(n ** 0.5) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = bytes(len(range(p * p, n + 1, p)))
+    return [p for p in range(2, n + 1) if sieve[p]]
+
+
+def _swing(n, primes):
+    """
+    "Качание" n: n! / ((n // 2)!)^2 в виде произведения степеней простых.
+
+    Показатель простого p равен числу нечётных слагаемых floor(n / p^k).
+    """
+    factors = []
+    for p in primes:
+        if p > n:
+            break
+        q, e = n, 0
+        while q >= p:
+            q //= p
+            e += q & 1
+        if e:
+            factors.append(p ** e if e > 1 else p)
+    return _product_tree(factors)
+
+
+def factorial_prime_swing(n):
+    """
+    Вычисление факториала методом "prime swing" (П. Лушни).
+
+    n! = ((n // 2)!)^2 * swing(n), где swing(n) раскладывается на степени
+    простых до n. Цепочка n, n // 2, n // 4, ... проходится снизу вверх
+    циклом, поэтому рекурсии нет.
+
+    Args:
+        n (int): Неотрицательное целое число
+
+    Returns:
+        int: Факториал числа n
+
+    Временная сложность: O(M(n log n) log n), меньше умножений,
+        чем у factorial_product_tree
+    Глубина рекурсии: нет (итеративная версия)
+    """
+    if n < 0:
+        raise ValueError("n должно быть неотрицательным")
+    primes = _primes_up_to(n)
+    chain = []
+    while n > 1:
+        chain.append(n)
+        n //= 2
+    result = 1
+    for m in reversed(chain):
+        result = result * result * _swing(m, primes)
+    return result
+
+
+def _is_prime(p):
+    """Проверка простоты перебором делителей до sqrt(p)"""
+    if p < 2:
+        return False
+    d = 2
+    while d * d <= p:
+        if p % d == 0:
+            return False
+        d += 1
+    return True
+
+
+def factorial_mod(n, p):
+    """
+    Вычисление n! по модулю p без длинной арифметики.
+
+    При n >= p результат 0 (p входит в произведение). Для простого p и
+    n > p / 2 используется теорема Вильсона: (p - 1)! = -1 (mod p), откуда
+    n! = (-1)^(p - n) / (p - 1 - n)! (mod p) - умножений вдвое меньше.
+
+    Args:
+        n (int): Неотрицательное целое число
+        p (int): Модуль (положительный; ускорение - для простого)
+
+    Returns:
+        int: n! mod p
+
+    Временная сложность: O(min(n, p - n)) умножений по модулю
+    Глубина рекурсии: нет (итеративная версия)
+    """
+    if n < 0:
+        raise ValueError("n должно быть неотрицательным")
+    if p < 1:
+        raise ValueError("модуль должен быть положительным")
+    if n >= p:
+        return 0
+
+    wilson = 2 * n > p and _is_prime(p)
+    m = p - 1 - n if wilson else n
+    result = 1 % p
+    for k in range(2, m + 1):
+        result = result * k % p
+    if not wilson:
+        return result
+    sign = 1 if (p - n) % 2 == 0 else -1
+    return sign * pow(result, -1, p) % p
+
+
+def factorials(ns, mod=None):
+    """
+    Факториалы всех чисел из ns за один проход.
+
+    Аргументы сортируются, и произведение наращивается от меньшего к
+    большему: отрезок между соседними аргументами перемножается деревом
+    произведений и домножается к накопленному факториалу.
+
+    Args:
+        ns (iterable): Неотрицательные целые числа
+        mod (int): Модуль; если задан, возвращаются n! mod mod
+
+    Returns:
+        list: Факториалы в порядке ns
+
+    Временная сложность: как у одного факториала от max(ns)
+        плюс по умножению на каждый различный аргумент
+    Глубина рекурсии: нет (итеративная версия)
+    """
+    ns = list(ns)
+    if any(n < 0 for n in ns):
+        raise ValueError("n должно быть неотрицательным")
+
+    values = {}
+    current, previous = 1, 1
+    for n in sorted(set(ns)):
+        if mod is None:
+            current *= _product_tree(range(previous + 1, n + 1))
+        else:
+            for k in range(previous + 1, n + 1):
+                current = current * k % mod
+        previous = max(previous, n)
+        values[n] = current if mod is None else current % mod
+    return [values[n] for n in ns]
+
+
 def fibonacci_naive(n):
     """
     Наивное вычисление n-го числа Фибоначчи.
@@ -44,39 +239,288 @@ def fibonacci_naive(n):
     return fibonacci_naive(n - 1) + fibonacci_naive(n - 2)
 
 
+def _determinant(rows):
+    """Точный определитель целочисленной матрицы (Барейсс, без дробей)"""
+    a = [list(row) for row in rows]
+    size = len(a)
+    sign, previous = 1, 1
+    for k in range(size - 1):
+        if a[k][k] == 0:
+            pivot = next((i for i in range(k + 1, size) if a[i][k] != 0), None)
+            if pivot is None:
+                return 0
+            a[k], a[pivot] = a[pivot], a[k]
+            sign = -sign
+        for i in range(k + 1, size):
+            for j in range(k + 1, size):
+                a[i][j] = (a[i][j] * a[k][k] - a[i][k] * a[k][j]) // previous
+        previous = a[k][k]
+    return sign * a[-1][-1] if size else 1
+
+
+def _matrix_inverse_mod(matrix, mod):
+    """
+    Обратная матрица по модулю: присоединённая матрица, умноженная на
+    pow(det, -1, mod). Массив формы (..., k, k) - пакет матриц.
+
+    Returns:
+        np.ndarray: Вычеты в dtype=object (целые Python)
+
+    Raises:
+        ValueError: Определитель не взаимно прост с mod
+    """
+    matrix = np.asarray(matrix, dtype=object) % mod
+    size = matrix.shape[-1]
+    inverse = np.empty(matrix.shape, dtype=object)
+    for index in np.ndindex(matrix.shape[:-2]):
+        rows = matrix[index].tolist()
+        try:
+            det_inverse = pow(_determinant(rows) % mod, -1, mod)
+        except ValueError:
+            raise ValueError(f"матрица необратима по модулю {mod}") from None
+        for i in range(size):
+            for j in range(size):
+                minor = [row[:j] + row[j + 1:] for k, row in enumerate(rows) if k != i]
+                # Присоединённая матрица - транспонированная матрица дополнений
+                cofactor = (-1) ** (i + j) * _determinant(minor)
+                inverse[index + (j, i)] = cofactor * det_inverse % mod
+    return inverse
+
+
+def power(base, n, mod=None, mul=None, identity=None, inverse=None):
+    """
+    Возведение в степень двоичным методом (square-and-multiply, итеративно).
+
+    Работает в любом моноиде: по умолчанию - числа (operator.mul, единица 1)
+    и матрицы NumPy (np.matmul, единичная матрица; массив формы
+    (..., k, k) - пакет матриц, возводимых в степень одновременно).
+    Для других объектов задаются свои mul и identity.
+
+    Args:
+        base: Основание
+        n (int): Показатель степени (отрицательный - степень обратного)
+        mod (int): Модуль; для чисел и матриц NumPy остаток берётся после
+            каждого умножения (свой mul приводит по модулю сам); целая
+            матрица, которой грозит переполнение, считается в dtype=object
+        mul (callable): Ассоциативное умножение mul(x, y)
+        identity: Единица моноида; без неё при своём mul n должно быть
+            положительным
+        inverse (callable): Обратный элемент для отрицательных n; по
+            умолчанию pow(x, -1, mod), 1 / x, np.linalg.inv, а для матрицы
+            с mod - обратная по модулю (вычеты в dtype=object)
+
+    Returns:
+        base в степени n
+
+    Временная сложность: O(log n) умножений
+    Глубина рекурсии: нет (итеративная версия)
+    """
+    is_matrix = isinstance(base, np.ndarray)
+    if mul is None:
+        mul = np.matmul if is_matrix else operator.mul
+        reduce = mod is not None
+    else:
+        reduce = False
+
+    if n < 0:
+        if inverse is None:
+            if is_matrix:
+                inverse = np.linalg.inv if mod is None else \
+                    functools.partial(_matrix_inverse_mod, mod=mod)
+            elif mod is not None:
+                inverse = functools.partial(pow, exp=-1, mod=mod)
+            else:
+                inverse = functools.partial(operator.truediv, 1)
+        base = inverse(base)
+        n = -n
+
+    # Сумма dim произведений остатков не должна переполнить целый dtype:
+    # иначе матрица переводится в dtype=object (целые Python)
+    if (reduce and is_matrix and base.dtype.kind in 'iu'
+            and (mod - 1) ** 2 * base.shape[-1] > np.iinfo(base.dtype).max):
+        base = base.astype(object)
+
+    if identity is None and mul in (operator.mul, np.matmul):
+        if is_matrix:
+            identity = np.broadcast_to(np.eye(base.shape[-1], dtype=base.dtype), base.shape).copy()
+        else:
+            identity = 1
+    if identity is None and n == 0:
+        raise ValueError("для n = 0 нужна единица моноида (identity)")
+
+    def multiply(x, y):
+        z = mul(x, y)
+        return z % mod if reduce else z
+
+    # Без заданной единицы первое умножение заменяется самим основанием
+    result = identity
+    if reduce:
+        result, base = result % mod, base % mod
+    while n:
+        if n & 1:
+            result = base if result is None else multiply(result, base)
+        n >>= 1
+        if n:
+            base = multiply(base, base)
+    return result
+
+
 def fast_power(a, n):
     """
     Быстрое возведение числа a в степень n через степень двойки.
 
     Args:
         a (float): Основание
-        n (int): Показатель степени (неотрицательный)
+        n (int): Показатель степени (отрицательный - 1 / a^|n|)
 
     Returns:
         float: a в степени n
 
     Временная сложность: O(log n)
-    Глубина рекурсии: O(log n)
+    Глубина рекурсии: нет (итеративная версия, см. power)
     """
-    # Базовые случаи
-    if n == 0:
-        return 1
-    if n == 1:
-        return a
+    if isinstance(a, np.ndarray):
+        # Для массива степень поэлементная, как a * a в рекурсивной
+        # версии; матричную степень даёт power
+        if n < 0:
+            a, n = 1 / a, -n
+        return power(a, n, mul=np.multiply, identity=np.ones_like(a))
+    return power(a, n)
 
-    # Рекурсивный шаг
-    half_power = fast_power(a, n // 2)
 
-    if n % 2 == 0:
-        # Если степень четная
-        return half_power * half_power
-    else:
-        # Если степень нечетная
-        return a * half_power * half_power
+def fibonacci_fast_doubling(n, mod=None):
+    """
+    Вычисление n-го числа Фибоначчи методом быстрого удвоения (итеративно).
+
+    По парам (F(k), F(k+1)) и формулам
+        F(2k) = F(k) * (2F(k+1) - F(k))
+        F(2k+1) = F(k)^2 + F(k+1)^2
+    биты n просматриваются от старшего к младшему, как в fast_power.
+
+    Args:
+        n (int): Порядковый номер числа Фибоначчи (неотрицательный)
+        mod (int): Модуль; если задан, возвращается F(n) mod mod
+
+    Returns:
+        int: n-е число Фибоначчи (или его остаток по модулю mod)
+
+    Временная сложность: O(log n) умножений
+        (с модулем - умножений чисел размера машинного слова)
+    Глубина рекурсии: нет (итеративная версия)
+    """
+    if n < 0:
+        raise ValueError("n должно быть неотрицательным")
+
+    a, b = 0, 1  # F(0), F(1)
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)  # F(2k)
+        d = a * a + b * b    # F(2k+1)
+        if mod is not None:
+            c, d = c % mod, d % mod
+        if bit == '1':
+            a, b = d, c + d
+            if mod is not None:
+                b %= mod
+        else:
+            a, b = c, d
+    return a if mod is None else a % mod
+
+
+def _matrix_mult_2x2(x, y, mod=None):
+    """Произведение матриц 2x2, заданных кортежами (a, b, c, d)"""
+    a = x[0] * y[0] + x[1] * y[2]
+    b = x[0] * y[1] + x[1] * y[3]
+    c = x[2] * y[0] + x[3] * y[2]
+    d = x[2] * y[1] + x[3] * y[3]
+    if mod is not None:
+        return a % mod, b % mod, c % mod, d % mod
+    return a, b, c, d
+
+
+def fibonacci_matrix(n, mod=None):
+    """
+    Вычисление n-го числа Фибоначчи возведением матрицы в степень.
+
+    [[1, 1], [1, 0]]^n = [[F(n+1), F(n)], [F(n), F(n-1)]];
+    степень вычисляется итеративно по двоичной записи n
+    (та же идея, что в fast_power).
+
+    Args:
+        n (int): Порядковый номер числа Фибоначчи (неотрицательный)
+        mod (int): Модуль; если задан, возвращается F(n) mod mod
+
+    Returns:
+        int: n-е число Фибоначчи (или его остаток по модулю mod)
+
+    Временная сложность: O(log n) умножений матриц 2x2
+    Глубина рекурсии: нет (итеративная версия)
+    """
+    if n < 0:
+        raise ValueError("n должно быть неотрицательным")
+
+    result = power((1, 1, 1, 0), n, mul=lambda x, y: _matrix_mult_2x2(x, y, mod),
+                   identity=(1, 0, 0, 1))
+    return result[1] if mod is None else result[1] % mod
+
+
+def linear_recurrence(coeffs, initial, n, mod=None):
+    """
+    n-й член линейной рекуррентной последовательности
+        a(t) = c1 * a(t-1) + c2 * a(t-2) + ... + ck * a(t-k)
+    возведением сопровождающей матрицы NumPy в степень (power).
+
+    Пакет рекуррентностей одного порядка (coeffs и initial формы (B, k))
+    вычисляется одним возведением пакета матриц (B, k, k) в степень.
+
+    Args:
+        coeffs: Коэффициенты [c1, ..., ck] или пакет формы (B, k)
+        initial: Начальные члены [a(0), ..., a(k-1)] той же формы
+        n (int): Номер члена (неотрицательный)
+        mod (int): Модуль; если задан, вычисления ведутся по модулю
+
+    Returns:
+        int (или массив из B чисел для пакета): a(n)
+
+    Временная сложность: O(k^3 log n) на рекуррентность
+    Глубина рекурсии: нет (итеративная версия)
+    """
+    if n < 0:
+        raise ValueError("n должно быть неотрицательным")
+    coeffs = np.asarray(coeffs, dtype=object)
+    initial = np.asarray(initial, dtype=object)
+    if mod is not None:
+        # Вычеты до выбора int64: иначе большие начальные члены переполнятся
+        coeffs, initial = coeffs % mod, initial % mod
+    k = coeffs.shape[-1]
+    # int64 без переполнения, пока сумма k произведений меньше 2^63,
+    # иначе - длинные целые Python (dtype=object)
+    dtype = np.int64 if mod is not None and k * (mod - 1) ** 2 < 2 ** 63 else object
+
+    companion = np.zeros(coeffs.shape[:-1] + (k, k), dtype=dtype)
+    companion[..., 0, :] = coeffs
+    companion[..., np.arange(1, k), np.arange(k - 1)] = 1
+    state = initial[..., ::-1].astype(dtype)[..., np.newaxis]  # [a(k-1), ..., a(0)]
+
+    matrix = power(companion, n, mod=mod)
+    terms = np.matmul(matrix, state)[..., -1, 0]
+    if mod is not None:
+        terms = terms % mod
+    return terms.tolist() if np.ndim(terms) else int(terms)
 
 
 # Демонстрация работы функций
 if __name__ == "__main__":
     print("Факториал 5:", factorial(5))
+    print("Длина 10000! в битах (дерево произведений):", factorial_product_tree(10000).bit_length())
+    print("10^6! mod (10^9 + 7) =", factorial_mod(10 ** 6, 10 ** 9 + 7))
+    print("Факториалы 0..6 за один проход:", factorials(range(7)))
     print("10-е число Фибоначчи:", fibonacci_naive(10))
-    print("2^10 =", fast_power(2, 10))
\ No newline at end of file
+    print("2^10 =", fast_power(2, 10), " 2^-3 =", fast_power(2, -3))
+    print("3^-1 mod 7 =", power(3, -1, mod=7))
+    print("Поэлементно [1, 2, 3]^3 =", fast_power(np.array([1, 2, 3]), 3))
+    print("[[1, 1], [1, 0]]^90 mod (2^61 - 1) =",
+          power(np.array([[1, 1], [1, 0]]), 90, mod=2 ** 61 - 1).tolist())
+    print("Трибоначчи T(50) и Пелль P(50) одним пакетом:",
+          linear_recurrence([[1, 1, 1], [2, 1, 0]], [[0, 0, 1], [0, 1, 2]], 50))
+    print("100-е число Фибоначчи (быстрое удвоение):", fibonacci_fast_doubling(100))
+    print("F(10^18) mod (10^9 + 7) =", fibonacci_matrix(10 ** 18, 10 ** 9 + 7))
\ No newline at end of file
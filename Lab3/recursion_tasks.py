@@ -1,7 +1,13 @@
 """
 Практические задачи с применением рекурсии
 """
+import json
 import os
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 
 def binary_search_recursive(arr, target, low=0, high=None):
     """
@@ -37,9 +43,103 @@ def binary_search_recursive(arr, target, low=0, high=None):
         return binary_search_recursive(arr, target, mid + 1, high)
 
 
+class WalkEntry(namedtuple('WalkEntry', 'path name depth is_dir error')):
+    """
+    Элемент обхода scandir_walk: путь, имя, глубина каталога-родителя
+    (0 - элементы start_path), признак каталога и ошибка чтения каталога
+    (PermissionError / FileNotFoundError, иначе None; для записи с ошибкой
+    path и name относятся к самому непрочитанному каталогу)
+    """
+
+
+def _entry_is_dir(entry, follow_symlinks):
+    """entry.is_dir(), но как os.path.isdir: False при ошибке stat (петля ссылок)"""
+    try:
+        return entry.is_dir(follow_symlinks=follow_symlinks)
+    except OSError:
+        return False
+
+
+def _scan_directory(path, follow_symlinks):
+    """
+    Чтение одного каталога в рабочем потоке.
+
+    Тип элемента берётся из d_type, закэшированного os.scandir, поэтому
+    stat выполняется только для символических ссылок (и файловых систем
+    без d_type).
+
+    Returns:
+        tuple: ([(имя, путь, каталог ли), ...], ошибка или None)
+    """
+    try:
+        with os.scandir(path) as it:
+            return [(entry.name, entry.path, _entry_is_dir(entry, follow_symlinks))
+                    for entry in it], None
+    except (PermissionError, FileNotFoundError) as e:
+        return [], e
+
+
+def scandir_walk(start_path, max_depth=None, workers=None, follow_symlinks=True):
+    """
+    Обход файловой системы на os.scandir с явным стеком и пулом потоков.
+
+    Элементы выдаются в том же порядке, что печатает file_system_walk
+    (каталог, затем его содержимое), а чтение каталогов идёт параллельно:
+    как только каталог прочитан, чтение всех его подкаталогов
+    отправляется в пул потоков и перекрывается с обработкой.
+
+    Args:
+        start_path (str): Начальный путь для обхода
+        max_depth (int): Максимальная глубина (как в file_system_walk:
+            элементы глубины d выдаются при d <= max_depth)
+        workers (int): Число потоков чтения каталогов
+            (None - по умолчанию ThreadPoolExecutor)
+        follow_symlinks (bool): Заходить в символические ссылки на каталоги
+            (как os.path.isdir в file_system_walk)
+
+    Yields:
+        WalkEntry: Элементы дерева; для каталога, который не удалось
+            прочитать, - запись с заполненным error
+
+    Временная сложность: O(N) для N элементов, один системный вызов
+        getdents на каталог вместо stat на каждый элемент
+    Глубина рекурсии: нет (явный стек)
+    """
+    if max_depth is not None and max_depth < 0:
+        return
+
+    pool = ThreadPoolExecutor(max_workers=workers)
+    try:
+        # Стек: (путь каталога, глубина его элементов, чтение каталога)
+        stack = [(start_path, 0, pool.submit(_scan_directory, start_path, follow_symlinks))]
+        pending = []  # [итератор по элементам каталога, глубина, заранее начатые чтения]
+        while stack or pending:
+            if stack:
+                path, depth, future = stack.pop()
+                entries, error = future.result()
+                if error is not None:
+                    yield WalkEntry(path, os.path.basename(path), depth, True, error)
+                    continue
+                descend = max_depth is None or depth + 1 <= max_depth
+                prefetched = {child_path: pool.submit(_scan_directory, child_path, follow_symlinks)
+                              for _, child_path, is_dir in entries if is_dir and descend}
+                pending.append((iter(entries), depth, prefetched))
+
+            it, depth, prefetched = pending[-1]
+            for name, path, is_dir in it:
+                yield WalkEntry(path, name, depth, is_dir, None)
+                if path in prefetched:
+                    stack.append((path, depth + 1, prefetched.pop(path)))
+                    break
+            else:
+                pending.pop()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
 def file_system_walk(start_path, indent=0, max_depth=None, current_depth=0):
     """
-    Рекурсивный обход файловой системы.
+    Обход файловой системы с выводом дерева (на основе scandir_walk).
 
     Args:
         start_path (str): Начальный путь для обхода
@@ -47,84 +147,225 @@ def file_system_walk(start_path, indent=0, max_depth=None, current_depth=0):
         max_depth (int): Максимальная глубина рекурсии
         current_depth (int): Текущая глубина рекурсии
     """
-    if max_depth is not None and current_depth > max_depth:
-        return
+    remaining = None if max_depth is None else max_depth - current_depth
+    for entry in scandir_walk(start_path, remaining):
+        prefix = "  " * (indent + entry.depth)
+        if isinstance(entry.error, PermissionError):
+            print(prefix + "❌ Доступ запрещен")
+        elif entry.error is not None:
+            print(prefix + "❌ Файл не найден")
+        elif entry.is_dir:
+            print(prefix + f"📁 {entry.name}/")
+        else:
+            print(prefix + f"📄 {entry.name}")
+
+
+def hanoi_moves(n, source='A', target='C', auxiliary='B'):
+    """
+    Ленивый генератор ходов Ханойских башен без рекурсии.
 
-    try:
-        # Получаем список элементов в директории
-        items = os.listdir(start_path)
+    Ход с номером m (1 <= m < 2^n) определяется по двоичной записи m:
+    перекладывается диск номер (число младших нулевых битов m) + 1, со
+    стержня (m & (m - 1)) % 3 на стержень ((m | (m - 1)) + 1) % 3 (стержни
+    нумеруются по кругу, при чётном n порядок target и auxiliary меняется).
+    Состояние генератора - только номер хода.
+
+    Args:
+        n (int): Количество дисков
+        source (str): Исходный стержень
+        target (str): Целевой стержень
+        auxiliary (str): Вспомогательный стержень
 
-        for item in items:
-            item_path = os.path.join(start_path, item)
+    Yields:
+        tuple: (диск, с какого стержня, на какой стержень)
+
+    Временная сложность: O(1) на ход, всего 2^n - 1 ходов
+    Глубина рекурсии: нет (итеративная версия)
+    """
+    pegs = (source, auxiliary, target) if n % 2 else (source, target, auxiliary)
+    for m in range(1, 1 << n):
+        yield ((m & -m).bit_length(),
+               pegs[(m & (m - 1)) % 3],
+               pegs[((m | (m - 1)) + 1) % 3])
 
-            # Определяем тип элемента
-            if os.path.isdir(item_path):
-                print("  " * indent + f"📁 {item}/")
-                # Рекурсивный обход поддиректории
-                file_system_walk(item_path, indent + 1, max_depth, current_depth + 1)
-            else:
-                print("  " * indent + f"📄 {item}")
 
-    except PermissionError:
-        print("  " * indent + "❌ Доступ запрещен")
-    except FileNotFoundError:
-        print("  " * indent + "❌ Файл не найден")
+def hanoi_move_chunks(n, chunk_size=1 << 20):
+    """
+    Ходы Ханойских башен блоками массивов NumPy (для массовой обработки).
+
+    Формулы те же, что в hanoi_moves, но вычисляются векторно над
+    номерами ходов блока.
+
+    Args:
+        n (int): Количество дисков (не больше 62)
+        chunk_size (int): Число ходов в блоке (последний блок короче)
+
+    Yields:
+        np.ndarray: Массив формы (k, 3) типа uint8 - строки
+            (диск, с какого стержня, на какой стержень), стержни
+            нумеруются как в hanoi_towers: 0 - source, 1 - target,
+            2 - auxiliary
+
+    Временная сложность: O(2^n), память O(chunk_size)
+    Глубина рекурсии: нет (итеративная версия)
+    """
+    if not 0 <= n <= 62:
+        raise ValueError("n должно быть от 0 до 62")
+
+    # Номера стержней формулы -> номера в порядке (source, target, auxiliary)
+    pegs = np.array([0, 2, 1] if n % 2 else [0, 1, 2], dtype=np.uint8)
+    total = 1 << n
+    for start in range(1, total, chunk_size):
+        m = np.arange(start, min(start + chunk_size, total), dtype=np.int64)
+        chunk = np.empty((len(m), 3), dtype=np.uint8)
+        # Номер младшего единичного бита: m & -m - степень двойки 2^(диск - 1)
+        chunk[:, 0] = np.frexp((m & -m).astype(np.float64))[1]
+        chunk[:, 1] = pegs[(m & (m - 1)) % 3]
+        chunk[:, 2] = pegs[((m | (m - 1)) + 1) % 3]
+        yield chunk
 
 
 def hanoi_towers(n, source, target, auxiliary):
     """
-    Решение задачи Ханойских башен.
+    Решение задачи Ханойских башен с выводом каждого хода.
+
+    Ходы берутся из генератора hanoi_moves; для больших n без вывода
+    используйте hanoi_moves или hanoi_move_chunks напрямую.
 
     Args:
         n (int): Количество дисков
         source (str): Исходный стержень
         target (str): Целевой стержень
         auxiliary (str): Вспомогательный стержень
+
+    Returns:
+        int: Количество ходов (2^n - 1)
     """
-    step_counter = [0]  # Используем список для mutable объекта
+    steps = 0
+    for steps, (disk, from_peg, to_peg) in enumerate(
+            hanoi_moves(n, source, target, auxiliary), start=1):
+        print(f"{steps}. Переместить диск {disk} с {from_peg} на {to_peg}")
+    return steps
 
-    def _hanoi_towers_internal(n, source, target, auxiliary):
-        if n == 1:
-            # Базовый случай: перемещаем один диск
-            step_counter[0] += 1
-            print(f"{step_counter[0]}. Переместить диск 1 с {source} на {target}")
-            return
 
-        # Рекурсивные шаги:
-        # 1. Переместить n-1 дисков на вспомогательный стержень
-        _hanoi_towers_internal(n - 1, source, auxiliary, target)
+# Версия формата кэша tree_stats: увеличивается при его изменении
+TREE_CACHE_VERSION = 1
+# Каталоги, изменённые менее чем за столько наносекунд до начала обхода,
+# не кэшируются: изменение в тот же квант mtime было бы незаметно
+TREE_CACHE_RACY_NS = 2 * 10 ** 9
 
-        # 2. Переместить самый большой диск на целевой стержень
-        step_counter[0] += 1
-        print(f"{step_counter[0]}. Переместить диск {n} с {source} на {target}")
 
-        # 3. Переместить n-1 дисков с вспомогательного на целевой стержень
-        _hanoi_towers_internal(n - 1, auxiliary, target, source)
+class TreeStats(namedtuple('TreeStats',
+                           'max_depth files directories total_size scanned reused')):
+    """
+    Статистика дерева: максимальная глубина каталога (корень - 0), число
+    файлов и подкаталогов, суммарный размер файлов в байтах; scanned и
+    reused - сколько каталогов прочитано заново и взято из кэша
+    """
 
-    _hanoi_towers_internal(n, source, target, auxiliary)
-    return step_counter[0]
 
+def _load_tree_cache(cache_path, root):
+    """Кэш каталогов из JSON (пустой, если файла нет или он от другого корня)"""
+    if cache_path is None or not os.path.exists(cache_path):
+        return {}
+    try:
+        with open(cache_path, encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get('version') != TREE_CACHE_VERSION or data.get('root') != root:
+        return {}
+    return data['dirs']
 
-def measure_recursion_depth():
-    """
-    Измерение максимальной глубины рекурсии при обходе файловой системы.
+
+def _save_tree_cache(cache_path, root, dirs):
+    """Атомарная запись кэша: временный файл и переименование"""
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': TREE_CACHE_VERSION, 'root': root, 'dirs': dirs}, f)
+    os.replace(tmp_path, cache_path)
+
+
+def tree_stats(start_path=".", cache_path=None):
     """
-    max_depth_found = [0]
+    Статистика дерева каталогов за один проход с инкрементальным кэшем.
 
-    def count_depth(path, current_depth):
-        max_depth_found[0] = max(max_depth_found[0], current_depth)
+    Для каждого каталога кэш (JSON в cache_path) хранит mtime каталога,
+    число и размер его файлов и имена подкаталогов. При повторном обходе
+    каталог с неизменным mtime не читается (один stat вместо scandir и
+    stat каждого файла), но его подкаталоги проверяются: изменение в
+    глубине дерева не меняет mtime предков.
 
-        try:
-            for item in os.listdir(path):
-                item_path = os.path.join(path, item)
-                if os.path.isdir(item_path):
-                    count_depth(item_path, current_depth + 1)
-        except (PermissionError, OSError):
-            pass
+    mtime каталога меняется при создании, удалении и переименовании
+    элементов, но не при перезаписи файла на месте - размер таких файлов
+    обновится при следующем изменении их каталога.
 
-    # Тестируем на текущей директории
-    count_depth(".", 0)
-    return max_depth_found[0]
+    Args:
+        start_path (str): Корень обхода
+        cache_path (str): Файл кэша (None - обход без кэша)
+
+    Returns:
+        TreeStats: Статистика дерева
+
+    Временная сложность: O(N) для N элементов при первом обходе,
+        O(D) stat для D каталогов при повторном обходе без изменений
+    Глубина рекурсии: нет (явный стек)
+    """
+    root = os.path.abspath(start_path)
+    cache = _load_tree_cache(cache_path, root)
+    new_cache = {}
+    scan_start_ns = time.time_ns()
+
+    max_depth = files = directories = total_size = scanned = reused = 0
+    stack = [('', root, 0)]  # (путь относительно корня, полный путь, глубина)
+    while stack:
+        rel_path, path, depth = stack.pop()
+        max_depth = max(max_depth, depth)
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            continue
+
+        entry = cache.get(rel_path)
+        if entry is not None and entry['mtime_ns'] == mtime_ns:
+            reused += 1
+        else:
+            entry = {'mtime_ns': mtime_ns, 'files': 0, 'size': 0, 'subdirs': []}
+            try:
+                with os.scandir(path) as it:
+                    for item in it:
+                        try:
+                            if item.is_dir(follow_symlinks=False):
+                                entry['subdirs'].append(item.name)
+                            else:
+                                entry['files'] += 1
+                                entry['size'] += item.stat(follow_symlinks=False).st_size
+                        except OSError:
+                            pass
+            except OSError:
+                pass
+            scanned += 1
+
+        if mtime_ns < scan_start_ns - TREE_CACHE_RACY_NS:
+            new_cache[rel_path] = entry
+        files += entry['files']
+        total_size += entry['size']
+        directories += len(entry['subdirs'])
+        for name in entry['subdirs']:
+            stack.append((f"{rel_path}/{name}" if rel_path else name,
+                          os.path.join(path, name), depth + 1))
+
+    if cache_path is not None:
+        _save_tree_cache(cache_path, root, new_cache)
+    return TreeStats(max_depth, files, directories, total_size, scanned, reused)
+
+
+def measure_recursion_depth(start_path=".", cache_path=None):
+    """
+    Измерение максимальной глубины вложенности каталогов
+    (на основе tree_stats; с cache_path повторные вызовы инкрементальные).
+    """
+    return tree_stats(start_path, cache_path).max_depth
 
 
 # Демонстрация работы
@@ -146,4 +387,7 @@ if __name__ == "__main__":
 
     print(f"\n=== Измерение глубины рекурсии ===")
     depth = measure_recursion_depth()
-    print(f"Максимальная глубина рекурсии при обходе файловой системы: {depth}")
\ No newline at end of file
+    print(f"Максимальная глубина рекурсии при обходе файловой системы: {depth}")
+    stats = tree_stats(".")
+    print(f"Файлов: {stats.files}, каталогов: {stats.directories}, "
+          f"размер: {stats.total_size} байт")
\ No newline at end of file
@@ -0,0 +1,55 @@
+"""
+Тестирование возведения в степень и линейных рекуррентностей
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from recursion import power, fast_power, linear_recurrence
+
+
+def test_power_matrix_inverse_mod():
+    """Отрицательная степень матрицы по модулю - вычеты, а не дроби"""
+    assert power(np.array([[1, 1], [0, 2]]), -1, mod=7).tolist() == [[1, 3], [0, 4]]
+    assert power(np.array([[3]]), -1, mod=7).tolist() == [[5]]
+
+    # Пакет случайных обратимых матриц: M^-n * M^n = E по модулю
+    rng = random.Random(0)
+    mod = 10 ** 9 + 7
+    batch = np.array([[[rng.randrange(mod) for _ in range(3)] for _ in range(3)]
+                      for _ in range(4)])
+    product = np.matmul(power(batch, -5, mod=mod), power(batch, 5, mod=mod)) % mod
+    assert all(m.tolist() == np.eye(3, dtype=int).tolist() for m in product)
+
+    with pytest.raises(ValueError):
+        power(np.array([[2, 0], [0, 1]]), -1, mod=4)
+
+
+def test_power_matrix_mod_overflow():
+    """Модуль, при котором int64 переполнился бы, считается в целых Python"""
+    mod = 2 ** 61 - 1
+    a, b = 0, 1
+    for _ in range(1000):
+        a, b = b, a + b
+    assert power(np.array([[1, 1], [1, 0]]), 1000, mod=mod)[0, 1] == a % mod
+
+
+def test_fast_power_elementwise():
+    """fast_power возводит массив в степень поэлементно"""
+    assert fast_power(np.array([[1, 2], [3, 4]]), 2).tolist() == [[1, 4], [9, 16]]
+    assert fast_power(np.array([2.0, 4.0]), -2).tolist() == [0.25, 0.0625]
+
+
+def test_linear_recurrence_large_seeds():
+    """Начальные члены и коэффициенты больше модуля приводятся до умножения"""
+    mod = 10 ** 9 + 7
+    assert linear_recurrence([1, 1], [0, 10 ** 12], 100, mod) == 33759712
+
+    coeffs, initial = [10 ** 15, -3, 2 ** 70], [10 ** 18, -(10 ** 13), 7]
+    terms = list(initial)
+    for _ in range(60):
+        terms.append(sum(c * t for c, t in zip(coeffs, terms[::-1])))
+    assert linear_recurrence(coeffs, initial, 60, mod) == terms[60] % mod
+    assert linear_recurrence(coeffs, initial, 60) == terms[60]
\ No newline at end of file
@@ -0,0 +1,256 @@
+"""
+Трамплин: выполнение глубокой рекурсии без ограничения глубины стека
+
+Рекурсивная функция записывается генератором: вместо рекурсивного вызова
+она выдаёт yield f.call(...) и получает результат подвызова как значение
+выражения yield. Движок run хранит стек генераторов в списке (в куче),
+поэтому глубина рекурсии ограничена только памятью, а не
+sys.getrecursionlimit().
+
+Пример:
+    @trampolined
+    def factorial(n):
+        if n <= 1:
+            return 1
+        return n * (yield factorial.call(n - 1))
+
+    factorial(10 ** 5)  # без RecursionError
+"""
+import functools
+import types
+from collections import OrderedDict, namedtuple
+
+from memo_cache import _make_key
+
+
+class Call(namedtuple('Call', 'func args kwargs')):
+    """Отложенный вызов трамплинной функции: func(*args, **kwargs)"""
+
+
+def run(call):
+    """
+    Выполнение отложенного вызова на стеке генераторов в куче.
+
+    Исключение внутри подвызова передаётся в вызывающий генератор
+    (gen.throw), поэтому try/except в теле функции работает как при
+    обычной рекурсии.
+
+    Args:
+        call (Call): Вызов верхнего уровня
+
+    Returns:
+        Результат вызова
+
+    Временная сложность: O(1) на подвызов (не считая тела функции)
+    Глубина рекурсии: нет (стек - список генераторов)
+    """
+    stack = []  # [(генератор, кэш функции или None, ключ кэша)]
+    push, pop = stack.append, stack.pop
+    generator_type = types.GeneratorType
+    value, error = None, None
+
+    while True:
+        if call is not None:
+            func, memo, memo_key = call.func._trampoline
+            key = None
+            if memo is not None:
+                key = memo_key(*call.args, **call.kwargs)
+            if memo is not None and key in memo:
+                value = memo[key]
+            else:
+                try:
+                    result = func(*call.args, **call.kwargs)
+                except Exception as e:
+                    error = e
+                else:
+                    if type(result) is generator_type:
+                        push((result, memo, key))
+                        value = None
+                    else:
+                        # Функция без yield (базовый случай) - результат сразу
+                        value = result
+                        if memo is not None:
+                            memo[key] = value
+            call = None
+
+        if not stack:
+            if error is not None:
+                raise error
+            return value
+
+        gen, memo, key = stack[-1]
+        try:
+            if error is not None:
+                e, error = error, None
+                yielded = gen.throw(e)
+            else:
+                yielded = gen.send(value)
+        except StopIteration as stop:
+            pop()
+            value = stop.value
+            if memo is not None:
+                memo[key] = value
+            continue
+        except Exception as e:
+            pop()
+            error = e
+            continue
+
+        if type(yielded) is Call:
+            call = yielded
+        else:
+            error = TypeError(f"трамплинная функция должна выдавать Call, получено {yielded!r}")
+
+
+class BoundedMemo(OrderedDict):
+    """
+    Кэш трамплина с вытеснением давно не использованных записей (LRU):
+    не больше maxsize значений вместо всех вычисленных
+    """
+
+    def __init__(self, maxsize=1024):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+def trampolined(func=None, memo=None, key=None):
+    """
+    Декоратор трамплинной функции (генератора, выдающего подвызовы).
+
+    Args:
+        func: Функция-генератор; подвызовы - yield f.call(...)
+        memo (dict): Кэш результатов - любое отображение с операциями
+            in, [] и clear (dict или ограниченный BoundedMemo); если
+            задан, вызов с уже вычисленным ключом не создаёт генератор
+        key (callable): Функция ключа кэша key(*args, **kwargs)
+
+    Декорированная функция:
+        f(*args) - выполнение через run
+        f.call(*args) - отложенный вызов Call для yield внутри генераторов
+        f.memo - кэш, f.cache_clear() - его очистка
+    """
+    if func is None:
+        return lambda f: trampolined(f, memo, key)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return run(Call(wrapper, args, kwargs))
+
+    def call(*args, **kwargs):
+        return Call(wrapper, args, kwargs)
+
+    def cache_clear():
+        if memo is not None:
+            memo.clear()
+
+    if key is None:
+        def key(*args, **kwargs):
+            return _make_key(args, kwargs, False)
+
+    wrapper.call = call
+    wrapper.memo = memo
+    wrapper.cache_clear = cache_clear
+    # Всё, что нужно run для вызова, - одним атрибутом
+    wrapper._trampoline = (func, memo, key)
+    return wrapper
+
+
+# Рекурсивные функции Lab3 на трамплине
+
+@trampolined
+def binary_search_trampolined(arr, target, low=0, high=None):
+    """
+    Бинарный поиск (binary_search_recursive) на трамплине.
+
+    Returns:
+        int: Индекс элемента или -1 если не найден
+
+    Временная сложность: O(log n)
+    Глубина рекурсии: нет (стек в куче)
+    """
+    if high is None:
+        high = len(arr) - 1
+    if low > high:
+        return -1
+    mid = (low + high) // 2
+    if arr[mid] == target:
+        return mid
+    if arr[mid] > target:
+        return (yield binary_search_trampolined.call(arr, target, low, mid - 1))
+    return (yield binary_search_trampolined.call(arr, target, mid + 1, high))
+
+
+@trampolined
+def factorial_trampolined(n):
+    """
+    Рекурсивный факториал (recursion.factorial) на трамплине.
+
+    Временная сложность: O(n) умножений
+    Глубина рекурсии: нет (стек в куче, O(n) генераторов)
+    """
+    if n == 0 or n == 1:
+        return 1
+    return n * (yield factorial_trampolined.call(n - 1))
+
+
+@trampolined(memo=BoundedMemo(maxsize=64))
+def fibonacci_trampolined(n):
+    """
+    Фибоначчи с мемоизацией (memoization.fibonacci_memoized) на трамплине.
+
+    Кэш - fibonacci_trampolined.memo, очистка -
+    fibonacci_trampolined.cache_clear(). Кэш ограничен (BoundedMemo на
+    64 записи): неограниченный словарь держал бы в памяти все F(k) до n,
+    O(n^2) бит. Рекурсии F(n - 1), F(n - 2) нужны только последние
+    значения, поэтому время остаётся O(n).
+
+    Временная сложность: O(n)
+    Глубина рекурсии: нет (стек в куче, O(n) генераторов)
+    """
+    if n == 0:
+        return 0
+    if n == 1:
+        return 1
+    return (yield fibonacci_trampolined.call(n - 1)) + (yield fibonacci_trampolined.call(n - 2))
+
+
+@trampolined
+def _hanoi_trampolined(n, source, target, auxiliary, moves):
+    if n == 0:
+        return None
+    yield _hanoi_trampolined.call(n - 1, source, auxiliary, target, moves)
+    moves.append((n, source, target))
+    yield _hanoi_trampolined.call(n - 1, auxiliary, target, source, moves)
+
+
+def hanoi_trampolined(n, source='A', target='C', auxiliary='B'):
+    """
+    Классическое рекурсивное решение Ханойских башен на трамплине.
+
+    Returns:
+        list: Ходы (диск, с какого стержня, на какой стержень)
+
+    Временная сложность: O(2^n)
+    Глубина рекурсии: нет (стек в куче, O(n) генераторов)
+    """
+    moves = []
+    _hanoi_trampolined(n, source, target, auxiliary, moves)
+    return moves
+
+
+if __name__ == "__main__":
+    print("Индекс 7:", binary_search_trampolined([1, 3, 5, 7, 9, 11, 13, 15], 7))
+    print("Длина 10000! в битах:", factorial_trampolined(10000).bit_length())
+    print("F(5000) mod 10^9:", fibonacci_trampolined(5000) % 10 ** 9)
+    print("Ходы для 3 дисков:", hanoi_trampolined(3))
\ No newline at end of file
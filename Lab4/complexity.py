@@ -0,0 +1,116 @@
+"""
+Эмпирическая оценка сложности алгоритмов по результатам замеров
+"""
+
+import math
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+# Нижняя граница времени: защищает логарифм от нулевых замеров таймера
+MIN_TIME = 1e-9
+
+
+def fit_power_law(sizes: List[int], times: List[float]) -> Tuple[float, float]:
+    """
+    Подбор степенной модели t = c * n^b методом наименьших квадратов
+    в логарифмических координатах: log t = log c + b * log n
+
+    Returns:
+        (c, b) - постоянный множитель и показатель степени
+    """
+    if len(sizes) < 2:
+        raise ValueError("Для подбора модели нужно не меньше двух точек")
+    log_n = np.log(np.asarray(sizes, dtype=float))
+    log_t = np.log(np.maximum(np.asarray(times, dtype=float), MIN_TIME))
+    b, log_c = np.polyfit(log_n, log_t, 1)
+    return math.exp(log_c), float(b)
+
+
+def predict_time(sizes: List[int], times: List[float], size: int,
+                 default_exponent: float = 2.0, last_points: int = 3) -> float:
+    """
+    Прогноз времени для размера size по уже выполненным замерам
+
+    Модель строится по last_points наибольшим размерам: на малых массивах
+    время определяется постоянными накладными расходами, а не асимптотикой.
+    По одной точке прогноз делается с показателем default_exponent
+    (по умолчанию квадратичный - с запасом для всех алгоритмов Lab4).
+    """
+    if not sizes:
+        raise ValueError("Нет замеров для прогноза")
+    if len(sizes) == 1:
+        return max(times[0], MIN_TIME) * (size / sizes[0]) ** default_exponent
+
+    c, b = fit_power_law(sizes[-last_points:], times[-last_points:])
+    return c * size ** b
+
+
+# Модели-кандидаты в порядке роста: имя -> f(n), время ~ c * f(n)
+COMPLEXITY_MODELS = {
+    'n': lambda n: n,
+    'n log n': lambda n: n * np.log2(np.maximum(n, 2)),
+    'n^2': lambda n: n ** 2
+}
+
+# Ожидаемая (средняя) сложность алгоритмов Lab4 - верхняя граница для
+# проверки: более быстрая модель (например, bubble_sort на отсортированных
+# данных) расхождением не считается
+EXPECTED_COMPLEXITY = {
+    'bubble_sort': 'n^2',
+    'selection_sort': 'n^2',
+    'insertion_sort': 'n^2',
+    'merge_sort': 'n log n',
+    'quick_sort': 'n log n',
+    'counting_sort': 'n',
+    'radix_sort': 'n',
+    'integer_sort': 'n'
+}
+
+
+def fit_complexity(sizes: List[int], times: List[float]) -> Dict:
+    """
+    Выбор лучшей модели из COMPLEXITY_MODELS для замеров
+
+    Для каждой модели множитель c подбирается методом наименьших квадратов
+    в логарифмических координатах (log c - среднее log t - log f(n)),
+    выбирается модель с наименьшей суммой квадратов остатков.
+
+    Returns:
+        Dict: model - лучшая модель, constant - её множитель c,
+        exponent - показатель степенной модели t = c * n^b,
+        residuals - сумма квадратов остатков по каждой модели
+    """
+    _, exponent = fit_power_law(sizes, times)
+    n = np.asarray(sizes, dtype=float)
+    log_t = np.log(np.maximum(np.asarray(times, dtype=float), MIN_TIME))
+
+    residuals = {}
+    constants = {}
+    for name, model in COMPLEXITY_MODELS.items():
+        diff = log_t - np.log(model(n))
+        log_c = float(np.mean(diff))
+        constants[name] = math.exp(log_c)
+        residuals[name] = float(np.sum((diff - log_c) ** 2))
+
+    best = min(residuals, key=residuals.get)
+    return {
+        'model': best,
+        'constant': constants[best],
+        'exponent': exponent,
+        'residuals': residuals
+    }
+
+
+def model_time(model: str, constant: float, sizes) -> np.ndarray:
+    """Время по подобранной модели для массива размеров"""
+    return constant * COMPLEXITY_MODELS[model](np.asarray(sizes, dtype=float))
+
+
+def complexity_mismatch(algo_name: str, model: str) -> bool:
+    """Подобранная модель растёт быстрее ожидаемой для алгоритма"""
+    expected = EXPECTED_COMPLEXITY.get(algo_name)
+    if expected is None:
+        return False
+    order = list(COMPLEXITY_MODELS)
+    return order.index(model) > order.index(expected)
\ No newline at end of file
@@ -0,0 +1,357 @@
+"""
+Внешняя сортировка слиянием для целочисленных файлов, не помещающихся в память
+"""
+
+import argparse
+import heapq
+import os
+import tempfile
+import time
+from array import array
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from sorts import SORTING_ALGORITHMS
+
+# Формат прогонов (runs) и бинарных файлов: 64-битные знаковые целые
+# в порядке байт текущей платформы
+INT_TYPECODE = 'q'
+INT_SIZE = array(INT_TYPECODE).itemsize
+
+# Оценка памяти на один элемент при сортировке в Python-списке:
+# указатель в списке + объект int + копии внутри алгоритма сортировки
+PYTHON_BYTES_PER_ELEMENT = 100
+
+FILE_FORMATS = ('binary', 'text')
+
+
+class ExternalSortStats:
+    """Статистика ввода-вывода внешней сортировки по проходам"""
+
+    def __init__(self):
+        self.passes: List[Dict] = []
+
+    def add_pass(self, name: str, bytes_read: int, bytes_written: int,
+                 runs: int, elapsed: float):
+        self.passes.append({
+            'name': name,
+            'bytes_read': bytes_read,
+            'bytes_written': bytes_written,
+            'runs': runs,
+            'time': elapsed
+        })
+
+    @property
+    def total_bytes_read(self) -> int:
+        return sum(p['bytes_read'] for p in self.passes)
+
+    @property
+    def total_bytes_written(self) -> int:
+        return sum(p['bytes_written'] for p in self.passes)
+
+    def print_report(self):
+        """Вывод таблицы прочитанных и записанных байт по проходам"""
+        print(f"{'Проход':<12}{'Прогонов':>10}{'Прочитано, МБ':>16}"
+              f"{'Записано, МБ':>16}{'Время, с':>12}")
+        print("-" * 66)
+        for p in self.passes:
+            print(f"{p['name']:<12}{p['runs']:>10}{p['bytes_read'] / 2 ** 20:>16.1f}"
+                  f"{p['bytes_written'] / 2 ** 20:>16.1f}{p['time']:>12.2f}")
+
+
+class ExternalSorter:
+    """
+    Внешняя сортировка слиянием
+
+    1. Входной файл читается фрагментами, помещающимися в бюджет памяти;
+       каждый фрагмент сортируется алгоритмом из SORTING_ALGORITHMS
+       и сбрасывается во временный файл (прогон).
+    2. Прогоны сливаются k-путевым слиянием на куче (heapq.merge)
+       с буферизованным чтением и записью. Если прогонов больше max_fan_in,
+       слияние выполняется в несколько проходов.
+
+    Сложность:
+      - Время: O(N log N) сравнений, O(N * (1 + ceil(log_k(R)))) ввода-вывода,
+        где R - число прогонов, k - max_fan_in
+      - Память: O(memory_budget)
+    """
+
+    def __init__(self, memory_budget: int = 256 * 2 ** 20, algorithm: str = 'integer_sort',
+                 file_format: str = 'binary', max_fan_in: int = 64, temp_dir: str = None):
+        if algorithm not in SORTING_ALGORITHMS:
+            raise ValueError(f"Неизвестный алгоритм сортировки: {algorithm}")
+        if file_format not in FILE_FORMATS:
+            raise ValueError(f"Неизвестный формат файла: {file_format}")
+        if max_fan_in < 2:
+            raise ValueError("max_fan_in должен быть не меньше 2")
+
+        self.memory_budget = memory_budget
+        self.sort_func = SORTING_ALGORITHMS[algorithm]
+        self.file_format = file_format
+        self.max_fan_in = max_fan_in
+        self.temp_dir = temp_dir
+
+        self.chunk_elements = max(1, memory_budget // PYTHON_BYTES_PER_ELEMENT)
+        self.stats = ExternalSortStats()
+
+    def sort_file(self, input_path: str, output_path: str) -> ExternalSortStats:
+        """Сортировка файла input_path с записью результата в output_path"""
+        self.stats = ExternalSortStats()
+
+        with tempfile.TemporaryDirectory(dir=self.temp_dir) as work_dir:
+            runs = self._create_runs(input_path, work_dir)
+
+            merge_pass = 1
+            while len(runs) > self.max_fan_in:
+                runs = self._merge_pass(runs, work_dir, merge_pass)
+                merge_pass += 1
+
+            self._merge_to_output(runs, output_path, merge_pass)
+
+        return self.stats
+
+    def _read_chunks(self, input_path: str, counter: List[int]) -> Iterator[List[int]]:
+        """Чтение входного файла фрагментами по chunk_elements чисел"""
+        with open(input_path, 'rb') as f:
+            if self.file_format == 'binary':
+                while True:
+                    data = f.read(self.chunk_elements * INT_SIZE)
+                    if not data:
+                        break
+                    counter[0] += len(data)
+                    chunk = array(INT_TYPECODE)
+                    chunk.frombytes(data)
+                    yield chunk.tolist()
+            else:
+                chunk = []
+                for line in f:
+                    counter[0] += len(line)
+                    if line.strip():
+                        chunk.append(int(line))
+                    if len(chunk) == self.chunk_elements:
+                        yield chunk
+                        chunk = []
+                if chunk:
+                    yield chunk
+
+    def _create_runs(self, input_path: str, work_dir: str) -> List[str]:
+        """Проход 0: сортировка фрагментов в памяти и запись прогонов"""
+        start = time.perf_counter()
+        bytes_read = [0]
+        bytes_written = 0
+        runs = []
+
+        for chunk in self._read_chunks(input_path, bytes_read):
+            run_path = os.path.join(work_dir, f"run_0_{len(runs)}.bin")
+            with open(run_path, 'wb') as f:
+                data = array(INT_TYPECODE, self.sort_func(chunk)).tobytes()
+                f.write(data)
+            bytes_written += len(data)
+            runs.append(run_path)
+
+        self.stats.add_pass('runs', bytes_read[0], bytes_written, len(runs),
+                            time.perf_counter() - start)
+        return runs
+
+    def _buffer_elements(self, fan_in: int) -> int:
+        """Размер буфера (в числах) на каждый вход и выход при слиянии"""
+        return max(1, self.memory_budget // (INT_SIZE * 4 * (fan_in + 1)))
+
+    def _read_run(self, run_path: str, buffer_elements: int,
+                  counter: List[int]) -> Iterator[int]:
+        """Буферизованное последовательное чтение прогона"""
+        with open(run_path, 'rb') as f:
+            while True:
+                data = f.read(buffer_elements * INT_SIZE)
+                if not data:
+                    break
+                counter[0] += len(data)
+                buffer = array(INT_TYPECODE)
+                buffer.frombytes(data)
+                yield from buffer
+
+    def _merge(self, runs: List[str], output_path: str, output_format: str) -> Tuple[int, int]:
+        """k-путевое слияние прогонов в один файл, возвращает (прочитано, записано)"""
+        buffer_elements = self._buffer_elements(len(runs))
+        bytes_read = [0]
+        bytes_written = 0
+
+        merged = heapq.merge(*(self._read_run(r, buffer_elements, bytes_read) for r in runs))
+
+        with open(output_path, 'wb') as out:
+            buffer = array(INT_TYPECODE)
+            for x in merged:
+                buffer.append(x)
+                if len(buffer) >= buffer_elements:
+                    bytes_written += self._write_buffer(out, buffer, output_format)
+                    buffer = array(INT_TYPECODE)
+            if buffer:
+                bytes_written += self._write_buffer(out, buffer, output_format)
+
+        for r in runs:
+            os.remove(r)
+        return bytes_read[0], bytes_written
+
+    @staticmethod
+    def _write_buffer(out, buffer: array, output_format: str) -> int:
+        """Запись буфера в файл, возвращает число записанных байт"""
+        if output_format == 'binary':
+            data = buffer.tobytes()
+        else:
+            data = ('\n'.join(map(str, buffer)) + '\n').encode()
+        out.write(data)
+        return len(data)
+
+    def _merge_pass(self, runs: List[str], work_dir: str, pass_number: int) -> List[str]:
+        """Промежуточный проход: слияние групп по max_fan_in прогонов"""
+        start = time.perf_counter()
+        total_read = total_written = 0
+        new_runs = []
+
+        for i in range(0, len(runs), self.max_fan_in):
+            run_path = os.path.join(work_dir, f"run_{pass_number}_{len(new_runs)}.bin")
+            bytes_read, bytes_written = self._merge(runs[i:i + self.max_fan_in],
+                                                    run_path, 'binary')
+            total_read += bytes_read
+            total_written += bytes_written
+            new_runs.append(run_path)
+
+        self.stats.add_pass(f'merge {pass_number}', total_read, total_written,
+                            len(new_runs), time.perf_counter() - start)
+        return new_runs
+
+    def _merge_to_output(self, runs: List[str], output_path: str, pass_number: int):
+        """Финальный проход: слияние оставшихся прогонов в выходной файл"""
+        start = time.perf_counter()
+        bytes_read, bytes_written = self._merge(runs, output_path, self.file_format)
+        self.stats.add_pass(f'merge {pass_number}', bytes_read, bytes_written, 1,
+                            time.perf_counter() - start)
+
+
+def external_sort(input_path: str, output_path: str, memory_budget: int = 256 * 2 ** 20,
+                  algorithm: str = 'integer_sort', file_format: str = 'binary',
+                  max_fan_in: int = 64) -> ExternalSortStats:
+    """Внешняя сортировка файла целых чисел (см. ExternalSorter)"""
+    sorter = ExternalSorter(memory_budget, algorithm, file_format, max_fan_in)
+    return sorter.sort_file(input_path, output_path)
+
+
+def read_int_file(path: str, file_format: str = 'binary') -> List[int]:
+    """Чтение всего файла целых чисел в список (только для небольших файлов)"""
+    with open(path, 'rb') as f:
+        if file_format == 'binary':
+            result = array(INT_TYPECODE)
+            result.frombytes(f.read())
+            return result.tolist()
+        return [int(line) for line in f if line.strip()]
+
+
+def write_int_file(path: str, values: List[int], file_format: str = 'binary'):
+    """Запись списка целых чисел в файл"""
+    with open(path, 'wb') as f:
+        ExternalSorter._write_buffer(f, array(INT_TYPECODE, values), file_format)
+
+
+def generate_int_file(path: str, size_bytes: int, file_format: str = 'binary',
+                      min_val: int = -2 ** 31, max_val: int = 2 ** 31,
+                      seed: int = None, block_elements: int = 2 ** 20) -> int:
+    """
+    Генерация файла случайных целых чисел размером около size_bytes блоками,
+    без удержания всего файла в памяти. Возвращает количество чисел.
+    """
+    rng = np.random.default_rng(seed)
+    written = count = 0
+
+    with open(path, 'wb') as f:
+        while written < size_bytes:
+            if file_format == 'binary':
+                n = min(block_elements, (size_bytes - written) // INT_SIZE) or 1
+                data = rng.integers(min_val, max_val, size=n, dtype=np.int64).tobytes()
+            else:
+                n = block_elements
+                block = rng.integers(min_val, max_val, size=n, dtype=np.int64)
+                data = ('\n'.join(map(str, block.tolist())) + '\n').encode()
+            f.write(data)
+            written += len(data)
+            count += n
+
+    return count
+
+
+def is_sorted_file(path: str, file_format: str = 'binary',
+                   buffer_elements: int = 2 ** 20) -> bool:
+    """Потоковая проверка упорядоченности файла"""
+    previous = None
+    with open(path, 'rb') as f:
+        if file_format == 'binary':
+            while True:
+                data = f.read(buffer_elements * INT_SIZE)
+                if not data:
+                    break
+                block = np.frombuffer(data, dtype=np.int64)
+                if np.any(block[1:] < block[:-1]):
+                    return False
+                if previous is not None and block[0] < previous:
+                    return False
+                previous = block[-1]
+        else:
+            for line in f:
+                if not line.strip():
+                    continue
+                value = int(line)
+                if previous is not None and value < previous:
+                    return False
+                previous = value
+    return True
+
+
+def benchmark_external_sort(sizes_gb: List[float], memory_budget_mb: int = 256,
+                            algorithm: str = 'integer_sort', file_format: str = 'binary',
+                            work_dir: str = None, seed: int = 42):
+    """Бенчмарк внешней сортировки на сгенерированных файлах заданного размера"""
+    print("Бенчмарк внешней сортировки")
+    print(f"Бюджет памяти: {memory_budget_mb} МБ, алгоритм: {algorithm}, "
+          f"формат: {file_format}")
+    print("=" * 66)
+
+    results = {}
+    with tempfile.TemporaryDirectory(dir=work_dir) as tmp:
+        for size_gb in sizes_gb:
+            input_path = os.path.join(tmp, f"input_{size_gb}gb.{file_format}")
+            output_path = os.path.join(tmp, f"output_{size_gb}gb.{file_format}")
+
+            start = time.perf_counter()
+            count = generate_int_file(input_path, int(size_gb * 2 ** 30), file_format,
+                                      seed=seed)
+            print(f"\nФайл {size_gb} ГБ: {count:,} чисел "
+                  f"(генерация {time.perf_counter() - start:.1f} с)")
+
+            sorter = ExternalSorter(memory_budget_mb * 2 ** 20, algorithm, file_format,
+                                    temp_dir=tmp)
+            start = time.perf_counter()
+            stats = sorter.sort_file(input_path, output_path)
+            elapsed = time.perf_counter() - start
+
+            stats.print_report()
+            print(f"Итого: {elapsed:.1f} с, {count / elapsed:,.0f} чисел/с, "
+                  f"отсортирован: {is_sorted_file(output_path, file_format)}")
+            results[size_gb] = (elapsed, stats)
+
+            os.remove(input_path)
+            os.remove(output_path)
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Бенчмарк внешней сортировки")
+    parser.add_argument('--sizes-gb', type=float, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--memory-mb', type=int, default=256)
+    parser.add_argument('--algorithm', default='integer_sort', choices=SORTING_ALGORITHMS)
+    parser.add_argument('--format', default='binary', choices=FILE_FORMATS)
+    parser.add_argument('--work-dir', default=None)
+    args = parser.parse_args()
+
+    benchmark_external_sort(args.sizes_gb, args.memory_mb, args.algorithm, args.format,
+                            args.work_dir)
\ No newline at end of file
@@ -0,0 +1,334 @@
+"""
+Дифференциальное фаззинг-тестирование алгоритмов сортировки
+
+Каждый алгоритм SORTING_ALGORITHMS сравнивается с встроенной sorted на
+тысячах массивов всех распределений generate_data.DATA_GENERATORS
+(размеры до 10^6) с вариантами: отрицательные числа, много дубликатов,
+крайние значения int64. Дополнительно проверяется, что вход не изменён и
+что сортировка с key=/reverse= устойчива (устойчивость обёртки _with_key
+заявлена для всех алгоритмов). Обёртка добавляет к ключу индекс и устойчива
+при любом алгоритме, поэтому алгоритмы, устойчивые сами по себе
+(STABLE_ALGORITHMS), ещё сортируют без key= записи, равные при равных
+значениях. Случаи выполняются в рабочих процессах, ошибочные входы
+сокращаются до минимального воспроизводящего примера.
+
+Использование:
+    python fuzz_sorts.py [--cases 2000] [--max-size 1000000] [--seed 0] [--workers N]
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from sorts import SORTING_ALGORITHMS
+from generate_data import DATA_GENERATORS
+from complexity import EXPECTED_COMPLEXITY
+
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+EXTREME_VALUES = [INT64_MIN, INT64_MIN + 1, -1, 0, 1, INT64_MAX - 1, INT64_MAX]
+
+# Варианты преобразования сгенерированного массива
+VARIANTS = ('plain', 'negative', 'duplicates', 'extremes')
+
+# Ограничения размера: квадратичные алгоритмы и вырожденные пары
+# (алгоритм, распределение) иначе занимают часы на массивах 10^6
+QUADRATIC_MAX_SIZE = 2000
+PAIR_MAX_SIZE = {('quick_sort', 'median3_killer'): 20000}
+# Проверка устойчивости сортирует кортежи - заметно медленнее чисел
+STABILITY_MAX_SIZE = 100000
+# Алгоритмы, устойчивые без обёртки key= (сравнивают элементы сами)
+STABLE_ALGORITHMS = ('bubble_sort', 'insertion_sort', 'merge_sort')
+# counting_sort выделяет массив на весь диапазон значений
+COUNTING_MAX_RANGE = 4 * 10 ** 6
+
+# Фиксированные граничные случаи, проверяемые в каждом прогоне
+EDGE_CASES = [
+    [],
+    [0],
+    [INT64_MAX],
+    [5, 5, 5, 5, 5],
+    [1, 2],
+    [2, 1],
+    [INT64_MAX, INT64_MIN, 0, -1, 1],
+    [INT64_MIN] * 3 + [INT64_MAX] * 3,
+    [-3, -1, -2, -1, -3],
+    [10 ** 5, -10 ** 5, 0, 1, -1],
+]
+
+
+def size_cap(algo_name: str, data_type: str, max_size: int) -> int:
+    """Наибольший размер массива для алгоритма на данном распределении"""
+    cap = max_size
+    if EXPECTED_COMPLEXITY.get(algo_name) == 'n^2':
+        cap = min(cap, QUADRATIC_MAX_SIZE)
+    return min(cap, PAIR_MAX_SIZE.get((algo_name, data_type), cap))
+
+
+def applicable(algo_name: str, arr: List[int]) -> bool:
+    """Можно ли запускать алгоритм на массиве (ограничения по памяти)"""
+    if algo_name == 'counting_sort' and arr:
+        return max(arr) - min(arr) <= COUNTING_MAX_RANGE
+    return True
+
+
+def make_cases(count: int, max_size: int, seed: int = 0) -> List[Dict]:
+    """
+    Описания случайных случаев: распределение, размер, вариант, disorder
+
+    Размеры распределены лог-равномерно в [1, max_size]: большинство
+    случаев малые, но регулярно встречаются массивы порядка max_size.
+    Сами массивы строятся в рабочих процессах по зерну случая.
+    """
+    rng = np.random.default_rng(seed)
+    data_types = list(DATA_GENERATORS)
+    cases = []
+    for index in range(count):
+        cases.append({
+            'id': index,
+            'seed': int(rng.integers(0, 2 ** 32)),
+            'data_type': data_types[index % len(data_types)],
+            'size': int(10 ** rng.uniform(0, math.log10(max(1, max_size)))),
+            'variant': VARIANTS[int(rng.integers(0, len(VARIANTS)))],
+            'disorder': float(rng.uniform(0, 0.5)),
+            'reverse': bool(rng.integers(0, 2))
+        })
+    return cases
+
+
+def case_array(case: Dict) -> List[int]:
+    """Массив случая (детерминированно по его зерну)"""
+    rng = np.random.default_rng(case['seed'])
+    arr = DATA_GENERATORS[case['data_type']](case['size'], rng, case['disorder'])
+    arr = np.asarray(arr, dtype=np.int64)
+
+    variant = case['variant']
+    if variant == 'negative':
+        arr = arr - int(arr.max(initial=0)) // 2 - 1
+    elif variant == 'duplicates':
+        arr = arr % int(rng.integers(1, 8))
+    elif variant == 'extremes':
+        return [EXTREME_VALUES[v] for v in (arr % len(EXTREME_VALUES)).tolist()]
+    return arr.tolist()
+
+
+class KeyRecord:
+    """Запись, сравниваемая только по значению: позиция равенств не разрешает"""
+
+    __slots__ = ('value', 'position')
+
+    def __init__(self, value: int, position: int):
+        self.value = value
+        self.position = position
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __lt__(self, other):
+        return self.value < other.value
+
+    def __le__(self, other):
+        return self.value <= other.value
+
+    def __gt__(self, other):
+        return self.value > other.value
+
+    def __repr__(self):
+        return f"KeyRecord({self.value}, {self.position})"
+
+
+def check_algorithm(algo_name: str, arr: List[int], reverse: bool = False,
+                    check_stability: bool = True) -> Optional[str]:
+    """
+    Проверка одного алгоритма на массиве
+
+    Returns:
+        None при успехе, иначе описание ошибки
+    """
+    algo_func = SORTING_ALGORITHMS[algo_name]
+    original = list(arr)
+    try:
+        result = algo_func(arr)
+    except Exception as e:
+        return f"исключение {type(e).__name__}: {e}"
+    if arr != original:
+        return "входной массив изменён"
+    if result != sorted(original):
+        return "неверный порядок"
+
+    if check_stability:
+        # Пары (значение, позиция): при равных значениях позиции
+        # должны идти в исходном порядке и при reverse=True
+        records = [(value, i) for i, value in enumerate(original)]
+        try:
+            result = algo_func(records, key=lambda r: r[0], reverse=reverse)
+        except Exception as e:
+            return f"исключение с key= {type(e).__name__}: {e}"
+        if result != sorted(records, key=lambda r: r[0], reverse=reverse):
+            return "неустойчивая сортировка с key=" + (", reverse=True" if reverse else "")
+
+        if algo_name in STABLE_ALGORITHMS:
+            # Без key= алгоритм сравнивает записи сам: равные по значению
+            # должны сохранить исходный порядок позиций
+            records = [KeyRecord(value, i) for i, value in enumerate(original)]
+            try:
+                result = algo_func(records)
+            except Exception as e:
+                return f"исключение на записях {type(e).__name__}: {e}"
+            if [r.position for r in result] != [r.position for r in sorted(records)]:
+                return "неустойчивая сортировка записей без key="
+    return None
+
+
+def _run_case(case: Dict, algorithms: List[str], max_size: int) -> List[Dict]:
+    """Рабочий процесс: все применимые алгоритмы на массиве случая"""
+    failures = []
+    arr = case_array(case)
+    for algo_name in algorithms:
+        if len(arr) > size_cap(algo_name, case['data_type'], max_size) \
+                or not applicable(algo_name, arr):
+            continue
+        error = check_algorithm(algo_name, arr, case['reverse'],
+                                check_stability=len(arr) <= STABILITY_MAX_SIZE)
+        if error is not None:
+            failures.append({'algorithm': algo_name, 'case': case, 'error': error})
+    return failures
+
+
+def shrink(arr: List[int], fails: Callable[[List[int]], bool]) -> List[int]:
+    """
+    Сокращение входа, на котором fails(arr) истинно
+
+    Сначала удаляются всё меньшие куски массива (дельта-отладка), затем
+    значения заменяются плотными рангами и по одному уменьшаются по модулю.
+    """
+    # Удаление кусков: от половины массива до отдельных элементов
+    chunk = len(arr) // 2
+    while chunk >= 1:
+        i = 0
+        while i < len(arr):
+            candidate = arr[:i] + arr[i + chunk:]
+            if fails(candidate):
+                arr = candidate
+            else:
+                i += chunk
+        chunk //= 2
+
+    # Значения: плотные ранги, затем поэлементное уменьшение
+    ranks = {value: rank for rank, value in enumerate(sorted(set(arr)))}
+    candidate = [ranks[value] for value in arr]
+    if candidate != arr and fails(candidate):
+        arr = candidate
+    for i in range(len(arr)):
+        for smaller in (0, arr[i] // 2):
+            if smaller != arr[i]:
+                candidate = arr[:i] + [smaller] + arr[i + 1:]
+                if fails(candidate):
+                    arr = candidate
+                    break
+    return arr
+
+
+def run_fuzz(cases: int = 2000, max_size: int = 10 ** 6, seed: int = 0,
+             workers: int = None, algorithms: List[str] = None,
+             verbose: bool = True) -> List[Dict]:
+    """
+    Фаззинг алгоритмов: граничные случаи и cases случайных массивов
+
+    Returns:
+        List[Dict]: ошибки с полями algorithm, case, error и reproducer
+        (минимальный воспроизводящий массив)
+    """
+    if algorithms is None:
+        algorithms = list(SORTING_ALGORITHMS)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    start = time.perf_counter()
+    failures = []
+
+    for arr in EDGE_CASES:
+        for algo_name in algorithms:
+            if not applicable(algo_name, arr):
+                continue
+            for reverse in (False, True):
+                error = check_algorithm(algo_name, arr, reverse)
+                if error is not None:
+                    failures.append({'algorithm': algo_name, 'error': error,
+                                     'case': {'edge': arr, 'reverse': reverse}})
+
+    # Сначала крупные случаи - меньше простой пула в конце
+    random_cases = sorted(make_cases(cases, max_size, seed), key=lambda c: c['size'],
+                          reverse=True)
+    done = 0
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_run_case, case, algorithms, max_size) for case in random_cases]
+            for future in as_completed(futures):
+                failures.extend(future.result())
+                done += 1
+                if verbose and done % 100 == 0:
+                    print(f"  выполнено {done}/{cases}")
+    else:
+        for case in random_cases:
+            failures.extend(_run_case(case, algorithms, max_size))
+            done += 1
+            if verbose and done % 100 == 0:
+                print(f"  выполнено {done}/{cases}")
+
+    for failure in failures:
+        case = failure['case']
+        arr = case['edge'] if 'edge' in case else case_array(case)
+        reverse = case['reverse']
+        algo_name = failure['algorithm']
+        failure['reproducer'] = shrink(
+            arr, lambda a: applicable(algo_name, a)
+            and check_algorithm(algo_name, a, reverse) is not None)
+
+    if verbose:
+        print_report(failures, cases, time.perf_counter() - start)
+    return failures
+
+
+def print_report(failures: List[Dict], cases: int, elapsed: float):
+    """Отчёт о прогоне фаззинга"""
+    print("\n" + "=" * 80)
+    print(f"ФАЗЗИНГ: {cases} случайных случаев + {len(EDGE_CASES)} граничных, "
+          f"{elapsed:.1f} с")
+    print("=" * 80)
+    if not failures:
+        print("Ошибок не найдено")
+        return
+
+    for failure in failures:
+        case = failure['case']
+        source = "граничный случай" if 'edge' in case else \
+            f"{case['data_type']}/{case['variant']}, n={case['size']}, seed={case['seed']}"
+        print(f"\n✗ {failure['algorithm']}: {failure['error']}")
+        print(f"  вход: {source}, reverse={case['reverse']}")
+        print(f"  минимальный пример: {failure['reproducer']}")
+    print(f"\nОшибок: {len(failures)}")
+
+
+def main(argv: List[str] = None) -> int:
+    """Командная строка; возвращает 1 при найденных ошибках"""
+    parser = argparse.ArgumentParser(description="Дифференциальный фаззинг сортировок")
+    parser.add_argument('--cases', type=int, default=2000)
+    parser.add_argument('--max-size', type=int, default=10 ** 6)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--algorithms', nargs='+', choices=SORTING_ALGORITHMS, default=None)
+    args = parser.parse_args(argv)
+
+    failures = run_fuzz(args.cases, args.max_size, args.seed, args.workers, args.algorithms)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
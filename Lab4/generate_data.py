@@ -1,15 +1,207 @@
 """
 Генерация тестовых данных различных типов для тестирования сортировок
+
+Генераторы векторизованы на numpy.random.Generator. При заданном seed
+каждый набор (тип данных, размер) получает собственный независимый поток
+случайных чисел, поэтому результат воспроизводим и не зависит от того,
+какие ещё наборы генерируются. С cache_dir наборы сохраняются в .npy и
+при повторных запусках загружаются через отображение в память.
 """
 
-import random
-from typing import List, Dict
+import bisect
+import math
+import os
+import zlib
+from typing import List, Dict, Union
 import numpy as np
 
+# Версия формата кэша: увеличивается при изменении генераторов,
+# чтобы не загружать устаревшие наборы
+CACHE_VERSION = 1
+
+SeedLike = Union[None, int, np.random.Generator]
+
+
+def _rng(seed: SeedLike = None) -> np.random.Generator:
+    """Генератор случайных чисел из seed (или уже готовый генератор)"""
+    if isinstance(seed, np.random.Generator):
+        return seed
+    return np.random.default_rng(seed)
+
+
+# Все генераторы имеют вид (size, rng, disorder) -> np.ndarray, где disorder -
+# степень беспорядка в [0, 1] (больше - меньше структуры); смысл параметра
+# для каждого распределения описан в его документации
+
+def random_array(size: int, rng: np.random.Generator, disorder: float = None,
+                 min_val: int = 0, max_val: int = 10000) -> np.ndarray:
+    """Массив случайных чисел из [min_val, max_val] (disorder не используется)"""
+    return rng.integers(min_val, max_val, size=size, endpoint=True, dtype=np.int64)
+
+
+def sorted_array(size: int, rng: np.random.Generator = None,
+                 disorder: float = None) -> np.ndarray:
+    """Отсортированный массив 0..size-1 (disorder не используется)"""
+    return np.arange(size, dtype=np.int64)
+
+
+def reversed_array(size: int, rng: np.random.Generator = None,
+                   disorder: float = None) -> np.ndarray:
+    """Обратно отсортированный массив size..1 (disorder не используется)"""
+    return np.arange(size, 0, -1, dtype=np.int64)
+
+
+def _swap_random_pairs(arr: np.ndarray, rng: np.random.Generator, fraction: float) -> np.ndarray:
+    """Обмен size * fraction непересекающихся случайных пар на месте"""
+    size = len(arr)
+    num_swaps = min(int(size * fraction), size // 2)
+    if num_swaps:
+        # Различные позиции: пары обменов не пересекаются
+        positions = rng.choice(size, 2 * num_swaps, replace=False)
+        i, j = positions[:num_swaps], positions[num_swaps:]
+        arr[i], arr[j] = arr[j], arr[i]
+    return arr
+
+
+def almost_sorted_array(size: int, rng: np.random.Generator,
+                        swap_percentage: float = 0.05) -> np.ndarray:
+    """
+    Отсортированный массив с size * swap_percentage обменами случайных пар
+    disorder = swap_percentage - доля обменов
+    """
+    return _swap_random_pairs(np.arange(size, dtype=np.int64), rng, swap_percentage)
+
+
+def few_unique_array(size: int, rng: np.random.Generator,
+                     disorder: float = 0.001) -> np.ndarray:
+    """
+    Случайный массив с малым числом различных значений
+    disorder - доля различных значений: ceil(size * disorder), не меньше 2
+    (много равных элементов - нагрузка на трёхпутевое разбиение quick_sort)
+    """
+    unique = max(2, math.ceil(size * disorder))
+    return rng.integers(0, unique, size=size, dtype=np.int64)
+
+
+def organ_pipe_array(size: int, rng: np.random.Generator,
+                     disorder: float = 0.0) -> np.ndarray:
+    """
+    "Органные трубы": возрастание до середины, затем убывание
+    disorder - доля случайных обменов пар поверх формы
+    """
+    half = (size + 1) // 2
+    arr = np.concatenate([np.arange(half, dtype=np.int64),
+                          np.arange(size - half, dtype=np.int64)[::-1]])
+    return _swap_random_pairs(arr, rng, disorder)
+
+
+def sawtooth_array(size: int, rng: np.random.Generator,
+                   disorder: float = 0.001) -> np.ndarray:
+    """
+    "Пила": повторяющиеся возрастающие отрезки 0..period-1
+    disorder - доля зубцов: ceil(size * disorder) зубцов
+    """
+    teeth = max(1, math.ceil(size * disorder))
+    period = max(1, math.ceil(size / teeth))
+    return np.arange(size, dtype=np.int64) % period
+
 
-def generate_random_array(size: int, min_val: int = 0, max_val: int = 10000) -> List[int]:
+def zipf_array(size: int, rng: np.random.Generator, disorder: float = 0.5,
+               max_val: int = 10000) -> np.ndarray:
+    """
+    Значения с распределением Ципфа (частые повторы малых значений)
+    disorder задаёт показатель a = 3 - 2 * disorder (не меньше 1.01):
+    меньше disorder - сильнее перекос и больше дубликатов.
+    Значения ограничены max_val, чтобы диапазон совпадал со случайным массивом.
+    """
+    exponent = max(1.01, 3.0 - 2.0 * disorder)
+    return np.minimum(rng.zipf(exponent, size=size), max_val).astype(np.int64)
+
+
+# Ограничение числа адверсариальных шагов: глубина рекурсии quick_sort
+# на таком массиве равна числу шагов и не должна превысить лимит рекурсии
+MEDIAN3_KILLER_MAX_STEPS = 400
+
+
+def median3_killer_array(size: int, rng: np.random.Generator,
+                         disorder: float = 0.1) -> np.ndarray:
+    """
+    Вход, на котором quick_sort (медиана из первого, среднего и последнего,
+    устойчивое разбиение списками) делит массив наихудшим образом
+
+    Построение повторяет работу quick_sort на позициях: на каждом шаге
+    первому и среднему элементу текущего подмассива назначаются два
+    наименьших ещё не занятых значения. Опорным становится второе из них,
+    и в правую часть уходят все элементы, кроме двух. Оставшиеся позиции
+    получают случайную перестановку больших значений.
+
+    disorder - доля массива в адверсариальной части: size * disorder / 2
+    шагов (не больше MEDIAN3_KILLER_MAX_STEPS), работа quick_sort на этих
+    шагах квадратична.
+    """
+    steps = min(int(size * disorder) // 2, MEDIAN3_KILLER_MAX_STEPS, max(0, (size - 1) // 2))
+    values = np.empty(size, dtype=np.int64)
+
+    # Занятых позиций не больше 2 * MEDIAN3_KILLER_MAX_STEPS, поэтому k-я
+    # свободная позиция ищется проходом по их отсортированному списку:
+    # O(steps^2) вместо дерева над всеми size позициями
+    occupied = []
+
+    def kth_free(k: int) -> int:
+        pos = k
+        for taken in occupied:
+            if taken > pos:
+                break
+            pos += 1
+        return pos
+
+    free = size
+    for step_index in range(steps):
+        first = kth_free(0)
+        middle = kth_free(free // 2)
+        values[first] = 2 * step_index
+        values[middle] = 2 * step_index + 1
+        bisect.insort(occupied, first)
+        bisect.insort(occupied, middle)
+        free -= 2
+
+    mask = np.ones(size, dtype=bool)
+    mask[occupied] = False
+    values[mask] = 2 * steps + rng.permutation(free)
+    return values
+
+
+def sorted_random_tail_array(size: int, rng: np.random.Generator,
+                             disorder: float = 0.1) -> np.ndarray:
+    """
+    Отсортированный отрезок, за которым следует случайный "хвост"
+    (типично для дописывания новых записей к упорядоченным данным)
+    disorder - доля случайного хвоста
+    """
+    tail = min(size, int(size * disorder))
+    head = np.arange(size - tail, dtype=np.int64)
+    return np.concatenate([head, rng.integers(0, max(1, size), size=tail, dtype=np.int64)])
+
+
+# Генераторы наборов данных по имени: (size, rng, disorder) -> np.ndarray
+DATA_GENERATORS = {
+    'random': random_array,
+    'sorted': sorted_array,
+    'reversed': reversed_array,
+    'almost_sorted': almost_sorted_array,
+    'few_unique': few_unique_array,
+    'organ_pipe': organ_pipe_array,
+    'sawtooth': sawtooth_array,
+    'zipf': zipf_array,
+    'median3_killer': median3_killer_array,
+    'sorted_random_tail': sorted_random_tail_array
+}
+
+
+def generate_random_array(size: int, min_val: int = 0, max_val: int = 10000,
+                          seed: SeedLike = None) -> List[int]:
     """Генерация массива случайных чисел"""
-    return [random.randint(min_val, max_val) for _ in range(size)]
+    return random_array(size, _rng(seed), min_val=min_val, max_val=max_val).tolist()
 
 
 def generate_sorted_array(size: int) -> List[int]:
@@ -22,42 +214,81 @@ def generate_reversed_array(size: int) -> List[int]:
     return list(range(size, 0, -1))
 
 
-def generate_almost_sorted_array(size: int, swap_percentage: float = 0.05) -> List[int]:
+def generate_almost_sorted_array(size: int, swap_percentage: float = 0.05,
+                                 seed: SeedLike = None) -> List[int]:
     """Генерация почти отсортированного массива"""
-    arr = list(range(size))
+    return almost_sorted_array(size, _rng(seed), swap_percentage).tolist()
 
-    # Количество пар для обмена
-    num_swaps = int(size * swap_percentage)
 
-    for _ in range(num_swaps):
-        i, j = random.sample(range(size), 2)
-        arr[i], arr[j] = arr[j], arr[i]
+def _dataset_rng(data_type: str, size: int, seed: int) -> np.random.Generator:
+    """Независимый поток случайных чисел для набора (тип, размер)"""
+    return np.random.default_rng([seed, zlib.crc32(data_type.encode()), size])
 
-    return arr
 
+def load_dataset(data_type: str, size: int, seed: int = None, cache_dir: str = None,
+                 disorder: float = None) -> np.ndarray:
+    """
+    Набор данных data_type размера size
 
-def generate_test_datasets(sizes: List[int] = None) -> Dict[str, Dict[int, List[int]]]:
+    С seed и cache_dir набор берётся из
+    cache_dir/<тип>_n<размер>[_d<disorder>]_s<seed>_v<версия>.npy
+    (только чтение, отображение в память), а при отсутствии генерируется и
+    сохраняется туда. Без seed набор каждый раз генерируется заново.
+    disorder=None - значение по умолчанию для данного распределения.
+    """
+    generator = DATA_GENERATORS[data_type]
+    args = () if disorder is None else (disorder,)
+    if seed is None:
+        return generator(size, _rng(), *args)
+
+    if cache_dir is None:
+        return generator(size, _dataset_rng(data_type, size, seed), *args)
+
+    suffix = '' if disorder is None else f"_d{disorder:g}"
+    path = os.path.join(cache_dir,
+                        f"{data_type}_n{size}{suffix}_s{seed}_v{CACHE_VERSION}.npy")
+    if not os.path.exists(path):
+        os.makedirs(cache_dir, exist_ok=True)
+        arr = generator(size, _dataset_rng(data_type, size, seed), *args)
+        # Запись во временный файл и переименование: параллельные запуски
+        # никогда не увидят недописанный набор
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.save(f, arr)
+        os.replace(tmp_path, path)
+    return np.load(path, mmap_mode='r')
+
+
+def generate_test_datasets(sizes: List[int] = None, seed: int = None, cache_dir: str = None,
+                           as_numpy: bool = False, data_types: List[str] = None,
+                           disorder: Dict[str, float] = None) -> Dict[str, Dict[int, List[int]]]:
     """
     Генерация полного набора тестовых данных
 
+    Args:
+        seed: зерно для воспроизводимых наборов (None - случайные)
+        cache_dir: каталог кэша .npy (используется только вместе с seed)
+        as_numpy: вернуть массивы numpy (при кэше - отображённые в память)
+            вместо списков
+        data_types: подмножество DATA_GENERATORS (по умолчанию - все)
+        disorder: степень беспорядка по типам данных, {тип: значение}
+
     Returns:
-        Dict с ключами: 'random', 'sorted', 'reversed', 'almost_sorted'
+        Dict с ключами - именами распределений из DATA_GENERATORS
     """
     if sizes is None:
         sizes = [100, 500, 1000, 3000, 5000, 7000, 10000]
+    if data_types is None:
+        data_types = list(DATA_GENERATORS)
+    if disorder is None:
+        disorder = {}
 
-    datasets = {
-        'random': {},
-        'sorted': {},
-        'reversed': {},
-        'almost_sorted': {}
-    }
+    datasets = {data_type: {} for data_type in data_types}
 
     for size in sizes:
-        datasets['random'][size] = generate_random_array(size)
-        datasets['sorted'][size] = generate_sorted_array(size)
-        datasets['reversed'][size] = generate_reversed_array(size)
-        datasets['almost_sorted'][size] = generate_almost_sorted_array(size)
+        for data_type in data_types:
+            arr = load_dataset(data_type, size, seed, cache_dir, disorder.get(data_type))
+            datasets[data_type][size] = arr if as_numpy else arr.tolist()
 
     return datasets
 
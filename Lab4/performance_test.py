@@ -2,21 +2,57 @@
 Эмпирический анализ производительности алгоритмов сортировки
 """
 
+import os
 import time
 import timeit
 import sys
-from typing import Dict, List
-from sorts import SORTING_ALGORITHMS
-from generate_data import generate_test_datasets
+import tracemalloc
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Iterable, Tuple
+from sorts import SORTING_ALGORITHMS, SortProbe, nth_element, partial_sort, top_k, quick_sort
+from generate_data import generate_test_datasets, load_dataset
+from complexity import predict_time, fit_complexity, complexity_mismatch, EXPECTED_COMPLEXITY
+from results_store import save_run
+from profiling import profile_cell, PROFILERS, DEFAULT_PROFILE_DIR
 
 
 class PerformanceTester:
     """Класс для тестирования производительности алгоритмов сортировки"""
 
-    def __init__(self):
+    def __init__(self, seed: int = None, cache_dir: str = None,
+                 data_types: List[str] = None, disorder: Dict[str, float] = None):
+        """
+        Args:
+            seed: зерно генерации наборов данных - одинаковые входы во всех прогонах
+            cache_dir: каталог кэша наборов .npy (используется вместе с seed)
+            data_types: распределения из generate_data.DATA_GENERATORS
+                (по умолчанию - все зарегистрированные)
+            disorder: степень беспорядка по распределениям, {тип: значение}
+        """
+        self.seed = seed
+        self.cache_dir = cache_dir
+        self.data_types = data_types
+        self.disorder = disorder
         self.results = {}
+        self.selection_results = {}
+        self.operation_counts = {}
+        # Пометки ячеек бюджетного режима: 'downsampled' / 'extrapolated'
+        self.cell_status = {}
+        # Времена всех повторов каждой ячейки - для доверительных интервалов
+        self.samples = {}
+        # Пиковая память (байт, tracemalloc) и число вспомогательных списков
+        self.memory_results = {}
+        self.allocation_counts = {}
+        # Параметры последнего прогона (сохраняются вместе с результатами)
+        self.run_config = {}
         self.system_info = self._get_system_info()
 
+    def _datasets(self, sizes: List[int]) -> Dict[str, Dict[int, List[int]]]:
+        """Наборы данных прогона с учётом seed, кэша и выбранных распределений"""
+        return generate_test_datasets(sizes, self.seed, self.cache_dir,
+                                      data_types=self.data_types, disorder=self.disorder)
+
     def _get_system_info(self) -> Dict:
         """Получение информации о системе для воспроизводимости"""
         return {
@@ -25,18 +61,43 @@ class PerformanceTester:
             'processor': 'Unknown'  # Можно добавить psutil для детальной информации
         }
 
-    def measure_time(self, algo_func, arr: List[int], iterations: int = 1) -> float:
+    def measure_time(self, algo_func, arr: List[int], iterations: int = 1,
+                     repeat: int = 3) -> float:
         """Измерение времени выполнения с использованием timeit"""
+        return min(self.measure_samples(algo_func, arr, iterations, repeat))  # Берем лучшее время
+
+    def measure_samples(self, algo_func, arr: List[int], iterations: int = 1,
+                        repeat: int = 3) -> List[float]:
+        """Время одного прогона в каждом из repeat повторов timeit"""
 
         def sort_wrapper():
             return algo_func(arr.copy())
 
         timer = timeit.Timer(sort_wrapper)
-        times = timer.repeat(repeat=3, number=iterations)
-        return min(times) / iterations  # Берем лучшее время
+        times = timer.repeat(repeat=repeat, number=iterations)
+        return [t / iterations for t in times]
+
+    def count_operations(self, algo_func, arr: List[int]) -> Dict[str, int]:
+        """
+        Подсчёт сравнений, обменов, перемещений, глубины рекурсии и
+        вспомогательных выделений памяти отдельным прогоном с SortProbe
+        (замеры времени выполняются без счётчиков)
+        """
+        probe = SortProbe()
+        algo_func(arr.copy(), probe=probe)
+        return probe.as_dict()
+
+    def run_performance_tests(self, sizes: List[int] = None, iterations: int = 1,
+                              count_operations: bool = True, repeat: int = 3):
+        """
+        Запуск полного тестирования производительности
 
-    def run_performance_tests(self, sizes: List[int] = None, iterations: int = 1):
-        """Запуск полного тестирования производительности"""
+        Args:
+            count_operations: дополнительно подсчитать операции алгоритмов
+                (self.operation_counts, та же структура, что и self.results)
+            repeat: число повторов замера (в результатах - лучший,
+                все повторы - в self.samples)
+        """
         if sizes is None:
             sizes = [100, 500, 1000, 3000, 5000]
 
@@ -47,57 +108,546 @@ class PerformanceTester:
         print("=" * 60)
 
         # Генерация тестовых данных
-        datasets = generate_test_datasets(sizes)
-        self.results = {}
+        datasets = self._datasets(sizes)
+        self._reset_results('sequential', sizes, iterations, repeat)
 
         for data_type, sizes_data in datasets.items():
             print(f"\nТип данных: {data_type.upper()}")
             print("-" * 40)
 
             self.results[data_type] = {}
+            self.operation_counts[data_type] = {}
+            self.samples[data_type] = {}
 
             for algo_name, algo_func in SORTING_ALGORITHMS.items():
                 print(f"  {algo_name}:", end=" ", flush=True)
                 algo_times = []
+                algo_counts = []
+                algo_samples = []
 
                 for size, test_array in sizes_data.items():
-                    time_taken = self.measure_time(algo_func, test_array, iterations)
+                    samples = self.measure_samples(algo_func, test_array, iterations, repeat)
+                    time_taken = min(samples)
                     algo_times.append((size, time_taken))
+                    algo_samples.append((size, samples))
+                    if count_operations:
+                        algo_counts.append((size, self.count_operations(algo_func, test_array)))
                     print(f"{size}({time_taken:.4f}s)", end=" ", flush=True)
 
                 self.results[data_type][algo_name] = algo_times
+                self.samples[data_type][algo_name] = algo_samples
+                if count_operations:
+                    self.operation_counts[data_type][algo_name] = algo_counts
                 print()  # новая строка
 
         return self.results
 
-    def print_summary(self):
+    def run_performance_tests_parallel(self, sizes: List[int] = None, iterations: int = 1,
+                                       count_operations: bool = True, workers: int = None,
+                                       serial_algorithms: Iterable[str] = (),
+                                       serial_max_size: int = 0, pin_cores: bool = True,
+                                       repeat: int = 3):
+        """
+        Параллельный запуск матрицы тип данных × алгоритм × размер
+
+        Независимые ячейки распределяются по пулу процессов, каждый рабочий
+        процесс закрепляется за своим ядром (Linux, os.sched_setaffinity),
+        результаты печатаются по мере готовности ячеек. self.results и
+        self.operation_counts заполняются в той же структуре и порядке,
+        что и в run_performance_tests.
+
+        Args:
+            workers: число процессов (по умолчанию - число доступных ядер)
+            serial_algorithms: алгоритмы, замеряемые последовательно в основном
+                процессе после завершения пула (без конкуренции за кэш и память)
+            serial_max_size: ячейки размером не больше этого тоже замеряются
+                последовательно - короткие замеры наиболее чувствительны к шуму
+            pin_cores: закреплять рабочие процессы за ядрами
+        """
+        if sizes is None:
+            sizes = [100, 500, 1000, 3000, 5000]
+
+        cores = _available_cores()
+        workers = min(workers or len(cores), len(cores))
+        serial_algorithms = set(serial_algorithms)
+
+        print("Параллельный запуск тестов производительности...")
+        print(f"Размеры массивов: {sizes}")
+        print(f"Процессов: {workers}, ядра: {cores[:workers]}")
+        print("=" * 60)
+
+        datasets = self._datasets(sizes)
+        parallel_cells, serial_cells = [], []
+        for data_type, sizes_data in datasets.items():
+            for algo_name in SORTING_ALGORITHMS:
+                for size, test_array in sizes_data.items():
+                    cell = (data_type, algo_name, size, test_array, iterations, repeat,
+                            count_operations)
+                    if algo_name in serial_algorithms or size <= serial_max_size:
+                        serial_cells.append(cell)
+                    else:
+                        parallel_cells.append(cell)
+
+        # Сначала самые крупные ячейки - меньше простой пула в конце
+        parallel_cells.sort(key=lambda cell: cell[2], reverse=True)
+
+        finished = {}
+        if parallel_cells:
+            context = multiprocessing.get_context()
+            core_queue = context.Queue()
+            for core in cores[:workers]:
+                core_queue.put(core)
+            initializer = _pin_worker_to_core if pin_cores and hasattr(os, 'sched_setaffinity') \
+                else None
+
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                     initializer=initializer,
+                                     initargs=(core_queue,) if initializer else ()) as pool:
+                futures = [pool.submit(_run_cell, *cell) for cell in parallel_cells]
+                for future in as_completed(futures):
+                    self._record_cell(finished, future.result())
+
+        for cell in serial_cells:
+            self._record_cell(finished, _run_cell(*cell))
+
+        self._reset_results('parallel', sizes, iterations, repeat)
+        for data_type, sizes_data in datasets.items():
+            self.results[data_type] = {}
+            self.operation_counts[data_type] = {}
+            self.samples[data_type] = {}
+            for algo_name in SORTING_ALGORITHMS:
+                cells = [finished[(data_type, algo_name, size)] for size in sizes_data]
+                self.results[data_type][algo_name] = [(size, min(t)) for size, t, _ in cells]
+                self.samples[data_type][algo_name] = [(size, t) for size, t, _ in cells]
+                if count_operations:
+                    self.operation_counts[data_type][algo_name] = \
+                        [(size, ops) for size, _, ops in cells]
+
+        return self.results
+
+    def run_performance_tests_budgeted(self, sizes: List[int] = None, iterations: int = 1,
+                                       cell_budget: float = 10.0, total_budget: float = None,
+                                       count_operations: bool = False):
+        """
+        Запуск с ограничением времени на ячейку и на весь прогон
+
+        Размеры перебираются по возрастанию. По выполненным размерам каждого
+        алгоритма подбирается степенная модель t = c * n^b (complexity.py),
+        и прежде чем замерять очередной размер, прогнозируется его стоимость:
+          - прогноз одного прогона больше cell_budget или остатка total_budget -
+            ячейка пропускается, в результаты пишется прогноз ('extrapolated');
+          - полный замер (repeat=3) не укладывается в cell_budget - выполняется
+            один прогон вместо трёх ('downsampled');
+          - иначе ячейка замеряется как обычно.
+        Структура self.results та же, пометки ячеек - в self.cell_status.
+        """
+        if sizes is None:
+            sizes = [100, 500, 1000, 3000, 5000]
+        sizes = sorted(sizes)
+
+        print("Запуск тестов производительности с бюджетом времени...")
+        print(f"Размеры массивов: {sizes}")
+        print(f"Бюджет на ячейку: {cell_budget} с, общий бюджет: "
+              f"{total_budget if total_budget is not None else 'без ограничения'}")
+        print("=" * 60)
+
+        datasets = self._datasets(sizes)
+        self._reset_results('budgeted', sizes, iterations, 3)
+        self.run_config.update(cell_budget=cell_budget, total_budget=total_budget)
+        start = time.perf_counter()
+
+        for data_type, sizes_data in datasets.items():
+            print(f"\nТип данных: {data_type.upper()}")
+            print("-" * 40)
+
+            self.results[data_type] = {}
+            self.operation_counts[data_type] = {}
+            self.cell_status[data_type] = {}
+            self.samples[data_type] = {}
+
+            for algo_name, algo_func in SORTING_ALGORITHMS.items():
+                print(f"  {algo_name}:", end=" ", flush=True)
+                algo_times = []
+                algo_counts = []
+                algo_samples = []
+                status = {}
+                measured_sizes, measured_times = [], []
+
+                for size in sizes:
+                    test_array = sizes_data[size]
+                    remaining = None if total_budget is None else \
+                        total_budget - (time.perf_counter() - start)
+                    predicted = predict_time(measured_sizes, measured_times, size) \
+                        if measured_sizes else 0.0
+                    run_cost = predicted * iterations
+
+                    if run_cost > cell_budget or (remaining is not None and run_cost > remaining):
+                        algo_times.append((size, predicted))
+                        status[size] = 'extrapolated'
+                        print(f"{size}(~{predicted:.4f}s*)", end=" ", flush=True)
+                        continue
+
+                    repeat = 3
+                    if 3 * run_cost > cell_budget or \
+                            (remaining is not None and 3 * run_cost > remaining):
+                        repeat = 1
+                        status[size] = 'downsampled'
+
+                    samples = self.measure_samples(algo_func, test_array, iterations, repeat)
+                    time_taken = min(samples)
+                    algo_times.append((size, time_taken))
+                    algo_samples.append((size, samples))
+                    measured_sizes.append(size)
+                    measured_times.append(time_taken)
+                    if count_operations:
+                        algo_counts.append((size, self.count_operations(algo_func, test_array)))
+                    print(f"{size}({time_taken:.4f}s)", end=" ", flush=True)
+
+                self.results[data_type][algo_name] = algo_times
+                self.cell_status[data_type][algo_name] = status
+                self.samples[data_type][algo_name] = algo_samples
+                if count_operations:
+                    self.operation_counts[data_type][algo_name] = algo_counts
+                print()
+
+        print(f"\nОбщее время: {time.perf_counter() - start:.1f} с")
+        return self.results
+
+    def _reset_results(self, mode: str, sizes: List[int], iterations: int, repeat: int):
+        """Очистка результатов перед новым прогоном и запись его параметров"""
+        self.results = {}
+        self.operation_counts = {}
+        self.cell_status = {}
+        self.samples = {}
+        self.run_config = {
+            'mode': mode,
+            'sizes': list(sizes),
+            'iterations': iterations,
+            'repeat': repeat,
+            'seed': self.seed,
+            'disorder': dict(self.disorder or {})
+        }
+
+    @staticmethod
+    def _record_cell(finished: Dict, cell_result: Tuple):
+        """Сохранение и вывод результата одной ячейки"""
+        data_type, algo_name, size, samples, ops = cell_result
+        finished[(data_type, algo_name, size)] = (size, samples, ops)
+        print(f"  {data_type:<15}{algo_name:<16}{size:>8} {min(samples):.4f}s", flush=True)
+
+    def run_selection_tests(self, sizes: List[int] = None, k: int = 10, iterations: int = 1):
+        """
+        Сравнение частичной сортировки и выбора k-го элемента с полной сортировкой
+        на всех распределениях generate_test_datasets
+        """
+        if sizes is None:
+            sizes = [1000, 10000, 100000]
+
+        candidates = {
+            'quick_sort (полная)': quick_sort,
+            'sorted (полная)': sorted,
+            'nth_element (медиана)': lambda arr: nth_element(arr, len(arr) // 2),
+            f'partial_sort (k={k})': lambda arr: partial_sort(arr, k),
+            f'top_k (k={k})': lambda arr: top_k(arr, k),
+        }
+
+        print("\nСравнение выбора и частичной сортировки с полной сортировкой...")
+        print(f"Размеры массивов: {sizes}, k = {k}")
+        print("=" * 60)
+
+        datasets = self._datasets(sizes)
+        self.selection_results = {}
+
+        for data_type, sizes_data in datasets.items():
+            print(f"\nТип данных: {data_type.upper()}")
+            print("-" * 40)
+
+            self.selection_results[data_type] = {}
+
+            for name, func in candidates.items():
+                print(f"  {name}:", end=" ", flush=True)
+                times = []
+
+                for size, test_array in sizes_data.items():
+                    time_taken = self.measure_time(func, test_array, iterations)
+                    times.append((size, time_taken))
+                    print(f"{size}({time_taken:.4f}s)", end=" ", flush=True)
+
+                self.selection_results[data_type][name] = times
+                print()
+
+        return self.selection_results
+
+    def run_memory_tests(self, sizes: List[int] = None, workers: int = 1):
+        """
+        Пиковая память и число выделений для каждой ячейки тип данных × алгоритм × размер
+
+        Каждая ячейка выполняется в отдельном новом процессе (пул с
+        maxtasksperchild=1): ни кэши, ни фрагментация предыдущих ячеек не
+        влияют на замер, а трассировка tracemalloc не замедляет замеры времени.
+        Пик считается от состояния после получения входного массива, то есть
+        включает копию входа и результат. Число выделений - вспомогательные
+        списки по SortProbe.allocations (tracemalloc их не считает).
+        """
+        if sizes is None:
+            sizes = [100, 1000, 10000]
+
+        print("\nЗамер пиковой памяти (tracemalloc, отдельный процесс на ячейку)...")
+        print(f"Размеры массивов: {sizes}")
+        print("=" * 60)
+
+        datasets = self._datasets(sizes)
+        self.memory_results = {}
+        self.allocation_counts = {}
+
+        context = multiprocessing.get_context()
+        with context.Pool(processes=workers, maxtasksperchild=1) as pool:
+            pending = {}
+            for data_type, sizes_data in datasets.items():
+                for algo_name in SORTING_ALGORITHMS:
+                    for size, test_array in sizes_data.items():
+                        pending[(data_type, algo_name, size)] = pool.apply_async(
+                            _measure_memory, (algo_name, test_array))
+
+            for data_type, sizes_data in datasets.items():
+                print(f"\nТип данных: {data_type.upper()}")
+                self.memory_results[data_type] = {}
+                self.allocation_counts[data_type] = {}
+                for algo_name in SORTING_ALGORITHMS:
+                    print(f"  {algo_name}:", end=" ", flush=True)
+                    peaks, counts = [], []
+                    for size in sizes_data:
+                        peak, allocations = pending[(data_type, algo_name, size)].get()
+                        peaks.append((size, peak))
+                        counts.append((size, allocations))
+                        print(f"{size}({peak / 1024:.0f} KiB)", end=" ", flush=True)
+                    self.memory_results[data_type][algo_name] = peaks
+                    self.allocation_counts[data_type][algo_name] = counts
+                    print()
+
+        return self.memory_results
+
+    def profile_cells(self, cells: Iterable[Tuple[str, str, int]],
+                      output_dir: str = DEFAULT_PROFILE_DIR,
+                      profilers: Iterable[str] = PROFILERS,
+                      min_time: float = 1.0) -> Dict[Tuple[str, str, int], Dict[str, str]]:
+        """
+        Профилирование выбранных ячеек (алгоритм, тип данных, размер)
+
+        Отдельный от замеров времени режим: ячейки выполняются под cProfile
+        и/или выборочным профилировщиком (см. profiling.py), в output_dir
+        пишутся <алгоритм>_<тип>_<размер>.pstats и .collapsed. Наборы данных
+        те же, что в замерах (seed, cache_dir, disorder тестера).
+
+        Returns:
+            Dict: ячейка -> {профилировщик: путь к файлу}
+        """
+        written = {}
+        for algo_name, data_type, size in cells:
+            if algo_name not in SORTING_ALGORITHMS:
+                raise ValueError(f"Неизвестный алгоритм: {algo_name}")
+            disorder = (self.disorder or {}).get(data_type)
+            arr = load_dataset(data_type, size, self.seed, self.cache_dir, disorder).tolist()
+            print(f"Профилирование {algo_name} / {data_type} / {size}...")
+            written[(algo_name, data_type, size)] = profile_cell(
+                algo_name, arr, data_type, size, output_dir, profilers, min_time)
+        return written
+
+    def print_summary(self, results: Dict = None, title: str = "СВОДНАЯ ТАБЛИЦА РЕЗУЛЬТАТОВ"):
         """Вывод сводной таблицы результатов"""
+        if results is None:
+            results = self.results
+
         print("\n" + "=" * 80)
-        print("СВОДНАЯ ТАБЛИЦА РЕЗУЛЬТАТОВ")
+        print(title)
         print("=" * 80)
 
-        for data_type, algorithms in self.results.items():
+        # Колонки памяти - рядом со временем, если был run_memory_tests
+        memory = self.memory_results if results is self.results else {}
+        width = 20 if any(memory.values()) else 10
+
+        for data_type, algorithms in results.items():
             print(f"\n{data_type.upper()}:")
-            print("Algorithm".ljust(20), end="")
+            print("Algorithm".ljust(24), end="")
 
             # Заголовки с размерами
             sizes = [size for size, _ in list(algorithms.values())[0]]
             for size in sizes:
-                print(f"{size:>10}", end="")
+                print(f"{size:>{width}}", end="")
             print()
-            print("-" * (20 + 10 * len(sizes)))
+            print("-" * (24 + width * len(sizes)))
 
             # Данные по алгоритмам
             for algo_name, times in algorithms.items():
-                print(f"{algo_name:<20}", end="")
+                print(f"{algo_name:<24}", end="")
+                status = self.cell_status.get(data_type, {}).get(algo_name, {}) \
+                    if results is self.results else {}
+                peaks = dict(memory.get(data_type, {}).get(algo_name, []))
                 for size, time_val in times:
-                    print(f"{time_val:>10.4f}", end="")
+                    mark = {'extrapolated': '*', 'downsampled': '~'}.get(status.get(size), ' ')
+                    print(f"{time_val:>9.4f}{mark}", end="")
+                    if width > 10:
+                        peak = f"{peaks[size] / 1024:.0f}K" if size in peaks else "-"
+                        print(f"{peak:>10}", end="")
                 print()
 
+        if any(memory.values()):
+            print("\nK - пиковая память сортировки в КиБ (tracemalloc), - - не замерялась")
+
+        if results is self.results and self.cell_status:
+            print("\n* - прогноз по степенной модели (ячейка пропущена по бюджету), "
+                  "~ - один прогон вместо трёх")
+
+        self.print_complexity(results)
+
+        if results is self.results and any(self.operation_counts.values()):
+            self.print_operation_counts()
+
+    @staticmethod
+    def fit_complexities(results: Dict, cell_status: Dict = None) -> Dict[str, Dict[str, Dict]]:
+        """
+        Эмпирическая сложность каждой пары (тип данных, алгоритм)
+
+        Args:
+            results: Времена {тип данных: {алгоритм: [(размер, время), ...]}}
+            cell_status: Пометки ячеек бюджетного режима; прогнозы
+                ('extrapolated') в подбор модели не входят
+
+        Returns:
+            {тип данных: {алгоритм: результат complexity.fit_complexity
+            с полем mismatch}}; пары меньше чем с тремя замеренными
+            размерами пропускаются
+        """
+        if cell_status is None:
+            cell_status = {}
+        fits = {}
+        for data_type, algorithms in results.items():
+            fits[data_type] = {}
+            for algo_name, times in algorithms.items():
+                status = cell_status.get(data_type, {}).get(algo_name, {})
+                times = [(size, t) for size, t in times if status.get(size) != 'extrapolated']
+                if len(times) < 3:
+                    continue
+                fit = fit_complexity([size for size, _ in times], [t for _, t in times])
+                fit['mismatch'] = complexity_mismatch(algo_name, fit['model'])
+                fits[data_type][algo_name] = fit
+        return fits
+
+    def print_complexity(self, results: Dict = None):
+        """Таблица подобранных моделей сложности с пометкой расхождений"""
+        if results is None:
+            results = self.results
+        fits = self.fit_complexities(results,
+                                     self.cell_status if results is self.results else None)
+        if not any(fits.values()):
+            return
+
+        print("\n" + "=" * 80)
+        print("ЭМПИРИЧЕСКАЯ СЛОЖНОСТЬ (t = c * f(n), показатель b из t = c * n^b)")
+        print("=" * 80)
+
+        mismatches = []
+        for data_type, algorithms in fits.items():
+            if not algorithms:
+                continue
+            print(f"\n{data_type.upper()}:")
+            print(f"{'Algorithm':<24}{'модель':>10}{'b':>8}{'c':>12}{'ожидается':>12}")
+            print("-" * 66)
+            for algo_name, fit in algorithms.items():
+                expected = EXPECTED_COMPLEXITY.get(algo_name, '?')
+                mark = ' !' if fit['mismatch'] else ''
+                print(f"{algo_name:<24}{fit['model']:>10}{fit['exponent']:>8.2f}"
+                      f"{fit['constant']:>12.2e}{expected:>12}{mark}")
+                if fit['mismatch']:
+                    mismatches.append(f"{algo_name} на {data_type}: {fit['model']} "
+                                      f"вместо {expected}")
+
+        if mismatches:
+            print("\n! Рост быстрее ожидаемого:")
+            for line in mismatches:
+                print(f"  {line}")
+
+    def print_operation_counts(self, size: int = None):
+        """
+        Счётчики операций рядом со временем для одного размера (по умолчанию -
+        наибольшего). Время на операцию (нс/оп) показывает, вызвано ли
+        замедление объёмом алгоритмической работы или накладными расходами
+        интерпретатора.
+        """
+        print("\n" + "=" * 104)
+        print("ОПЕРАЦИИ АЛГОРИТМОВ")
+        print("=" * 104)
+
+        for data_type, algorithms in self.operation_counts.items():
+            if not algorithms:
+                continue
+            sizes = [s for s, _ in list(algorithms.values())[0]]
+            target = size if size is not None else max(sizes)
+            print(f"\n{data_type.upper()} (n = {target}):")
+            print(f"{'Algorithm':<20}{'Время, с':>10}{'Сравнения':>14}{'Обмены':>12}"
+                  f"{'Перемещ.':>12}{'Глубина':>9}{'Доп. память, КБ':>16}{'нс/оп':>9}")
+            print("-" * 102)
+
+            for algo_name, counts in algorithms.items():
+                ops = dict(counts).get(target)
+                time_val = dict(self.results[data_type][algo_name]).get(target)
+                if ops is None or time_val is None:
+                    continue
+                total_ops = ops['comparisons'] + ops['swaps'] + ops['moves']
+                ns_per_op = time_val * 1e9 / total_ops if total_ops else 0.0
+                print(f"{algo_name:<20}{time_val:>10.4f}{ops['comparisons']:>14,}"
+                      f"{ops['swaps']:>12,}{ops['moves']:>12,}{ops['max_depth']:>9}"
+                      f"{ops['allocated_bytes'] / 1024:>16,.1f}{ns_per_op:>9.1f}")
+
+
+def _available_cores() -> List[int]:
+    """Ядра, доступные текущему процессу"""
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _pin_worker_to_core(core_queue):
+    """Инициализатор рабочего процесса: закрепление за свободным ядром"""
+    os.sched_setaffinity(0, {core_queue.get()})
+
+
+def _run_cell(data_type: str, algo_name: str, size: int, test_array: List[int],
+              iterations: int, repeat: int, count_operations: bool) -> Tuple:
+    """Замер одной ячейки матрицы (выполняется в рабочем процессе)"""
+    tester = PerformanceTester()
+    algo_func = SORTING_ALGORITHMS[algo_name]
+    samples = tester.measure_samples(algo_func, test_array, iterations, repeat)
+    ops = tester.count_operations(algo_func, test_array) if count_operations else None
+    return data_type, algo_name, size, samples, ops
+
+
+def _measure_memory(algo_name: str, test_array: List[int]) -> Tuple[int, int]:
+    """
+    Пиковая память (байт) и число вспомогательных списков одной сортировки
+    (выполняется в отдельном процессе)
+    """
+    algo_func = SORTING_ALGORITHMS[algo_name]
+    probe = SortProbe()
+    algo_func(test_array, probe=probe)
+
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        algo_func(test_array)
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+    return peak, probe.allocations
+
+
+# Каталог кэша наборов данных по умолчанию
+DATASET_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dataset_cache')
+
 
 def main():
     """Основная функция тестирования производительности"""
-    tester = PerformanceTester()
+    tester = PerformanceTester(seed=42, cache_dir=DATASET_CACHE_DIR)
 
     # Размеры для тестирования (можно увеличить для более точных результатов)
     test_sizes = [100, 500, 1000, 3000, 5000, 7000, 10000]
@@ -105,9 +655,19 @@ def main():
     # Запуск тестов
     results = tester.run_performance_tests(sizes=test_sizes, iterations=1)
 
+    # Пиковая память по ячейкам - колонки рядом со временем в сводке
+    tester.run_memory_tests(sizes=[100, 1000, 10000])
+
     # Вывод сводки
     tester.print_summary()
 
+    # Сохранение в хранилище результатов (сравнение: python results_store.py compare)
+    print(f"\nРезультаты сохранены: {save_run(tester)}")
+
+    # Выбор k наименьших и медианы против полной сортировки
+    tester.run_selection_tests(sizes=[1000, 10000, 100000], k=10)
+    tester.print_summary(tester.selection_results, "ВЫБОР И ЧАСТИЧНАЯ СОРТИРОВКА")
+
     return results
 
 
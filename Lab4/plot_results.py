@@ -1,61 +1,214 @@
 """
 Визуализация результатов тестирования производительности
+
+Результаты берутся из хранилища results_store (по умолчанию - последний
+прогон), бенчмарк заново не запускается. Графики строятся без окна
+(бэкенд Agg) и сохраняются в PNG. Построение инкрементальное: хэш входных
+данных каждого графика записывается в манифест, и графики с неизменными
+данными не перерисовываются.
+
+Использование:
+    python plot_results.py [RUN] [--output-dir DIR] [--size 5000] [--force]
 """
 
+import argparse
+import hashlib
+import json
+import os
+import sys
+from typing import Callable, Dict, List
+
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import numpy as np
-from performance_test import main as run_performance_tests
+
+from sorts import SORTING_ALGORITHMS
+from complexity import fit_complexity, model_time
+from results_store import DEFAULT_STORE_DIR, latest_run, load_run
+
+# Версия оформления графиков: увеличивается при изменении кода построения,
+# чтобы манифест не считал старые PNG актуальными
+RENDER_VERSION = 1
+MANIFEST_FILE = 'plots_manifest.json'
 
 
 class ResultsVisualizer:
     """Класс для визуализации результатов тестирования"""
 
-    def __init__(self, results):
+    def __init__(self, results, output_dir: str = '.', force: bool = False,
+                 memory: Dict = None):
+        """
+        Args:
+            results: {тип данных: {алгоритм: [(размер, время), ...]}}
+            output_dir: каталог для PNG и манифеста
+            force: перерисовать все графики независимо от манифеста
+            memory: пиковая память в той же структуре (байты),
+                PerformanceTester.memory_results
+        """
         self.results = results
+        self.memory = memory or {}
+        self.output_dir = output_dir
+        self.force = force
         self.colors = {
             'bubble_sort': 'red',
             'selection_sort': 'blue',
             'insertion_sort': 'green',
             'merge_sort': 'orange',
-            'quick_sort': 'purple'
+            'quick_sort': 'purple',
+            'counting_sort': 'brown',
+            'radix_sort': 'teal',
+            'integer_sort': 'olive'
         }
+        # Перерисованные и пропущенные (актуальные) графики последнего построения
+        self.rendered = []
+        self.skipped = []
 
         plt.style.use('seaborn-v0_8')
 
-    def plot_time_vs_size(self, data_type: str = 'random'):
-        """График времени выполнения от размера массива"""
-        plt.figure(figsize=(12, 8))
-
+    @classmethod
+    def from_run(cls, run_path: str = None, store_dir: str = DEFAULT_STORE_DIR,
+                 **kwargs) -> 'ResultsVisualizer':
+        """Визуализатор для сохранённого прогона (по умолчанию - последнего)"""
+        if run_path is None:
+            run_path = latest_run(store_dir)
+            if run_path is None:
+                raise FileNotFoundError(f"В хранилище {store_dir} нет прогонов")
+        record = load_run(run_path)
+        return cls(record['results'], memory=record['memory'], **kwargs)
+
+    def _algorithms(self) -> List[str]:
+        """Алгоритмы результатов: сначала в порядке SORTING_ALGORITHMS, затем прочие"""
+        present = []
+        for algorithms in self.results.values():
+            for algo_name in algorithms:
+                if algo_name not in present:
+                    present.append(algo_name)
+        known = [name for name in SORTING_ALGORITHMS if name in present]
+        return known + [name for name in present if name not in known]
+
+    def _load_manifest(self) -> Dict[str, str]:
+        path = os.path.join(self.output_dir, MANIFEST_FILE)
+        if not os.path.exists(path):
+            return {}
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+
+    def _save_manifest(self, manifest: Dict[str, str]):
+        path = os.path.join(self.output_dir, MANIFEST_FILE)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, path)
+
+    def _render(self, filename: str, inputs, draw: Callable[[], plt.Figure]) -> bool:
+        """
+        Построение графика filename, если его входные данные изменились
+
+        inputs - всё, от чего зависит картинка (сериализуется в JSON для хэша);
+        draw строит и возвращает фигуру. Returns: True, если график перерисован.
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        digest = hashlib.sha256(json.dumps(
+            [RENDER_VERSION, self.colors, inputs], sort_keys=True).encode()).hexdigest()
+        path = os.path.join(self.output_dir, filename)
+
+        manifest = self._load_manifest()
+        if not self.force and manifest.get(filename) == digest and os.path.exists(path):
+            self.skipped.append(path)
+            return False
+
+        fig = draw()
+        fig.savefig(path, dpi=300, bbox_inches='tight')
+        plt.close(fig)
+
+        manifest[filename] = digest
+        self._save_manifest(manifest)
+        self.rendered.append(path)
+        return True
+
+    def plot_time_vs_size(self, data_type: str = 'random', show_fit: bool = True) -> bool:
+        """
+        График времени выполнения от размера массива
+
+        show_fit: наложить пунктиром подобранную модель сложности
+        (complexity.fit_complexity) для алгоритмов с тремя и более размерами
+        """
         if data_type not in self.results:
             print(f"Тип данных '{data_type}' не найден в результатах")
-            return
-
-        for algo_name, times in self.results[data_type].items():
-            sizes = [size for size, _ in times]
-            time_vals = [time_val for _, time_val in times]
-
-            plt.plot(sizes, time_vals,
-                    label=algo_name,
-                    color=self.colors.get(algo_name, 'black'),
-                    marker='o',
-                    linewidth=2,
-                    markersize=6)
-
-        plt.xlabel('Размер массива')
-        plt.ylabel('Время выполнения (секунды)')
-        plt.title(f'Зависимость времени сортировки от размера массива\n(Тип данных: {data_type})')
-        plt.legend()
-        plt.grid(True, alpha=0.3)
-        plt.yscale('log')  # Логарифмическая шкала для лучшего отображения
-        plt.xscale('log')
-        plt.tight_layout()
-        plt.savefig(f'time_vs_size_{data_type}.png', dpi=300, bbox_inches='tight')
-        plt.show()
-
-    def plot_comparison_by_data_type(self, size: int = 5000):
+            return False
+
+        data = self.results[data_type]
+
+        def draw() -> plt.Figure:
+            fig = plt.figure(figsize=(12, 8))
+
+            for algo_name, times in data.items():
+                sizes = [size for size, _ in times]
+                time_vals = [time_val for _, time_val in times]
+
+                plt.plot(sizes, time_vals,
+                         label=algo_name,
+                         color=self.colors.get(algo_name, 'black'),
+                         marker='o',
+                         linewidth=2,
+                         markersize=6)
+
+                if show_fit and len(sizes) >= 3:
+                    fit = fit_complexity(sizes, time_vals)
+                    fit_sizes = np.geomspace(sizes[0], sizes[-1], 50)
+                    plt.plot(fit_sizes, model_time(fit['model'], fit['constant'], fit_sizes),
+                             color=self.colors.get(algo_name, 'black'),
+                             linestyle='--',
+                             linewidth=1,
+                             alpha=0.7,
+                             label=f"{algo_name}: {fit['model']}")
+
+            plt.xlabel('Размер массива')
+            plt.ylabel('Время выполнения (секунды)')
+            plt.title(f'Зависимость времени сортировки от размера массива\n(Тип данных: {data_type})')
+            plt.legend()
+            plt.grid(True, alpha=0.3)
+            plt.yscale('log')  # Логарифмическая шкала для лучшего отображения
+            plt.xscale('log')
+            plt.tight_layout()
+            return fig
+
+        return self._render(f'time_vs_size_{data_type}.png', [data_type, show_fit, data], draw)
+
+    def plot_memory_vs_size(self, data_type: str = 'random') -> bool:
+        """График пиковой памяти от размера массива"""
+        if not self.memory.get(data_type):
+            return False
+
+        data = self.memory[data_type]
+
+        def draw() -> plt.Figure:
+            fig = plt.figure(figsize=(12, 8))
+
+            for algo_name, peaks in data.items():
+                plt.plot([size for size, _ in peaks],
+                         [max(peak, 1) / 1024 for _, peak in peaks],
+                         label=algo_name,
+                         color=self.colors.get(algo_name, 'black'),
+                         marker='s',
+                         linewidth=2,
+                         markersize=6)
+
+            plt.xlabel('Размер массива')
+            plt.ylabel('Пиковая память (КиБ, tracemalloc)')
+            plt.title(f'Пиковая память сортировки от размера массива\n(Тип данных: {data_type})')
+            plt.legend()
+            plt.grid(True, alpha=0.3)
+            plt.yscale('log')
+            plt.xscale('log')
+            plt.tight_layout()
+            return fig
+
+        return self._render(f'memory_vs_size_{data_type}.png', [data_type, data], draw)
+
+    def plot_comparison_by_data_type(self, size: int = 5000) -> bool:
         """Сравнение алгоритмов по типам данных для фиксированного размера"""
-        plt.figure(figsize=(14, 8))
-
         # Собираем данные для выбранного размера
         comparison_data = {}
 
@@ -69,50 +222,52 @@ class ResultsVisualizer:
                         break
 
         # Подготовка данных для группированного bar chart
-        algorithms = list(SORTING_ALGORITHMS.keys())
+        algorithms = self._algorithms()
         data_types = list(comparison_data.keys())
 
-        x = np.arange(len(data_types))
-        width = 0.15
+        def draw() -> plt.Figure:
+            x = np.arange(len(data_types))
+            # Группа столбцов занимает 0.8 деления и центрирована на метке
+            width = 0.8 / max(1, len(algorithms))
+
+            fig, ax = plt.subplots(figsize=(14, 8))
 
-        fig, ax = plt.subplots(figsize=(14, 8))
+            for i, algo_name in enumerate(algorithms):
+                times = [comparison_data[dt].get(algo_name, 0) for dt in data_types]
+                ax.bar(x + (i - (len(algorithms) - 1) / 2) * width, times, width,
+                       label=algo_name,
+                       color=self.colors.get(algo_name, 'gray'))
 
-        for i, algo_name in enumerate(algorithms):
-            times = [comparison_data[dt].get(algo_name, 0) for dt in data_types]
-            ax.bar(x + i * width - width * 2, times, width,
-                   label=algo_name,
-                   color=self.colors.get(algo_name, 'gray'))
+            ax.set_xlabel('Тип данных')
+            ax.set_ylabel('Время выполнения (секунды)')
+            ax.set_title(f'Сравнение алгоритмов сортировки по типам данных\n(Размер массива: {size})')
+            ax.set_xticks(x)
+            ax.set_xticklabels([dt.upper() for dt in data_types], rotation=30, ha='right')
+            ax.legend()
+            ax.grid(True, alpha=0.3, axis='y')
 
-        ax.set_xlabel('Тип данных')
-        ax.set_ylabel('Время выполнения (секунды)')
-        ax.set_title(f'Сравнение алгоритмов сортировки по типам данных\n(Размер массива: {size})')
-        ax.set_xticks(x)
-        ax.set_xticklabels([dt.upper() for dt in data_types])
-        ax.legend()
-        ax.grid(True, alpha=0.3, axis='y')
+            plt.tight_layout()
+            return fig
 
-        plt.tight_layout()
-        plt.savefig(f'comparison_data_types_size_{size}.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        return self._render(f'comparison_data_types_size_{size}.png',
+                            [size, algorithms, comparison_data], draw)
 
-    def create_performance_table(self):
+    def create_performance_table(self, target_size: int = 5000):
         """Создание сводной таблицы производительности"""
         print("\n" + "="*100)
         print("СВОДНАЯ ТАБЛИЦА ПРОИЗВОДИТЕЛЬНОСТИ")
         print("="*100)
 
-        # Для размера 5000 собираем все данные
-        target_size = 5000
         table_data = []
 
         headers = ["Algorithm"] + list(self.results.keys())
         table_data.append(headers)
 
-        for algo_name in SORTING_ALGORITHMS.keys():
+        for algo_name in self._algorithms():
             row = [algo_name]
             for data_type in self.results.keys():
                 time_val = None
-                for size, t in self.results[data_type][algo_name]:
+                for size, t in self.results[data_type].get(algo_name, []):
                     if size == target_size:
                         time_val = t
                         break
@@ -127,26 +282,64 @@ class ResultsVisualizer:
 
         return table_data
 
-
-def main():
+    def default_size(self) -> int:
+        """Наибольший размер, измеренный во всех ячейках результатов"""
+        common = None
+        for algorithms in self.results.values():
+            for times in algorithms.values():
+                sizes = {size for size, _ in times}
+                common = sizes if common is None else common & sizes
+        return max(common) if common else 0
+
+    def render_all(self, size: int = None) -> List[str]:
+        """
+        Все графики за один проход (только изменившиеся)
+
+        Returns:
+            List[str]: пути перерисованных файлов
+        """
+        self.rendered, self.skipped = [], []
+        if size is None:
+            size = self.default_size()
+
+        # Графики для разных типов данных
+        for data_type in self.results:
+            self.plot_time_vs_size(data_type)
+            self.plot_memory_vs_size(data_type)
+
+        # Сравнение по типам данных
+        self.plot_comparison_by_data_type(size)
+        return self.rendered
+
+
+def main(argv: List[str] = None) -> int:
     """Основная функция визуализации"""
-    # Запускаем тесты если результаты не переданы
-    print("Запуск тестов производительности...")
-    results = run_performance_tests()
-
-    # Визуализация
-    visualizer = ResultsVisualizer(results)
-
-    # Графики для разных типов данных
-    for data_type in ['random', 'sorted', 'reversed', 'almost_sorted']:
-        visualizer.plot_time_vs_size(data_type)
-
-    # Сравнение по типам данных
-    visualizer.plot_comparison_by_data_type(5000)
+    parser = argparse.ArgumentParser(description="Графики по сохранённым результатам бенчмарка")
+    parser.add_argument('run', nargs='?', help="файл прогона (по умолчанию последний)")
+    parser.add_argument('--store', default=DEFAULT_STORE_DIR, help="каталог хранилища")
+    parser.add_argument('--output-dir', default='.', help="каталог для графиков")
+    parser.add_argument('--size', type=int, help="размер для сравнения по типам данных")
+    parser.add_argument('--force', action='store_true', help="перерисовать все графики")
+    args = parser.parse_args(argv)
+
+    try:
+        visualizer = ResultsVisualizer.from_run(args.run, args.store,
+                                                output_dir=args.output_dir, force=args.force)
+    except FileNotFoundError as e:
+        print(f"{e}. Сначала запустите python performance_test.py")
+        return 2
+
+    visualizer.render_all(args.size)
+    print(f"Перерисовано графиков: {len(visualizer.rendered)}, "
+          f"без изменений: {len(visualizer.skipped)}")
+    for path in visualizer.rendered:
+        print(f"  {path}")
 
     # Сводная таблица
-    visualizer.create_performance_table()
+    size = args.size or visualizer.default_size()
+    visualizer.create_performance_table(size)
+    return 0
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,89 @@
+"""
+Счётчики операций алгоритмов сортировки
+
+Функции sorts.py принимают необязательный probe=SortProbe() и сами
+сообщают ему число сравнений, обменов, перемещений, глубину рекурсии и
+вспомогательные выделения. Без probe используется NULL_PROBE, методы
+которого ничего не делают. Счётчики в циклах накапливаются
+в локальных переменных или вычисляются по формуле, поэтому без probe
+цена подсчёта - несколько операций на вызов.
+"""
+
+import sys
+from typing import Dict, Any
+
+
+class SortProbe:
+    """
+    Счётчики работы алгоритма сортировки:
+      - comparisons - сравнения элементов
+      - swaps - обмены двух элементов
+      - moves - одиночные перемещения (запись элемента на новое место)
+      - max_depth - максимальная глубина рекурсии
+      - allocations / allocated_bytes - число и суммарный размер
+        вспомогательных списков (sys.getsizeof контейнера)
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.comparisons = 0
+        self.swaps = 0
+        self.moves = 0
+        self.depth = 0
+        self.max_depth = 0
+        self.allocations = 0
+        self.allocated_bytes = 0
+
+    def enter(self):
+        """Вход в очередной уровень рекурсии"""
+        self.depth += 1
+        if self.depth > self.max_depth:
+            self.max_depth = self.depth
+
+    def exit(self):
+        """Выход из уровня рекурсии"""
+        self.depth -= 1
+
+    def allocate(self, obj: Any) -> Any:
+        """Учёт вспомогательного списка, возвращает его же"""
+        self.allocations += 1
+        self.allocated_bytes += sys.getsizeof(obj)
+        return obj
+
+    @property
+    def operations(self) -> int:
+        """Суммарная алгоритмическая работа: сравнения + обмены + перемещения"""
+        return self.comparisons + self.swaps + self.moves
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            'comparisons': self.comparisons,
+            'swaps': self.swaps,
+            'moves': self.moves,
+            'max_depth': self.max_depth,
+            'allocations': self.allocations,
+            'allocated_bytes': self.allocated_bytes
+        }
+
+    def __repr__(self):
+        fields = ', '.join(f"{k}={v}" for k, v in self.as_dict().items())
+        return f"SortProbe({fields})"
+
+
+class NullProbe(SortProbe):
+    """Счётчик по умолчанию: вход, выход и учёт выделений ничего не делают"""
+
+    def enter(self):
+        pass
+
+    def exit(self):
+        pass
+
+    def allocate(self, obj: Any) -> Any:
+        return obj
+
+
+# Общий пустой счётчик: его значения никто не читает
+NULL_PROBE = NullProbe()
\ No newline at end of file
@@ -0,0 +1,180 @@
+"""
+Профилирование отдельных ячеек бенчмарка сортировок
+
+Выбранные ячейки (алгоритм, тип данных, размер) выполняются под cProfile
+и/или под лёгким выборочным профилировщиком стека. Результаты:
+  - <алгоритм>_<тип данных>_<размер>.pstats - статистика cProfile
+    (python -m pstats, snakeviz);
+  - <алгоритм>_<тип данных>_<размер>.collapsed - свёрнутые стеки
+    ("f1;f2;f3 число_выборок"), формат flamegraph.pl, speedscope, inferno.
+
+Профилирование выполняется отдельно от замеров времени PerformanceTester
+и не влияет на них.
+
+Использование:
+    python profiling.py quick_sort:median3_killer:10000 merge_sort:random:100000
+        [--profilers cprofile sampling] [--output-dir DIR] [--min-time 1.0]
+"""
+
+import argparse
+import cProfile
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from sorts import SORTING_ALGORITHMS
+
+PROFILERS = ('cprofile', 'sampling')
+
+DEFAULT_PROFILE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'profiles')
+
+
+class StackSampler:
+    """
+    Выборочный профилировщик: фоновый поток каждые interval секунд
+    снимает стек целевого потока (sys._current_frames) ниже кадра, из
+    которого запущен профилировщик, и считает одинаковые стеки. Частота
+    ограничена интервалом переключения GIL (sys.getswitchinterval,
+    по умолчанию 5 мс), зато накладные расходы почти не зависят от числа
+    вызовов функций, в отличие от cProfile.
+    """
+
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self.stacks = Counter()
+        self._target = None
+        self._root = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    @staticmethod
+    def _frame_label(frame) -> str:
+        code = frame.f_code
+        return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            stack = []
+            while frame is not None and frame is not self._root:
+                stack.append(self._frame_label(frame))
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+
+    def start(self, root=None):
+        """Запуск выборки; кадр root и внешние к нему в стеки не попадают"""
+        self._target = threading.get_ident()
+        self._root = root if root is not None else sys._getframe(1)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def __enter__(self):
+        self.start(sys._getframe(1))
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def write_collapsed(self, path: str):
+        """Запись свёрнутых стеков: одна строка "f1;f2;...;fn число" на стек"""
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+def _repeat_for(func: Callable, min_time: float) -> int:
+    """Вызовы func, пока не пройдёт min_time секунд (не меньше одного)"""
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        func()
+        calls += 1
+        if time.perf_counter() - start >= min_time:
+            return calls
+
+
+def profile_name(algo_name: str, data_type: str, size: int) -> str:
+    """Общее имя файлов профиля ячейки"""
+    return f"{algo_name}_{data_type}_{size}"
+
+
+def profile_cell(algo_name: str, arr: List[int], data_type: str, size: int,
+                 output_dir: str = DEFAULT_PROFILE_DIR,
+                 profilers: Iterable[str] = PROFILERS,
+                 min_time: float = 1.0) -> Dict[str, str]:
+    """
+    Профилирование одной ячейки: сортировка повторяется не меньше min_time
+    секунд под каждым из profilers
+
+    Returns:
+        Dict: профилировщик -> путь к записанному файлу
+    """
+    algo_func = SORTING_ALGORITHMS[algo_name]
+    os.makedirs(output_dir, exist_ok=True)
+    base = os.path.join(output_dir, profile_name(algo_name, data_type, size))
+
+    def run():
+        return algo_func(arr)
+
+    written = {}
+    for profiler in profilers:
+        if profiler == 'cprofile':
+            prof = cProfile.Profile()
+            prof.enable()
+            try:
+                _repeat_for(run, min_time)
+            finally:
+                prof.disable()
+            prof.dump_stats(f"{base}.pstats")
+            written[profiler] = f"{base}.pstats"
+        elif profiler == 'sampling':
+            with StackSampler() as sampler:
+                _repeat_for(run, min_time)
+            sampler.write_collapsed(f"{base}.collapsed")
+            written[profiler] = f"{base}.collapsed"
+        else:
+            raise ValueError(f"Неизвестный профилировщик: {profiler} (доступны: {PROFILERS})")
+    return written
+
+
+def parse_cell(spec: str) -> Tuple[str, str, int]:
+    """'алгоритм:тип_данных:размер' -> (алгоритм, тип данных, размер)"""
+    try:
+        algo_name, data_type, size = spec.split(':')
+        return algo_name, data_type, int(size)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"ячейка задаётся как алгоритм:тип_данных:размер, получено {spec!r}")
+
+
+def main(argv: List[str] = None) -> int:
+    """Командная строка: профили выбранных ячеек"""
+    parser = argparse.ArgumentParser(description="Профилирование ячеек бенчмарка сортировок")
+    parser.add_argument('cells', nargs='+', type=parse_cell,
+                        help="ячейки вида алгоритм:тип_данных:размер")
+    parser.add_argument('--profilers', nargs='+', choices=PROFILERS, default=list(PROFILERS))
+    parser.add_argument('--output-dir', default=DEFAULT_PROFILE_DIR)
+    parser.add_argument('--min-time', type=float, default=1.0,
+                        help="минимальная длительность профилирования ячейки, с")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args(argv)
+
+    from performance_test import PerformanceTester
+    tester = PerformanceTester(seed=args.seed)
+    written = tester.profile_cells(args.cells, args.output_dir, args.profilers, args.min_time)
+    for cell, files in written.items():
+        print(f"{profile_name(*cell)}: {', '.join(files.values())}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
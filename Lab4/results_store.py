@@ -0,0 +1,313 @@
+"""
+Хранилище результатов тестирования производительности и поиск регрессий
+
+Каждый прогон сохраняется отдельным JSON-файлом с метаданными
+(версия схемы, время, система, коммит git, параметры прогона).
+Команда compare сравнивает прогон с базовым (baseline) и отмечает
+статистически значимые регрессии по каждому алгоритму и типу данных.
+Прогоны и baseline зависят от машины, поэтому каталог хранилища
+(benchmark_results/) в git не хранится.
+
+Использование:
+    python results_store.py list
+    python results_store.py set-baseline [RUN]
+    python results_store.py compare [RUN] [--baseline FILE] [--threshold 0.05]
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import shutil
+import subprocess
+import sys
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+SCHEMA_VERSION = 1
+
+DEFAULT_STORE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                 'benchmark_results')
+BASELINE_FILE = 'baseline.json'
+
+# Квантили t-распределения Стьюдента для двусторонних интервалов
+# (число степеней свободы -> квантиль), за пределами таблицы - нормальное
+T_QUANTILES = {
+    0.95: {1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365,
+           8: 2.306, 9: 2.262, 10: 2.228, 12: 2.179, 15: 2.131, 20: 2.086,
+           30: 2.042, 60: 2.000, 120: 1.980},
+    0.99: {1: 63.657, 2: 9.925, 3: 5.841, 4: 4.604, 5: 4.032, 6: 3.707, 7: 3.499,
+           8: 3.355, 9: 3.250, 10: 3.169, 12: 3.055, 15: 2.947, 20: 2.845,
+           30: 2.750, 60: 2.660, 120: 2.617},
+}
+Z_QUANTILES = {0.95: 1.960, 0.99: 2.576}
+
+
+def _git_commit() -> Optional[str]:
+    """Текущий коммит git (если доступен)"""
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)),
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _pairs_to_json(data: Dict) -> Dict:
+    """{data_type: {algo: [(size, value), ...]}} -> {data_type: {algo: {size: value}}}"""
+    return {data_type: {algo: {str(size): value for size, value in cells}
+                        for algo, cells in algorithms.items()}
+            for data_type, algorithms in data.items()}
+
+
+def _pairs_from_json(data: Dict) -> Dict:
+    """Обратное преобразование к структуре PerformanceTester.results"""
+    return {data_type: {algo: sorted((int(size), value) for size, value in cells.items())
+                        for algo, cells in algorithms.items()}
+            for data_type, algorithms in data.items()}
+
+
+def save_run(tester, store_dir: str = DEFAULT_STORE_DIR, label: str = None) -> str:
+    """
+    Сохранение результатов PerformanceTester в новый файл хранилища
+
+    Returns:
+        str: путь к сохранённому файлу
+    """
+    os.makedirs(store_dir, exist_ok=True)
+    timestamp = datetime.now()
+    run_id = timestamp.strftime('%Y%m%d_%H%M%S_%f')
+
+    record = {
+        'schema_version': SCHEMA_VERSION,
+        'run_id': run_id,
+        'label': label,
+        'metadata': {
+            'timestamp': timestamp.isoformat(timespec='seconds'),
+            'git_commit': _git_commit(),
+            'platform': platform.platform(),
+            'processor': platform.processor() or tester.system_info.get('processor'),
+            'python_version': platform.python_version(),
+            'python_implementation': platform.python_implementation(),
+            'cpu_count': os.cpu_count(),
+            **tester.run_config
+        },
+        'results': _pairs_to_json(tester.results),
+        'samples': _pairs_to_json(tester.samples),
+        'operation_counts': _pairs_to_json(tester.operation_counts),
+        'memory': _pairs_to_json(tester.memory_results),
+        'allocation_counts': _pairs_to_json(tester.allocation_counts),
+        'cell_status': {data_type: {algo: {str(size): status for size, status in cells.items()}
+                                    for algo, cells in algorithms.items()}
+                        for data_type, algorithms in tester.cell_status.items()},
+    }
+
+    path = os.path.join(store_dir, f"run_{run_id}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(record, f, ensure_ascii=False, indent=1)
+    return path
+
+
+def load_run(path: str) -> Dict:
+    """
+    Загрузка прогона из хранилища; results, samples, operation_counts, memory
+    и allocation_counts возвращаются в структуре PerformanceTester
+    ({тип: {алгоритм: [(размер, значение)]}})
+    """
+    with open(path, encoding='utf-8') as f:
+        record = json.load(f)
+
+    version = record.get('schema_version')
+    if version != SCHEMA_VERSION:
+        raise ValueError(f"Неподдерживаемая версия схемы результатов: {version}")
+
+    for field in ('results', 'samples', 'operation_counts', 'memory', 'allocation_counts'):
+        record[field] = _pairs_from_json(record.get(field, {}))
+    return record
+
+
+def list_runs(store_dir: str = DEFAULT_STORE_DIR) -> List[str]:
+    """Пути ко всем прогонам хранилища в хронологическом порядке"""
+    if not os.path.isdir(store_dir):
+        return []
+    return sorted(os.path.join(store_dir, name) for name in os.listdir(store_dir)
+                  if name.startswith('run_') and name.endswith('.json'))
+
+
+def latest_run(store_dir: str = DEFAULT_STORE_DIR) -> Optional[str]:
+    """Путь к последнему прогону или None"""
+    runs = list_runs(store_dir)
+    return runs[-1] if runs else None
+
+
+def set_baseline(run_path: str, store_dir: str = DEFAULT_STORE_DIR) -> str:
+    """Назначение прогона базовым для сравнения"""
+    load_run(run_path)  # проверка формата
+    baseline_path = os.path.join(store_dir, BASELINE_FILE)
+    shutil.copyfile(run_path, baseline_path)
+    return baseline_path
+
+
+def _t_quantile(df: float, confidence: float) -> float:
+    """Квантиль t-распределения по таблице (консервативно - ближайший меньший df)"""
+    table = T_QUANTILES[confidence]
+    suitable = [d for d in table if d <= df]
+    if df > max(table):
+        return Z_QUANTILES[confidence]
+    return table[max(suitable)] if suitable else table[min(table)]
+
+
+def mean_confidence_interval(samples: List[float],
+                             confidence: float = 0.95) -> Tuple[float, float]:
+    """
+    Среднее и полуширина доверительного интервала по t-распределению
+
+    Returns:
+        (mean, half_width); для одного замера полуширина - nan
+    """
+    n = len(samples)
+    mean = sum(samples) / n
+    if n < 2:
+        return mean, float('nan')
+    variance = sum((x - mean) ** 2 for x in samples) / (n - 1)
+    return mean, _t_quantile(n - 1, confidence) * math.sqrt(variance / n)
+
+
+def welch_test(a: List[float], b: List[float], confidence: float = 0.95) -> Optional[bool]:
+    """
+    t-критерий Уэлча: значимо ли различаются средние двух выборок
+
+    Returns:
+        True/False, либо None, если повторов недостаточно
+    """
+    if len(a) < 2 or len(b) < 2:
+        return None
+    mean_a, mean_b = sum(a) / len(a), sum(b) / len(b)
+    var_a = sum((x - mean_a) ** 2 for x in a) / (len(a) - 1) / len(a)
+    var_b = sum((x - mean_b) ** 2 for x in b) / (len(b) - 1) / len(b)
+    if var_a + var_b == 0:
+        return mean_a != mean_b
+    t = abs(mean_a - mean_b) / math.sqrt(var_a + var_b)
+    # Степени свободы по формуле Уэлча-Саттертуэйта
+    df = (var_a + var_b) ** 2 / ((var_a ** 2 / (len(a) - 1) if var_a else 0) +
+                                 (var_b ** 2 / (len(b) - 1) if var_b else 0))
+    return t > _t_quantile(df, confidence)
+
+
+def compare_runs(baseline: Dict, current: Dict, threshold: float = 0.05,
+                 confidence: float = 0.95) -> List[Dict]:
+    """
+    Сравнение прогона с базовым по всем общим ячейкам
+
+    Ячейка считается регрессией, если среднее время выросло больше чем
+    на threshold (доля) и различие статистически значимо по критерию Уэлча.
+    Без повторов (один замер) решение принимается только по порогу.
+    """
+    rows = []
+    for data_type, algorithms in current['samples'].items():
+        for algo_name, cells in algorithms.items():
+            base_cells = dict(baseline['samples'].get(data_type, {}).get(algo_name, []))
+            for size, samples in cells:
+                base_samples = base_cells.get(size)
+                if not base_samples or not samples:
+                    continue
+
+                base_mean, base_ci = mean_confidence_interval(base_samples, confidence)
+                new_mean, new_ci = mean_confidence_interval(samples, confidence)
+                change = (new_mean - base_mean) / base_mean if base_mean else 0.0
+                significant = welch_test(base_samples, samples, confidence)
+
+                if abs(change) <= threshold or significant is False:
+                    verdict = 'same'
+                elif change > 0:
+                    verdict = 'regression'
+                else:
+                    verdict = 'improvement'
+
+                rows.append({
+                    'data_type': data_type,
+                    'algorithm': algo_name,
+                    'size': size,
+                    'baseline_mean': base_mean,
+                    'baseline_ci': base_ci,
+                    'mean': new_mean,
+                    'ci': new_ci,
+                    'change': change,
+                    'significant': significant,
+                    'verdict': verdict
+                })
+    return rows
+
+
+def print_comparison(rows: List[Dict], only_changes: bool = False):
+    """Вывод таблицы сравнения"""
+    marks = {'regression': 'РЕГРЕССИЯ', 'improvement': 'улучшение', 'same': ''}
+    print(f"{'Тип данных':<16}{'Алгоритм':<18}{'Размер':>8}{'База, с':>22}"
+          f"{'Сейчас, с':>22}{'Изм.':>9}  Итог")
+    print("-" * 110)
+    for row in rows:
+        if only_changes and row['verdict'] == 'same':
+            continue
+        base = f"{row['baseline_mean']:.5f}±{row['baseline_ci']:.5f}"
+        new = f"{row['mean']:.5f}±{row['ci']:.5f}"
+        print(f"{row['data_type']:<16}{row['algorithm']:<18}{row['size']:>8}{base:>22}"
+              f"{new:>22}{row['change']:>+9.1%}  {marks[row['verdict']]}")
+
+    regressions = sum(row['verdict'] == 'regression' for row in rows)
+    print(f"\nСравнено ячеек: {len(rows)}, регрессий: {regressions}")
+
+
+def main(argv: List[str] = None) -> int:
+    """Командная строка хранилища; compare возвращает 1 при наличии регрессий"""
+    parser = argparse.ArgumentParser(description="Хранилище результатов бенчмарка сортировок")
+    parser.add_argument('--store', default=DEFAULT_STORE_DIR, help="каталог хранилища")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    commands.add_parser('list', help="список сохранённых прогонов")
+
+    baseline_parser = commands.add_parser('set-baseline', help="назначить базовый прогон")
+    baseline_parser.add_argument('run', nargs='?', help="файл прогона (по умолчанию последний)")
+
+    compare_parser = commands.add_parser('compare', help="сравнить прогон с базовым")
+    compare_parser.add_argument('run', nargs='?', help="файл прогона (по умолчанию последний)")
+    compare_parser.add_argument('--baseline', help="файл базового прогона")
+    compare_parser.add_argument('--threshold', type=float, default=0.05,
+                                help="минимальное относительное изменение")
+    compare_parser.add_argument('--confidence', type=float, default=0.95,
+                                choices=sorted(T_QUANTILES))
+    compare_parser.add_argument('--only-changes', action='store_true')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'list':
+        for path in list_runs(args.store):
+            record = load_run(path)
+            meta = record['metadata']
+            print(f"{os.path.basename(path)}  {meta['timestamp']}  "
+                  f"{(meta.get('git_commit') or '-')[:10]}  {record.get('label') or ''}")
+        return 0
+
+    run_path = args.run or latest_run(args.store)
+    if run_path is None:
+        print("В хранилище нет прогонов")
+        return 2
+
+    if args.command == 'set-baseline':
+        print(f"Базовый прогон: {set_baseline(run_path, args.store)} <- {run_path}")
+        return 0
+
+    baseline_path = args.baseline or os.path.join(args.store, BASELINE_FILE)
+    if not os.path.exists(baseline_path):
+        print(f"Базовый прогон не найден: {baseline_path}")
+        return 2
+
+    rows = compare_runs(load_run(baseline_path), load_run(run_path),
+                        args.threshold, args.confidence)
+    print(f"База: {baseline_path}\nПрогон: {run_path}\n")
+    print_comparison(rows, args.only_changes)
+    return 1 if any(row['verdict'] == 'regression' for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -2,12 +2,101 @@
 Реализация основных алгоритмов сортировки с анализом сложности
 """
 
+import bisect
 import time
-from typing import List, Callable
+import functools
+import heapq
+from typing import List, Callable, Any, Optional, Iterable, Tuple
 import random
+import numpy as np
+from probes import SortProbe, NULL_PROBE
 
 
-def bubble_sort(arr: List[int]) -> List[int]:
+def _decorate(arr: List[Any], key: Optional[Callable]) -> List[Any]:
+    """Вычисление ключей сортировки - ровно один вызов key на элемент"""
+    return list(arr) if key is None else [key(x) for x in arr]
+
+
+def _dense_ranks(keys: List[Any]) -> Optional[np.ndarray]:
+    """
+    Плотные ранги числовых ключей (int64) или None для нечисловых ключей
+
+    Тип ключей проверяется до NumPy: списки и кортежи разной длины
+    np.asarray не принимает, такие ключи сортируются как есть.
+    Ранги считаются на NumPy; целые за пределами int64 NumPy молча переводит
+    во float64, где соседние значения сливаются, - такие ключи
+    ранжируются без NumPy.
+    """
+    if not all(isinstance(k, (int, float, np.integer, np.floating)) for k in keys):
+        return None
+    key_array = np.asarray(keys)
+    if key_array.dtype.kind in 'biuf':
+        lossless = key_array.dtype.kind != 'f' or \
+            all(float(k) == k for k in keys if isinstance(k, int))
+        if lossless:
+            return np.unique(key_array, return_inverse=True)[1].astype(np.int64)
+    ranks = {k: rank for rank, k in enumerate(sorted(set(keys)))}
+    return np.array([ranks[k] for k in keys], dtype=np.int64)
+
+
+def _sort_by_keys(sort_func: Callable, arr: List[Any], keys: List[Any],
+                  reverse: bool, *args, **kwargs) -> List[Any]:
+    """
+    Сортировка arr по заранее вычисленным ключам (decorate-sort-undecorate)
+
+    - Числовые ключи: ключи сжимаются в плотные ранги на массиве NumPy,
+      ранг и исходный индекс упаковываются в одно целое rank * n + index,
+      алгоритм сортирует эти целые, а результат раскрывается обратно
+      в перестановку индексов. Сравнения идут между обычными int.
+    - Прочие ключи: сортируются кортежи (key, index).
+
+    Индекс в составе ключа делает результат устойчивым для любого алгоритма,
+    reverse=True сохраняет исходный порядок равных элементов (как sorted).
+    """
+    n = len(arr)
+    if n <= 1:
+        return list(arr)
+
+    ranks = _dense_ranks(keys)
+    if ranks is not None:
+        if reverse:
+            ranks = ranks.max() - ranks
+        packed = ranks * n + np.arange(n, dtype=np.int64)
+        order = np.asarray(sort_func(packed.tolist(), *args, **kwargs), dtype=np.int64) % n
+        return [arr[i] for i in order.tolist()]
+
+    if reverse:
+        # По возрастанию (key, -index) с последующим разворотом:
+        # ключи по убыванию, равные - в исходном порядке
+        decorated = [(k, -i) for i, k in enumerate(keys)]
+        result = sort_func(decorated, *args, **kwargs)
+        result.reverse()
+        return [arr[-i] for _, i in result]
+
+    decorated = [(k, i) for i, k in enumerate(keys)]
+    return [arr[i] for _, i in sort_func(decorated, *args, **kwargs)]
+
+
+def _with_key(sort_func: Callable) -> Callable:
+    """
+    Добавляет алгоритму сортировки параметры key= и reverse=
+    (аналогично sorted). probe= передаётся самой реализации
+    (подсчёт операций, см. probes.py).
+    Без key= и reverse= вызывается исходная реализация как есть.
+    """
+    @functools.wraps(sort_func)
+    def wrapper(arr, *args, key: Optional[Callable] = None, reverse: bool = False,
+                probe: Optional[SortProbe] = None, **kwargs):
+        if key is None and not reverse:
+            return sort_func(arr, *args, probe=probe, **kwargs)
+        return _sort_by_keys(functools.partial(sort_func, probe=probe), arr,
+                             _decorate(arr, key), reverse, *args, **kwargs)
+
+    return wrapper
+
+
+@_with_key
+def bubble_sort(arr: List[int], probe: Optional[SortProbe] = None) -> List[int]:
     """
     Сортировка пузырьком
     Сложность:
@@ -16,21 +105,30 @@ def bubble_sort(arr: List[int]) -> List[int]:
       - Худший случай: O(n²) - обратно отсортированный массив
       - Пространственная: O(1) - сортировка на месте
     """
+    if probe is None:
+        probe = NULL_PROBE
+    probe.enter()
     n = len(arr)
-    arr = arr.copy()
+    arr = probe.allocate(arr.copy())
+    swaps = 0
 
     for i in range(n):
         swapped = False
+        probe.comparisons += n - i - 1
         for j in range(0, n - i - 1):
             if arr[j] > arr[j + 1]:
                 arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                swaps += 1
                 swapped = True
         if not swapped:
             break
+    probe.swaps += swaps
+    probe.exit()
     return arr
 
 
-def selection_sort(arr: List[int]) -> List[int]:
+@_with_key
+def selection_sort(arr: List[int], probe: Optional[SortProbe] = None) -> List[int]:
     """
     Сортировка выбором
     Сложность:
@@ -40,8 +138,11 @@ def selection_sort(arr: List[int]) -> List[int]:
       - Пространственная: O(1) - сортировка на месте
       - Неустойчивая сортировка
     """
+    if probe is None:
+        probe = NULL_PROBE
+    probe.enter()
     n = len(arr)
-    arr = arr.copy()
+    arr = probe.allocate(arr.copy())
 
     for i in range(n):
         min_idx = i
@@ -49,10 +150,14 @@ def selection_sort(arr: List[int]) -> List[int]:
             if arr[j] < arr[min_idx]:
                 min_idx = j
         arr[i], arr[min_idx] = arr[min_idx], arr[i]
+    probe.comparisons += n * (n - 1) // 2
+    probe.swaps += n
+    probe.exit()
     return arr
 
 
-def insertion_sort(arr: List[int]) -> List[int]:
+@_with_key
+def insertion_sort(arr: List[int], probe: Optional[SortProbe] = None) -> List[int]:
     """
     Сортировка вставками
     Сложность:
@@ -63,7 +168,11 @@ def insertion_sort(arr: List[int]) -> List[int]:
       - Устойчивая сортировка
       - Адаптивная - эффективна на почти отсортированных данных
     """
-    arr = arr.copy()
+    if probe is None:
+        probe = NULL_PROBE
+    probe.enter()
+    arr = probe.allocate(arr.copy())
+    shifts = stops = 0
 
     for i in range(1, len(arr)):
         key = arr[i]
@@ -72,10 +181,79 @@ def insertion_sort(arr: List[int]) -> List[int]:
             arr[j + 1] = arr[j]
             j -= 1
         arr[j + 1] = key
+        # Сдвигов i - 1 - j, каждый после сравнения; ещё одно сравнение
+        # остановило цикл, если он не дошёл до начала массива
+        shifts += i - 1 - j
+        stops += j >= 0
+    probe.comparisons += shifts + stops
+    probe.moves += shifts + max(0, len(arr) - 1)
+    probe.exit()
     return arr
 
 
-def merge_sort(arr: List[int]) -> List[int]:
+def _merge(left: List[int], right: List[int]) -> List[int]:
+    """Слияние двух отсортированных списков (равные - сначала из left)"""
+    result = []
+    i = j = 0
+
+    while i < len(left) and j < len(right):
+        if left[i] <= right[j]:
+            result.append(left[i])
+            i += 1
+        else:
+            result.append(right[j])
+            j += 1
+
+    result.extend(left[i:])
+    result.extend(right[j:])
+    return result
+
+
+def _merge_comparisons(left: List[int], right: List[int]) -> int:
+    """
+    Число сравнений в _merge: по одному на элемент, перенесённый в цикле,
+    то есть все элементы, кроме хвоста части, оставшейся после исчерпания
+    другой. Хвост находится двоичным поиском по отсортированным частям.
+    """
+    if not left or not right:
+        return 0
+    if left[-1] <= right[-1]:
+        # Первой исчерпывается left; до этого перенесены элементы right < left[-1]
+        tail = len(right) - bisect.bisect_left(right, left[-1])
+    else:
+        # Первой исчерпывается right; перенесены элементы left <= right[-1]
+        tail = len(left) - bisect.bisect_right(left, right[-1])
+    return len(left) + len(right) - tail
+
+
+def _merge_sort(arr: List[int]) -> List[int]:
+    if len(arr) <= 1:
+        return arr.copy()
+
+    mid = len(arr) // 2
+    return _merge(_merge_sort(arr[:mid]), _merge_sort(arr[mid:]))
+
+
+def _merge_sort_probed(arr: List[int], probe: SortProbe) -> List[int]:
+    """_merge_sort с подсчётом операций в probe"""
+    probe.enter()
+    if len(arr) <= 1:
+        probe.exit()
+        return probe.allocate(arr.copy())
+
+    mid = len(arr) // 2
+    left = _merge_sort_probed(probe.allocate(arr[:mid]), probe)
+    right = _merge_sort_probed(probe.allocate(arr[mid:]), probe)
+
+    result = probe.allocate(_merge(left, right))
+    probe.comparisons += _merge_comparisons(left, right)
+    probe.moves += len(result)
+    probe.exit()
+    return result
+
+
+@_with_key
+def merge_sort(arr: List[int], probe: Optional[SortProbe] = None) -> List[int]:
     """
     Сортировка слиянием
     Сложность:
@@ -84,34 +262,54 @@ def merge_sort(arr: List[int]) -> List[int]:
       - Худший случай: O(n log n)
       - Пространственная: O(n) - требуется дополнительная память
       - Устойчивая сортировка
+
+    Версия со счётчиками выбирается один раз: без probe рекурсия идёт
+    по _merge_sort без обращений к счётчикам.
     """
-    if len(arr) <= 1:
-        return arr.copy()
+    if probe is None:
+        return _merge_sort(arr)
+    return _merge_sort_probed(arr, probe)
 
-    def merge(left: List[int], right: List[int]) -> List[int]:
-        result = []
-        i = j = 0
 
-        while i < len(left) and j < len(right):
-            if left[i] <= right[j]:
-                result.append(left[i])
-                i += 1
-            else:
-                result.append(right[j])
-                j += 1
+def _quick_sort(sub_arr: List[int]) -> List[int]:
+    if len(sub_arr) <= 1:
+        return sub_arr
 
-        result.extend(left[i:])
-        result.extend(right[j:])
-        return result
+    # Выбор опорного элемента (медиана трех)
+    first, middle, last = sub_arr[0], sub_arr[len(sub_arr) // 2], sub_arr[-1]
+    pivot = sorted([first, middle, last])[1]
+
+    left = [x for x in sub_arr if x < pivot]
+    middle = [x for x in sub_arr if x == pivot]
+    right = [x for x in sub_arr if x > pivot]
+
+    return _quick_sort(left) + middle + _quick_sort(right)
 
-    mid = len(arr) // 2
-    left = merge_sort(arr[:mid])
-    right = merge_sort(arr[mid:])
 
-    return merge(left, right)
+def _quick_sort_probed(sub_arr: List[int], probe: SortProbe) -> List[int]:
+    """_quick_sort с подсчётом операций в probe"""
+    if len(sub_arr) <= 1:
+        return sub_arr
 
+    probe.enter()
+    first, middle, last = sub_arr[0], sub_arr[len(sub_arr) // 2], sub_arr[-1]
+    pivot = sorted([first, middle, last])[1]
 
-def quick_sort(arr: List[int]) -> List[int]:
+    left = probe.allocate([x for x in sub_arr if x < pivot])
+    middle = probe.allocate([x for x in sub_arr if x == pivot])
+    right = probe.allocate([x for x in sub_arr if x > pivot])
+    # Три прохода сравнений, каждый элемент переносится в одну из частей
+    probe.comparisons += 3 + 3 * len(sub_arr)
+    probe.moves += len(sub_arr)
+
+    result = probe.allocate(_quick_sort_probed(left, probe) + middle +
+                            _quick_sort_probed(right, probe))
+    probe.exit()
+    return result
+
+
+@_with_key
+def quick_sort(arr: List[int], probe: Optional[SortProbe] = None) -> List[int]:
     """
     Быстрая сортировка (Хоара)
     Сложность:
@@ -120,24 +318,314 @@ def quick_sort(arr: List[int]) -> List[int]:
       - Худший случай: O(n²) - неудачный выбор опорного элемента
       - Пространственная: O(log n) - стек вызовов
       - Неустойчивая сортировка
+
+    Как и в merge_sort, версия со счётчиками выбирается один раз.
     """
+    if probe is None:
+        return _quick_sort(arr.copy())
+    return _quick_sort_probed(probe.allocate(arr.copy()), probe)
+
+
+def _counting_sort_by_keys(items: List[Any], keys: List[int],
+                           probe: Optional[SortProbe] = None) -> List[Any]:
+    """Устойчивая раскладка items по целочисленным ключам keys"""
+    if probe is None:
+        probe = NULL_PROBE
+    probe.enter()
+    if len(items) <= 1:
+        probe.exit()
+        return probe.allocate(list(items))
+
+    min_val, max_val = min(keys), max(keys)
+    probe.comparisons += 2 * (len(keys) - 1)
+    counts = probe.allocate([0] * (max_val - min_val + 1))
+    for k in keys:
+        counts[k - min_val] += 1
+
+    # Префиксные суммы: начальная позиция каждого значения в результате
+    total = 0
+    for i, c in enumerate(counts):
+        counts[i] = total
+        total += c
+
+    # Раскладка в порядке входа сохраняет устойчивость
+    result = probe.allocate([None] * len(items))
+    for x, k in zip(items, keys):
+        pos = k - min_val
+        result[counts[pos]] = x
+        counts[pos] += 1
+    probe.moves += len(items)
+    probe.exit()
+    return result
+
+
+def _integer_keys(keys: List[Any], reverse: bool) -> List[int]:
+    """
+    Целочисленные ключи для сортировки подсчётом: целые остаются как есть,
+    прочие числовые заменяются плотными рангами (NumPy), при reverse - со знаком минус
+    """
+    if not all(isinstance(k, int) for k in keys):
+        ranks = _dense_ranks(keys)
+        if ranks is None:
+            raise TypeError("Сортировка подсчётом требует числовых ключей")
+        keys = ranks.tolist()
+    # Сортировка по -key устойчива и даёт порядок по убыванию key
+    return [-k for k in keys] if reverse else keys
+
+
+def counting_sort(arr: List[int], key: Optional[Callable] = None,
+                  reverse: bool = False, probe: Optional[SortProbe] = None) -> List[int]:
+    """
+    Сортировка подсчётом для целых чисел
+    Сложность:
+      - Все случаи: O(n + k), где k = max - min + 1 - диапазон значений
+      - Пространственная: O(n + k) - массив счётчиков и выходной массив
+      - Устойчивая сортировка
+      - Поддерживает отрицательные числа (сдвиг на минимум)
+      - Эффективна только при небольшом диапазоне значений
+      - key должен возвращать числа (нецелые сводятся к рангам)
+    """
+    if key is None and not reverse:
+        return _counting_sort_by_keys(arr, arr, probe)
+    return _counting_sort_by_keys(arr, _integer_keys(_decorate(arr, key), reverse), probe)
+
+
+@_with_key
+def radix_sort(arr: List[int], digit_bits: int = 8,
+               probe: Optional[SortProbe] = None) -> List[int]:
+    """
+    Поразрядная сортировка LSD (от младших разрядов) для целых чисел
+    Сложность:
+      - Все случаи: O(d * (n + 2^b)), где b = digit_bits - ширина разряда в битах,
+        d = ceil(log2(max - min + 1) / b) - количество проходов
+      - Пространственная: O(n + 2^b)
+      - Устойчивая сортировка (каждый проход - устойчивое распределение по корзинам)
+      - Поддерживает отрицательные числа (сдвиг на минимум)
+    """
+    if digit_bits < 1:
+        raise ValueError("digit_bits должен быть положительным")
+    if probe is None:
+        probe = NULL_PROBE
+    probe.enter()
+    if len(arr) <= 1:
+        probe.exit()
+        return probe.allocate(arr.copy())
+
+    min_val = min(arr)
+    # Сдвиг на минимум делает все ключи неотрицательными и сокращает число разрядов
+    keys = probe.allocate([x - min_val for x in arr])
+    max_key = max(keys)
+    probe.comparisons += 2 * (len(arr) - 1)
+
+    radix = 1 << digit_bits
+    mask = radix - 1
+    shift = 0
+    while max_key >> shift:
+        buckets = probe.allocate([[] for _ in range(radix)])
+        for k in keys:
+            buckets[(k >> shift) & mask].append(k)
+        for bucket in buckets:
+            probe.allocate(bucket)
+        keys = probe.allocate([k for bucket in buckets for k in bucket])
+        # Раскладка по корзинам и сборка обратно
+        probe.moves += 2 * len(keys)
+        shift += digit_bits
+
+    result = probe.allocate([k + min_val for k in keys])
+    probe.moves += len(result)
+    probe.exit()
+    return result
+
+
+# Во сколько раз диапазон значений может превышать размер массива,
+# чтобы сортировка подсчётом оставалась выгоднее поразрядной
+COUNTING_SORT_RANGE_FACTOR = 4
+
+
+def integer_sort(arr: List[int], digit_bits: int = 8, key: Optional[Callable] = None,
+                 reverse: bool = False, probe: Optional[SortProbe] = None) -> List[int]:
+    """
+    Сортировка целых чисел с автоматическим выбором алгоритма
+    по наблюдаемому диапазону значений k = max - min + 1:
+      - k <= COUNTING_SORT_RANGE_FACTOR * n + 2^digit_bits -> counting_sort
+      - иначе -> radix_sort
+    Устойчивая сортировка, линейная по n при ограниченном диапазоне
+    key должен возвращать числа (нецелые сводятся к рангам)
+    """
+    if len(arr) <= 1:
+        return arr.copy()
+
+    if key is None and not reverse:
+        keys = arr
+    else:
+        keys = _integer_keys(_decorate(arr, key), reverse)
+
+    value_range = max(keys) - min(keys) + 1
+    if value_range <= COUNTING_SORT_RANGE_FACTOR * len(arr) + (1 << digit_bits):
+        return _counting_sort_by_keys(arr, keys, probe)
+    if keys is arr:
+        return radix_sort(arr, digit_bits, probe=probe)
+    return _sort_by_keys(radix_sort, arr, keys, False, digit_bits, probe=probe)
+
+
+# ---------------------------------------------------------------------------
+# Частичная сортировка и выбор k-го элемента
+# ---------------------------------------------------------------------------
+
+# Отрезки не длиннее этого порога досортировываются целиком
+_SELECT_CUTOFF = 16
+
+
+def _partition3(a: List[Any], lo: int, hi: int, pivot: Any) -> Tuple[int, int]:
+    """
+    Трёхпутевое разбиение a[lo:hi] на месте (задача голландского флага):
+    a[lo:lt] < pivot, a[lt:gt] == pivot, a[gt:hi] > pivot
+    """
+    lt, i, gt = lo, lo, hi
+    while i < gt:
+        x = a[i]
+        if x < pivot:
+            a[lt], a[i] = x, a[lt]
+            lt += 1
+            i += 1
+        elif pivot < x:
+            gt -= 1
+            a[gt], a[i] = x, a[gt]
+        else:
+            i += 1
+    return lt, gt
+
+
+def _median_of_medians(a: List[Any], lo: int, hi: int) -> Any:
+    """Опорный элемент "медиана медиан" пятёрок: гарантирует разбиение 30/70"""
+    medians = [sorted(a[i:min(i + 5, hi)])[(min(i + 5, hi) - i - 1) // 2]
+               for i in range(lo, hi, 5)]
+    if len(medians) <= _SELECT_CUTOFF:
+        return sorted(medians)[(len(medians) - 1) // 2]
+    mid = (len(medians) - 1) // 2
+    _select(medians, mid, 0, len(medians))
+    return medians[mid]
+
+
+def _select(a: List[Any], k: int, lo: int, hi: int):
+    """
+    Introselect на месте: после вызова a[k] стоит на своей позиции
+    в отсортированном порядке, слева - не большие, справа - не меньшие.
+    Быстрый выбор с медианой трёх, а если отрезок перестаёт сокращаться
+    вдвое за отведённое число шагов - опорный элемент медиана медиан.
+    """
+    budget = 2 * max(1, (hi - lo).bit_length())
+    while hi - lo > _SELECT_CUTOFF:
+        if budget > 0:
+            mid = (lo + hi) // 2
+            pivot = sorted([a[lo], a[mid], a[hi - 1]])[1]
+        else:
+            pivot = _median_of_medians(a, lo, hi)
+
+        size = hi - lo
+        lt, gt = _partition3(a, lo, hi, pivot)
+        if k < lt:
+            hi = lt
+        elif k >= gt:
+            lo = gt
+        else:
+            return
+        if 2 * (hi - lo) > size:
+            budget -= 1
+
+    a[lo:hi] = sorted(a[lo:hi])
+
+
+def nth_element(arr: List[Any], n: int) -> List[Any]:
+    """
+    Выбор n-го по порядку элемента (аналог std::nth_element)
+    Возвращает копию arr, в которой на позиции n стоит элемент,
+    оказавшийся бы там после сортировки; элементы левее не больше него,
+    правее - не меньше. Медиана: nth_element(arr, len(arr) // 2)[len(arr) // 2]
+    Сложность:
+      - Средний случай: O(n) - быстрый выбор
+      - Худший случай: O(n) - переход на медиану медиан
+      - Пространственная: O(n) на копию, O(1) дополнительно
+      - Неустойчивый
+    """
+    if not 0 <= n < len(arr):
+        raise IndexError("n вне границ массива")
     arr = arr.copy()
+    _select(arr, n, 0, len(arr))
+    return arr
 
-    def _quick_sort(sub_arr: List[int]) -> List[int]:
-        if len(sub_arr) <= 1:
-            return sub_arr
 
-        # Выбор опорного элемента (медиана трех)
-        first, middle, last = sub_arr[0], sub_arr[len(sub_arr) // 2], sub_arr[-1]
-        pivot = sorted([first, middle, last])[1]
+def partial_sort(arr: List[Any], k: int) -> List[Any]:
+    """
+    Частичная сортировка (аналог std::partial_sort)
+    Возвращает копию arr, в которой первые k элементов - k наименьших
+    в порядке возрастания, остальные - в произвольном порядке.
+    Сложность:
+      - O(n + k log k) - выбор k-го элемента и сортировка префикса
+      - Пространственная: O(n) на копию
+      - Неустойчивая
+    """
+    arr = arr.copy()
+    k = min(k, len(arr))
+    if k <= 0:
+        return arr
+    if k < len(arr):
+        _select(arr, k - 1, 0, len(arr))
+    arr[:k] = quick_sort(arr[:k])
+    return arr
+
 
-        left = [x for x in sub_arr if x < pivot]
-        middle = [x for x in sub_arr if x == pivot]
-        right = [x for x in sub_arr if x > pivot]
+def _sift_down_max(heap: List[Any], i: int):
+    """Просеивание вниз в max-куче"""
+    n = len(heap)
+    item = heap[i]
+    while True:
+        child = 2 * i + 1
+        if child >= n:
+            break
+        if child + 1 < n and heap[child] < heap[child + 1]:
+            child += 1
+        if not item < heap[child]:
+            break
+        heap[i] = heap[child]
+        i = child
+    heap[i] = item
+
+
+def top_k(iterable: Iterable[Any], k: int, largest: bool = False) -> List[Any]:
+    """
+    k наименьших (largest=True - наибольших) элементов потока
+    в отсортированном порядке (по возрастанию / по убыванию).
+    Ограниченная куча из k элементов: поток читается один раз
+    и не хранится целиком.
+    Сложность:
+      - Время: O(n log k)
+      - Пространственная: O(k)
+    """
+    if k <= 0:
+        return []
 
-        return _quick_sort(left) + middle + _quick_sort(right)
+    heap = []
+    if largest:
+        # min-куча k наибольших: корень - худший из отобранных
+        for x in iterable:
+            if len(heap) < k:
+                heapq.heappush(heap, x)
+            elif heap[0] < x:
+                heapq.heapreplace(heap, x)
+        return quick_sort(heap)[::-1]
 
-    return _quick_sort(arr)
+    # max-куча k наименьших: корень - худший из отобранных
+    for x in iterable:
+        if len(heap) < k:
+            heap.append(x)
+            if len(heap) == k:
+                for i in range(k // 2 - 1, -1, -1):
+                    _sift_down_max(heap, i)
+        elif x < heap[0]:
+            heap[0] = x
+            _sift_down_max(heap, 0)
+    return quick_sort(heap)
 
 
 # Словарь всех алгоритмов для удобного тестирования
@@ -146,5 +634,8 @@ SORTING_ALGORITHMS = {
     'selection_sort': selection_sort,
     'insertion_sort': insertion_sort,
     'merge_sort': merge_sort,
-    'quick_sort': quick_sort
+    'quick_sort': quick_sort,
+    'counting_sort': counting_sort,
+    'radix_sort': radix_sort,
+    'integer_sort': integer_sort
 }
\ No newline at end of file
@@ -2,8 +2,16 @@
 Тестирование корректности реализации алгоритмов сортировки
 """
 
+import functools
+import os
 import random
-from sorts import SORTING_ALGORITHMS
+import tempfile
+from sorts import SORTING_ALGORITHMS, SortProbe, nth_element, partial_sort, top_k, quick_sort
+from external_sort import ExternalSorter, read_int_file, write_int_file
+from generate_data import generate_test_datasets
+from complexity import fit_complexity, complexity_mismatch
+from performance_test import PerformanceTester
+from fuzz_sorts import run_fuzz, shrink
 
 
 def test_sorting_correctness():
@@ -17,6 +25,8 @@ def test_sorting_correctness():
         [5, 4, 3, 2, 1],  # обратно отсортированный
         [3, 1, 4, 1, 5, 9, 2, 6],  # случайный с повторениями
         [5, 5, 5, 5, 5],  # все элементы одинаковые
+        [3, -7, 0, -7, 12, -1, 5],  # отрицательные числа
+        [10 ** 5, -10 ** 5, 0, 1, -1],  # широкий диапазон значений
         [random.randint(0, 100) for _ in range(100)]  # большой случайный
     ]
 
@@ -52,5 +62,278 @@ def test_sorting_correctness():
     print("ТЕСТИРОВАНИЕ ЗАВЕРШЕНО")
 
 
+def test_external_sort():
+    """Внешняя сортировка с несколькими проходами слияния совпадает с sorted"""
+    values = [random.randint(-10 ** 6, 10 ** 6) for _ in range(5000)]
+
+    for file_format in ('binary', 'text'):
+        with tempfile.TemporaryDirectory() as tmp:
+            input_path = os.path.join(tmp, 'input')
+            output_path = os.path.join(tmp, 'output')
+            write_int_file(input_path, values, file_format)
+
+            # Крошечный бюджет памяти: 50 прогонов и три прохода слияния
+            sorter = ExternalSorter(memory_budget=100 * 100, file_format=file_format,
+                                    max_fan_in=4, temp_dir=tmp)
+            stats = sorter.sort_file(input_path, output_path)
+
+            assert read_int_file(output_path, file_format) == sorted(values)
+            assert stats.passes[0]['runs'] == 50
+            assert len(stats.passes) == 4
+            assert stats.passes[-1]['bytes_read'] == len(values) * 8
+
+
+def test_key_and_reverse():
+    """key= и reverse= дают тот же результат, что и устойчивая sorted"""
+    records = [(random.randint(-20, 20), f"item{i}") for i in range(300)]
+    numeric_keys = [lambda r: r[0], lambda r: r[0] / 3]
+
+    for algo_name, algo_func in SORTING_ALGORITHMS.items():
+        for reverse in (False, True):
+            for key in numeric_keys:
+                expected = sorted(records, key=key, reverse=reverse)
+                assert algo_func(records, key=key, reverse=reverse) == expected, algo_name
+
+            values = [r[0] for r in records]
+            assert algo_func(values, reverse=reverse) == sorted(values, reverse=reverse), algo_name
+
+
+def test_key_non_numeric():
+    """Сравнительные сортировки принимают ключи произвольного типа"""
+    words = ["pear", "Apple", "fig", "banana", "apple", "Fig", "kiwi", "date"]
+
+    for algo_name in ('bubble_sort', 'selection_sort', 'insertion_sort',
+                      'merge_sort', 'quick_sort'):
+        algo_func = SORTING_ALGORITHMS[algo_name]
+        for reverse in (False, True):
+            expected = sorted(words, key=str.lower, reverse=reverse)
+            assert algo_func(words, key=str.lower, reverse=reverse) == expected, algo_name
+
+
+def test_key_ragged_sequences():
+    """Ключи-списки и кортежи разной длины сравниваются как в sorted"""
+    ragged_lists = [[1], [1, 2], [0], [1, 0, 5], [], [0, 3]]
+    ragged_tuples = [tuple(k) for k in ragged_lists]
+
+    for algo_name in ('bubble_sort', 'selection_sort', 'insertion_sort',
+                      'merge_sort', 'quick_sort'):
+        algo_func = SORTING_ALGORITHMS[algo_name]
+        for keys in (ragged_lists, ragged_tuples):
+            for reverse in (False, True):
+                expected = sorted(keys, key=lambda r: r, reverse=reverse)
+                assert algo_func(keys, key=lambda r: r, reverse=reverse) == expected, algo_name
+
+
+@functools.total_ordering
+class _Record:
+    """Запись, сравниваемая только по ключу: без индекса для разрешения равенств"""
+
+    def __init__(self, key, tag):
+        self.key = key
+        self.tag = tag
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+
+def _is_stable(algo_func, records) -> bool:
+    """Равные записи после сортировки идут в исходном порядке тегов"""
+    result = algo_func(records)
+    return all(a.tag < b.tag for a, b in zip(result, result[1:]) if a.key == b.key)
+
+
+def test_stability():
+    """Устойчивые сортировки сохраняют исходный порядок равных элементов"""
+    records = [_Record(random.randint(0, 5), i) for i in range(200)]
+
+    for algo_name in ('bubble_sort', 'insertion_sort', 'merge_sort'):
+        assert _is_stable(SORTING_ALGORITHMS[algo_name], records), algo_name
+
+    # Проверка способна упасть: сортировка выбором неустойчива
+    # (минимум 1 меняется местами с первой двойкой и переносит её за вторую)
+    unstable = [_Record(2, 0), _Record(2, 1), _Record(1, 2)]
+    assert not _is_stable(SORTING_ALGORITHMS['selection_sort'], unstable)
+
+
+def test_key_called_once():
+    """Ключ вычисляется ровно один раз на элемент"""
+    calls = [0]
+
+    def key(x):
+        calls[0] += 1
+        return -x
+
+    values = [random.randint(0, 1000) for _ in range(100)]
+    for algo_func in SORTING_ALGORITHMS.values():
+        calls[0] = 0
+        algo_func(values, key=key)
+        assert calls[0] == len(values)
+
+
+def test_selection():
+    """nth_element, partial_sort и top_k согласованы с полной сортировкой"""
+    for _ in range(200):
+        size = random.randint(1, 500)
+        arr = [random.randint(-50, random.choice([5, 1000])) for _ in range(size)]
+        expected = sorted(arr)
+
+        n = random.randrange(size)
+        result = nth_element(arr, n)
+        assert result[n] == expected[n]
+        assert sorted(result) == expected
+        assert max(result[:n + 1]) <= result[n] <= min(result[n:])
+
+        k = random.randint(0, size + 1)
+        assert partial_sort(arr, k)[:k] == expected[:k]
+        assert sorted(partial_sort(arr, k)) == expected
+        assert top_k(iter(arr), k) == expected[:k]
+        assert top_k(iter(arr), k, largest=True) == expected[::-1][:k]
+
+
+def test_probe_counts():
+    """Инструментированные версии сортируют так же и считают операции верно"""
+    arr = [random.randint(-100, 100) for _ in range(300)]
+    for algo_name, algo_func in SORTING_ALGORITHMS.items():
+        probe = SortProbe()
+        assert algo_func(arr, probe=probe) == algo_func(arr), algo_name
+        assert probe.max_depth >= 1 and probe.allocated_bytes > 0, algo_name
+        assert probe.depth == 0, algo_name
+
+    n = 50
+    reversed_arr = list(range(n, 0, -1))
+    probe = SortProbe()
+    SORTING_ALGORITHMS['bubble_sort'](reversed_arr, probe=probe)
+    assert probe.comparisons == probe.swaps == n * (n - 1) // 2
+
+    probe = SortProbe()
+    SORTING_ALGORITHMS['insertion_sort'](list(range(n)), probe=probe)
+    assert probe.comparisons == n - 1
+
+    probe = SortProbe()
+    SORTING_ALGORITHMS['merge_sort'](list(range(64)), probe=probe)
+    assert probe.max_depth == 7
+
+
+def test_probe_hand_counts():
+    """Счётчики на малых входах совпадают с подсчитанными вручную"""
+    expected = {
+        # [3, 1, 2]: проход 1 - два сравнения и два обмена, проход 2 - одно сравнение
+        'bubble_sort': ([3, 1, 2], {'comparisons': 3, 'swaps': 2, 'moves': 0}),
+        # 2 + 1 сравнение, обмен на каждой из трёх позиций (включая обмен с собой)
+        'selection_sort': ([3, 1, 2], {'comparisons': 3, 'swaps': 3, 'moves': 0}),
+        # 1: сдвиг 3 и вставка; 2: сдвиг 3, сравнение с 1, вставка
+        'insertion_sort': ([3, 1, 2], {'comparisons': 3, 'swaps': 0, 'moves': 4}),
+        # слияния [3]+[1] и [2]+[4] - по сравнению и два переноса,
+        # [1, 3]+[2, 4] - три сравнения и четыре переноса
+        'merge_sort': ([3, 1, 2, 4], {'comparisons': 5, 'swaps': 0, 'moves': 8}),
+        # медиана трёх (3 сравнения) и три прохода разбиения по 3 элемента
+        'quick_sort': ([3, 1, 2], {'comparisons': 12, 'swaps': 0, 'moves': 3}),
+        # min и max - по два сравнения, каждый элемент раскладывается один раз
+        'counting_sort': ([3, 1, 2], {'comparisons': 4, 'swaps': 0, 'moves': 3}),
+        # один проход: раскладка и сборка (2 * 3), затем сдвиг обратно на минимум
+        'radix_sort': ([3, 1, 2], {'comparisons': 4, 'swaps': 0, 'moves': 9}),
+    }
+    for algo_name, (arr, counts) in expected.items():
+        probe = SortProbe()
+        assert SORTING_ALGORITHMS[algo_name](arr, probe=probe) == sorted(arr), algo_name
+        assert {name: getattr(probe, name) for name in counts} == counts, algo_name
+
+
+def test_generate_data_reproducible():
+    """Наборы с seed воспроизводимы, кэш возвращает те же данные"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        first = generate_test_datasets([100, 1000], seed=7, cache_dir=cache_dir)
+        cached = generate_test_datasets([1000, 100], seed=7, cache_dir=cache_dir)
+        uncached = generate_test_datasets([1000], seed=7)
+
+    for data_type, sizes_data in first.items():
+        assert sizes_data[100] == cached[data_type][100]
+        assert sizes_data[1000] == cached[data_type][1000] == uncached[data_type][1000]
+    assert sorted(first['almost_sorted'][1000]) == first['sorted'][1000]
+
+
+def test_data_distributions():
+    """Все распределения сортируются корректно, disorder меняет набор"""
+    datasets = generate_test_datasets([1000], seed=3)
+    for data_type, sizes_data in datasets.items():
+        arr = sizes_data[1000]
+        assert len(arr) == 1000, data_type
+        for algo_name, algo_func in SORTING_ALGORITHMS.items():
+            assert algo_func(arr) == sorted(arr), (data_type, algo_name)
+
+    # Вход-убийца медианы из трёх вырождает рекурсию quick_sort
+    killer, random_probe = SortProbe(), SortProbe()
+    quick_sort(datasets['median3_killer'][1000], probe=killer)
+    quick_sort(datasets['random'][1000], probe=random_probe)
+    assert killer.max_depth > 3 * random_probe.max_depth
+
+    few = generate_test_datasets([1000], seed=3, data_types=['few_unique'],
+                                 disorder={'few_unique': 0.01})
+    assert list(few) == ['few_unique']
+    assert len(set(few['few_unique'][1000])) == 10
+
+
+def test_fit_complexity():
+    """Модель сложности восстанавливается по точным синтетическим замерам"""
+    sizes = [1000, 2000, 4000, 8000, 16000]
+    quadratic = fit_complexity(sizes, [3e-8 * n * n for n in sizes])
+    assert quadratic['model'] == 'n^2'
+    assert abs(quadratic['exponent'] - 2) < 1e-6
+    assert abs(quadratic['constant'] - 3e-8) < 1e-12
+    assert fit_complexity(sizes, [2e-7 * n for n in sizes])['model'] == 'n'
+
+    # Прогнозы бюджетного режима в подбор не входят, а по двум замерам
+    # модель не подбирается
+    results = {'random': {'quick_sort': [(n, 2e-7 * n if n <= 4000 else 3e-8 * n * n)
+                                         for n in sizes]}}
+    status = {'random': {'quick_sort': {8000: 'extrapolated', 16000: 'extrapolated'}}}
+    assert PerformanceTester.fit_complexities(results)['random']['quick_sort']['model'] != 'n'
+    assert PerformanceTester.fit_complexities(results, status)['random']['quick_sort']['model'] == 'n'
+    status['random']['quick_sort'][4000] = 'extrapolated'
+    assert PerformanceTester.fit_complexities(results, status) == {'random': {}}
+
+    assert complexity_mismatch('quick_sort', 'n^2')
+    assert not complexity_mismatch('bubble_sort', 'n')
+
+
+def test_fuzz_smoke():
+    """Короткий прогон фаззинга без ошибок; сокращение входа до минимума"""
+    assert run_fuzz(cases=60, max_size=3000, workers=1, verbose=False) == []
+
+    # "Ошибка" проявляется, когда 7 стоит раньше 3
+    def fails(arr):
+        return 7 in arr and 3 in arr and arr.index(7) < arr.index(3)
+
+    assert shrink([5, 7, 1, 9, 9, 3, 2, 8], fails) == [7, 3]
+
+
+def test_fuzz_detects_unstable(monkeypatch):
+    """Неустойчивость самого алгоритма находится без key= и сокращается"""
+    # Под именем устойчивой сортировки - неустойчивая сортировка выбором;
+    # с key= обёртка делает устойчивым любой алгоритм
+    monkeypatch.setitem(SORTING_ALGORITHMS, 'merge_sort', SORTING_ALGORITHMS['selection_sort'])
+    failures = run_fuzz(cases=0, workers=1, algorithms=['merge_sort'], verbose=False)
+
+    assert failures
+    assert {f['error'] for f in failures} == {"неустойчивая сортировка записей без key="}
+    assert all(len(f['reproducer']) == 3 for f in failures)
+
+
 if __name__ == "__main__":
-    test_sorting_correctness()
\ No newline at end of file
+    test_sorting_correctness()
+    test_external_sort()
+    test_key_and_reverse()
+    test_key_non_numeric()
+    test_key_ragged_sequences()
+    test_stability()
+    test_key_called_once()
+    test_selection()
+    test_probe_counts()
+    test_probe_hand_counts()
+    test_generate_data_reproducible()
+    test_data_distributions()
+    test_fit_complexity()
+    test_fuzz_smoke()
\ No newline at end of file
@@ -0,0 +1,47 @@
+"""
+Тестирование инкрементального построения графиков
+"""
+
+import copy
+import os
+import tempfile
+from plot_results import ResultsVisualizer, MANIFEST_FILE
+
+
+def _results():
+    sizes = [100, 200, 400]
+    return {
+        data_type: {
+            'quick_sort': [(n, factor * 1e-6 * n) for n in sizes],
+            'merge_sort': [(n, factor * 2e-6 * n) for n in sizes]
+        }
+        for data_type, factor in (('random', 1.0), ('sorted', 0.5))
+    }
+
+
+def test_render_skips_unchanged():
+    """Повторное построение ничего не пишет; изменение данных перерисовывает только свой график"""
+    results = _results()
+    with tempfile.TemporaryDirectory() as output_dir:
+        first = ResultsVisualizer(results, output_dir=output_dir).render_all()
+        assert sorted(os.path.basename(path) for path in first) == [
+            'comparison_data_types_size_400.png',
+            'time_vs_size_random.png',
+            'time_vs_size_sorted.png'
+        ]
+        assert os.path.exists(os.path.join(output_dir, MANIFEST_FILE))
+        mtimes = {path: os.stat(path).st_mtime_ns for path in first}
+
+        visualizer = ResultsVisualizer(results, output_dir=output_dir)
+        assert visualizer.render_all() == []
+        assert len(visualizer.skipped) == 3
+        assert {path: os.stat(path).st_mtime_ns for path in first} == mtimes
+
+        # Размер 100 не входит в сравнение по типам данных (размер 400)
+        changed = copy.deepcopy(results)
+        changed['sorted']['quick_sort'][0] = (100, 1.0)
+        rendered = ResultsVisualizer(changed, output_dir=output_dir).render_all()
+        assert [os.path.basename(path) for path in rendered] == ['time_vs_size_sorted.png']
+
+        # force перерисовывает всё
+        assert len(ResultsVisualizer(changed, output_dir=output_dir, force=True).render_all()) == 3
\ No newline at end of file
@@ -0,0 +1,31 @@
+"""
+Тестирование профилирования ячеек бенчмарка
+"""
+
+import pstats
+import re
+import tempfile
+from profiling import profile_cell
+
+FRAME = re.compile(r'^\S+ \([^():]+:\d+\)$')
+
+
+def test_profile_cell_outputs():
+    """Свёрнутые стеки корректны по формату и содержат кадр сортировки"""
+    arr = list(range(1500, 0, -1))
+    with tempfile.TemporaryDirectory() as output_dir:
+        written = profile_cell('insertion_sort', arr, 'reversed', len(arr), output_dir,
+                               profilers=['sampling', 'cprofile'], min_time=0.3)
+
+        with open(written['sampling'], encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        assert lines
+        for line in lines:
+            stack, count = line.rsplit(' ', 1)
+            assert int(count) > 0
+            assert all(FRAME.match(frame) for frame in stack.split(';')), line
+        assert any(frame.startswith('insertion_sort (sorts.py:')
+                   for line in lines for frame in line.rsplit(' ', 1)[0].split(';'))
+
+        stats = pstats.Stats(written['cprofile'])
+        assert any(name == 'insertion_sort' for _, _, name in stats.stats)
\ No newline at end of file
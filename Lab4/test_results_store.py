@@ -0,0 +1,58 @@
+"""
+Тестирование хранилища результатов и поиска регрессий
+"""
+
+import tempfile
+from performance_test import PerformanceTester
+from results_store import save_run, load_run, compare_runs, latest_run, mean_confidence_interval
+
+
+def test_save_and_load_roundtrip():
+    """Сохранённый прогон загружается в той же структуре, что и results"""
+    tester = PerformanceTester()
+    tester.run_performance_tests(sizes=[50, 100], count_operations=True)
+
+    with tempfile.TemporaryDirectory() as store:
+        path = save_run(tester, store, label='test')
+        assert latest_run(store) == path
+
+        record = load_run(path)
+        assert record['results'] == tester.results
+        assert record['samples'] == tester.samples
+        assert record['operation_counts'] == tester.operation_counts
+        assert record['metadata']['sizes'] == [50, 100]
+
+
+def test_memory_profile_roundtrip():
+    """Пиковая память замеряется по ячейкам и сохраняется вместе с прогоном"""
+    tester = PerformanceTester(data_types=['random'])
+    tester.run_memory_tests(sizes=[200, 2000])
+
+    peaks = {algo: dict(cells) for algo, cells in tester.memory_results['random'].items()}
+    # Копия входа есть у всех, merge_sort и quick_sort выделяют заметно больше
+    assert all(peak[2000] > 0 for peak in peaks.values())
+    assert peaks['merge_sort'][2000] > peaks['insertion_sort'][2000]
+    assert dict(tester.allocation_counts['random']['insertion_sort'])[2000] == 1
+
+    with tempfile.TemporaryDirectory() as store:
+        record = load_run(save_run(tester, store))
+        assert record['memory'] == tester.memory_results
+        assert record['allocation_counts'] == tester.allocation_counts
+
+
+def test_compare_detects_regression():
+    """Значимое замедление помечается как регрессия, шум - нет"""
+    baseline = {'samples': {'random': {
+        'quick_sort': [(1000, [0.010, 0.0101, 0.0099, 0.0100])],
+        'merge_sort': [(1000, [0.020, 0.0202, 0.0198, 0.0200])],
+    }}}
+    current = {'samples': {'random': {
+        'quick_sort': [(1000, [0.015, 0.0151, 0.0149, 0.0150])],
+        'merge_sort': [(1000, [0.0201, 0.0199, 0.0200, 0.0202])],
+    }}}
+
+    verdicts = {row['algorithm']: row['verdict'] for row in compare_runs(baseline, current)}
+    assert verdicts == {'quick_sort': 'regression', 'merge_sort': 'same'}
+
+    mean, half_width = mean_confidence_interval([1.0, 2.0, 3.0])
+    assert mean == 2.0 and 2.4 < half_width < 2.5
\ No newline at end of file